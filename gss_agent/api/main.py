@@ -9,6 +9,9 @@ import os
 from langchain_core.messages import HumanMessage
 from langgraph.types import Command
 from gss_agent.core.agents import supervisor_agent
+from gss_agent.core.executor import run_blocking, tool_executor
+from gss_agent.data.snapshot import DATA_BACKEND, get_snapshot
+from gss_agent.data.watcher import SnapshotWatcher
 
 # Configure Logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +28,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Hot reload of gss_agent/data/*.json (JSON backend only); set NEXUS_DATA_RELOAD_INTERVAL=0 to disable
+DATA_RELOAD_INTERVAL = float(os.getenv("NEXUS_DATA_RELOAD_INTERVAL", "5"))
+data_watcher = None
+
+# Tail gss_agent/data/interactions_intake.jsonl into the interaction index (gss_agent/rag/streaming.py)
+STREAM_INGEST = os.getenv("NEXUS_STREAM_INGEST", "0") == "1"
+stream_ingestor = None
+
+@app.on_event("startup")
+async def start_data_watcher():
+    global data_watcher, stream_ingestor
+    if DATA_RELOAD_INTERVAL > 0 and DATA_BACKEND == "json":
+        data_watcher = SnapshotWatcher(interval=DATA_RELOAD_INTERVAL).start()
+    if STREAM_INGEST:
+        from gss_agent.core.tools import VECTOR_SNAPSHOT, v_store
+        if VECTOR_SNAPSHOT:
+            # A snapshot directory is shared read-only between workers; never write batches into it
+            logger.error("NEXUS_STREAM_INGEST is ignored while serving NEXUS_VECTOR_SNAPSHOT (read-only index).")
+        else:
+            from gss_agent.rag.streaming import StreamingIngestor
+            stream_ingestor = StreamingIngestor(v_store).start()
+
+@app.on_event("shutdown")
+async def stop_data_watcher():
+    if data_watcher:
+        data_watcher.stop()
+    if stream_ingestor:
+        stream_ingestor.stop()
+    if tool_executor.is_loaded:
+        tool_executor.shutdown(wait=False)
+
 class ChatRequest(BaseModel):
     message: str
     client_id: str = "default_user"
@@ -168,6 +202,33 @@ async def executive_chat_endpoint(request: ChatRequest):
 async def health_check():
     return {"status": "active", "system": "Nexus Strategic Advisor V2"}
 
+@app.get("/api/data/stats")
+async def data_stats():
+    """Per-dataset record counts and memory accounting for the shared data snapshot."""
+    snapshot = get_snapshot()
+    return {
+        "version": snapshot.version,
+        "loaded_at": snapshot.loaded_at,
+        "reloads": data_watcher.reloads if data_watcher else 0,
+        "last_reload_error": data_watcher.last_error if data_watcher else None,
+        # Walking every record is slow on a large snapshot; keep it off the event loop
+        "memory": await run_blocking(snapshot.memory_report),
+    }
+
+@app.get("/api/search/stats")
+async def search_stats():
+    """Hit rates of the vector store's query-embedding and result caches."""
+    from gss_agent.core.tools import v_store
+    if not v_store.is_loaded:
+        return {"loaded": False}
+    return {"loaded": True, **v_store.cache_stats()}
+
+@app.get("/api/ingest/stats")
+async def ingest_stats():
+    """Lag, backlog and throughput of the streaming interaction ingestor."""
+    if stream_ingestor is None:
+        return {"enabled": False}
+    return {"enabled": True, **stream_ingestor.stats()}
 
 async def mock_golden_generator():
     """Streams the captured golden trace for deterministic UI testing."""
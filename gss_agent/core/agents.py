@@ -49,6 +49,7 @@ content_match_agent = create_deep_agent(
 Objective: Find the most impactful Nexus Advisory research to drive value for the client.
 Instructions:
 - Use 'search_research_library' with specific keywords derived from the client's industry or current pain points.
+- When covering several pain points, use 'batch_search_research_library' with one query per pain point instead of separate searches.
 - Prioritize 2024/2025 Magic Quadrants and Hype Cycles.
 - For each piece of research, provide a 'Talking Point' tailored to their main contact role (CIO, CSO, etc.).
 - Explicitly state 'Why this matters' in the context of their specific business goals."""
@@ -113,13 +114,17 @@ Constraint: Avoid redundancy. If information is already in the 'ClientIntel' rep
 ).with_config({"recursion_limit": RECURSION_LIMIT})
 
 # --- Executive Mode Support ---
-from gss_agent.core.executive_tools import EXECUTIVE_TOOLS, get_all_associates_performance, get_at_risk_clients_summary, get_revenue_snapshot
+from gss_agent.core.executive_tools import EXECUTIVE_TOOLS, get_all_associates_performance, get_at_risk_clients_summary, get_revenue_snapshot, get_portfolio_breakdown, get_portfolio_engagement_trends, rank_clients_by_churn_risk, get_upcoming_renewals
 
 # Create Executive Tools List (Frontline + Executive specific)
 ALL_EXECUTIVE_TOOLS = GSS_TOOLS + [
     get_all_associates_performance,
     get_at_risk_clients_summary,
-    get_revenue_snapshot
+    get_revenue_snapshot,
+    get_portfolio_breakdown,
+    get_portfolio_engagement_trends,
+    rank_clients_by_churn_risk,
+    get_upcoming_renewals
 ]
 
 executive_advisor_agent = create_deep_agent(
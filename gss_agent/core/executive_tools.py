@@ -1,52 +1,31 @@
-
 from langchain_core.tools import tool
 import json
-import logging
+from datetime import date, timedelta
 from typing import List, Dict, Any, Optional
+import numpy as np
 
-# Load data with absolute paths to ensure robustness
-import os
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, "data")
-
-try:
-    with open(os.path.join(DATA_DIR, "associates.json"), "r") as f:
-        ASSOCIATES_DB = json.load(f)
-    # Handle metrics file which might be large or absent
-    metrics_path = os.path.join(DATA_DIR, "client_metrics_timeseries.json")
-    if os.path.exists(metrics_path):
-        with open(metrics_path, "r") as f:
-            METRICS_DB = json.load(f)
-    else:
-        METRICS_DB = {}
-        logging.warning("client_metrics_timeseries.json not found, using empty metrics.")
-
-    with open(os.path.join(DATA_DIR, "clients.json"), "r") as f:
-        CLIENTS_DB = json.load(f)
-        
-    logging.info(f"Executive Tools Loaded: {len(CLIENTS_DB)} clients, {len(ASSOCIATES_DB)} associates.")
-    
-except Exception as e:
-    logging.error(f"Failed to load data for executive tools: {e}")
-    ASSOCIATES_DB = []
-    METRICS_DB = {}
-    CLIENTS_DB = []
+from gss_agent.core.executor import with_async
+from gss_agent.data.snapshot import get_snapshot
 
 @tool
 def get_all_associates_performance() -> str:
     """
-    Returns a high-level summary of performance metrics for all frontline associates.
+    Returns a high-level summary of performance metrics for all frontline associates,
+    including how many clients, how much estimated ARR and how many at-risk accounts each manages.
     Useful for: "Who are my top performers?", "How is the team doing?"
     """
+    snapshot = get_snapshot()
+    rollups = snapshot.aggregates.by_associate
     summary = []
-    for assoc in ASSOCIATES_DB:
-        # Calculate some aggregate metrics if not present
-        # For now, just return what's in the DB
+    for assoc in snapshot.associates:
+        book = rollups.get(assoc.get("id"), {})
         summary.append({
             "name": assoc.get("name"),
             "role": assoc.get("role"),
             "focus_area": assoc.get("focus_area"),
-            "client_count": len(assoc.get("assigned_clients", [])),
+            "client_count": book.get("client_count", 0),
+            "estimated_arr": book.get("estimated_arr", 0),
+            "at_risk_clients": book.get("at_risk_count", 0),
             # In a real system, we'd pull live performance stats here
             "status": "Active" 
         })
@@ -58,22 +37,8 @@ def get_at_risk_clients_summary() -> str:
     Identifies all clients across the entire portfolio that are showing signs of churn risk.
     Useful for: "Which clients are at risk?", "Show me the red accounts."
     """
-    at_risk = []
-    
-    # Simple heuristic: Check latest metrics for "churn_probability" or "health_score"
-    # Or rely on the static "lifecycle_stage" or "churn_risk" field in clients.json
-    
-    for client in CLIENTS_DB:
-        risk_level = client.get("churn_risk", "Low")
-        if risk_level in ["High", "Medium", "Critical"]:
-             at_risk.append({
-                 "client_name": client.get("name"),
-                 "industry": client.get("industry"),
-                 "revenue": client.get("revenue"),
-                 "risk_level": risk_level,
-                 "assigned_associate": client.get("assigned_associate")
-             })
-             
+    # Relies on the static "churn_risk" field in clients.json, pre-bucketed per snapshot
+    at_risk = get_snapshot().aggregates.at_risk_clients()
     if not at_risk:
         return "No high-risk clients identified in the current portfolio."
         
@@ -85,32 +50,135 @@ def get_revenue_snapshot() -> str:
     Returns a financial snapshot of the portfolio (Total ARR, Growth, etc.).
     Useful for: "What is our total ARR?", "Financial health overview."
     """
-    total_arr = 0
-    clients_count = len(CLIENTS_DB)
-    high_value_clients = 0
-    
-    for client in CLIENTS_DB:
-        # Heuristic: Estimate ARR based on subscriptions if not explicit
-        # For now, let's mock a calculation or look for an 'arr' field
-        # Assuming we don't have explicit ARR in clients.json, we'll estimate
-        # $50k per subscription
-        subs = len(client.get("subscriptions", []))
-        estimated_val = subs * 50000
-        total_arr += estimated_val
-        
-        if estimated_val > 100000:
-            high_value_clients += 1
-            
-    snapshot = {
-        "total_estimated_arr": f"${total_arr:,.0f}",
-        "total_clients": clients_count,
-        "high_value_accounts": high_value_clients,
-        "average_deal_size": f"${(total_arr/clients_count if clients_count else 0):,.0f}"
-    }
-    return json.dumps(snapshot, indent=2)
+    # ARR is estimated from subscriptions (see gss_agent/data/aggregates.py)
+    return json.dumps(get_snapshot().aggregates.revenue_snapshot(), indent=2)
+
+@tool
+def get_portfolio_breakdown(dimension: str = "region") -> str:
+    """
+    Breaks the portfolio down by 'region', 'industry' or 'associate': client count,
+    estimated ARR and number of at-risk clients per group.
+    Useful for: "Where is our revenue concentrated?", "Which industries carry the most risk?"
+    """
+    try:
+        breakdown = get_snapshot().aggregates.breakdown(dimension.lower().strip())
+    except ValueError as e:
+        return str(e)
+    return json.dumps(breakdown, indent=2)
+
+@tool
+def get_portfolio_engagement_trends(window_months: int = 3) -> str:
+    """
+    Portfolio-wide engagement trends computed across every client's metrics timeseries:
+    average of each metric in the latest month, its month-over-month change, how many
+    clients declined MoM, and the clients with the steepest login decline over the window.
+    Useful for: "Is engagement dropping across the board?", "Where is usage declining?"
+    """
+    snapshot = get_snapshot()
+    store = snapshot.metrics_store
+    if not len(store) or len(store.months) < 2:
+        return "Not enough metrics history to compute portfolio trends."
+
+    window = max(2, min(window_months, len(store.months)))
+    names = {c.get("id"): c.get("name") for c in snapshot.clients}
+
+    metrics = {}
+    for metric in store.metric_names:
+        data = store.column(metric)
+        deltas = store.mom_delta(metric)[:, -1]
+        with np.errstate(invalid="ignore"):
+            metrics[metric] = {
+                "portfolio_avg_latest": round(float(np.nanmean(data[:, -1])), 2),
+                "portfolio_avg_mom_change": round(float(np.nanmean(data[:, -1]) - np.nanmean(data[:, -2])), 2),
+                "clients_declining_mom": int(np.sum(deltas < 0)),
+            }
+
+    # Change in trailing-window average logins between the last two windows
+    logins = store.rolling_mean("login_frequency", window)
+    if logins.shape[1] > window:
+        change = logins[:, -1] - logins[:, -1 - window]
+    else:
+        change = store.column("login_frequency")[:, -1] - store.column("login_frequency")[:, 0]
+    order = [i for i in np.argsort(change) if not np.isnan(change[i]) and change[i] < 0][:5]
+    decliners = [
+        {
+            "client_id": store.client_ids[i],
+            "client_name": names.get(store.client_ids[i]),
+            "login_frequency_change": round(float(change[i]), 2),
+        }
+        for i in order
+    ]
+
+    return json.dumps({
+        "months": [store.months[0], store.months[-1]],
+        "clients_tracked": len(store),
+        "metrics": metrics,
+        "steepest_login_decliners": decliners,
+    }, indent=2)
+
+@tool
+def rank_clients_by_churn_risk(top_n: int = 10) -> str:
+    """
+    Ranks the whole portfolio by a data-driven churn-risk score (0-100) computed from every
+    client's engagement timeseries: login decline, NPS regression, unused analyst inquiries
+    and days since last engagement. Returns the top N clients with their signal breakdown.
+    Prefer this over pulling metrics client by client.
+    Useful for: "Which accounts are most likely to churn?", "Rank clients by risk."
+    """
+    snapshot = get_snapshot()
+    scores = snapshot.risk_scores()
+    if not len(scores):
+        return "No metrics available to score churn risk."
+
+    ranked = scores.ranked(top_n=max(1, top_n))
+    for entry in ranked:
+        client = snapshot.get_client_by_id(entry["client_id"]) or {}
+        entry["client_name"] = client.get("name")
+        # Static label from clients.json, for comparison with the data-driven score
+        entry["recorded_churn_risk"] = client.get("churn_risk")
+    return json.dumps(ranked, indent=2)
+
+@tool
+def get_upcoming_renewals(days: int = 90) -> str:
+    """
+    Lists the contracts ending within the next `days` days, soonest first, with the client,
+    contract value, service level and renewal likelihood.
+    Useful for: "Which renewals are coming up this quarter?", "What ARR is up for renewal?"
+    """
+    snapshot = get_snapshot()
+    start = date.today()
+    # Range query on end_date (indexed in the SQLite backend)
+    end = start + timedelta(days=max(days, 0))
+    ending = snapshot.contracts_ending_between(start.isoformat(), end.isoformat())
+    if not ending:
+        return f"No contracts end in the next {days} days."
+
+    renewals = []
+    for contract in ending:
+        client = snapshot.get_client_by_id(contract.get("client_id")) or {}
+        renewals.append({
+            "client_name": client.get("name"),
+            "client_id": contract.get("client_id"),
+            "end_date": contract.get("end_date"),
+            "total_value": contract.get("total_value"),
+            "service_level": contract.get("service_level"),
+            "renewal_likelihood": contract.get("renewal_likelihood"),
+        })
+    return json.dumps({
+        "contracts": len(renewals),
+        "total_value": sum(r["total_value"] or 0 for r in renewals),
+        "renewals": renewals,
+    }, indent=2)
 
 EXECUTIVE_TOOLS = [
     get_all_associates_performance,
     get_at_risk_clients_summary,
-    get_revenue_snapshot
+    get_revenue_snapshot,
+    get_portfolio_breakdown,
+    get_portfolio_engagement_trends,
+    rank_clients_by_churn_risk,
+    get_upcoming_renewals
 ]
+
+for _tool in EXECUTIVE_TOOLS:
+    with_async(_tool)
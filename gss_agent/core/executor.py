@@ -0,0 +1,52 @@
+"""
+Bounded thread pool for blocking tool work under the asyncio event loop.
+
+The API streams every chat through `agent.astream`. The tools are plain
+functions: Chroma queries, query embedding, JSON dumps of the snapshot and
+Python REPL runs all block. Run inline on the loop, one slow tool stalls every
+other SSE stream. Without a coroutine, LangChain sends sync tools to the
+loop's default executor, which is shared with everything else and sized by
+CPU count. run_blocking() sends the work to one dedicated pool of
+NEXUS_TOOL_WORKERS threads. Concurrent chats then queue for a worker instead
+of piling threads onto Chroma and the embedding model, and the loop stays free
+to stream.
+
+with_async() gives a LangChain tool a native coroutine that does this, so
+`ainvoke` (what the agent graph calls under astream) never runs the tool body
+on the loop.
+"""
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from gss_agent.core.lazy import LazyObject
+
+TOOL_WORKERS = int(os.getenv("NEXUS_TOOL_WORKERS", "8"))
+
+tool_executor = LazyObject(
+    lambda: ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="nexus-tool"),
+    name="ToolExecutor")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Awaits func(*args, **kwargs) run on the bounded tool executor, in a copy
+    of the caller's context. run_in_executor doesn't carry contextvars over,
+    so LangChain's callbacks and run config would otherwise be lost.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(tool_executor, functools.partial(context.run, func, *args, **kwargs))
+
+
+def with_async(tool):
+    """Sets the coroutine of a sync LangChain tool to run its function on the tool executor."""
+    func = tool.func
+
+    async def coroutine(*args, **kwargs):
+        return await run_blocking(func, *args, **kwargs)
+
+    tool.coroutine = coroutine
+    return tool
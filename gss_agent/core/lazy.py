@@ -0,0 +1,41 @@
+"""
+Deferred construction of heavyweight module-level singletons.
+
+Importing `core/tools.py` used to open the Chroma client, load the embedding
+model and build the Python REPL before any tool was called, which every
+importer (API, UI, scripts, tests) paid for. LazyObject keeps the module
+attribute in place but runs the factory only on first attribute access.
+"""
+import threading
+
+
+class LazyObject:
+    def __init__(self, factory, name=None):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_name", name or getattr(factory, "__name__", "object"))
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self):
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    @property
+    def is_loaded(self):
+        return self._instance is not None
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyObject {self._name} ({state})>"
@@ -1,8 +1,15 @@
 import json
 import os
+from datetime import date, timedelta
+from typing import List, Optional
 from langchain.tools import tool
 from gss_agent.rag.vector_store import NexusVectorStore
-from langchain_experimental.utilities import PythonREPL
+from gss_agent.data.records import as_dict
+from gss_agent.data.resolver import ClientNameResolver
+from gss_agent.data.snapshot import get_snapshot, load_snapshot
+from gss_agent.core.executor import with_async
+from gss_agent.core.lazy import LazyObject
+from gss_agent.rag.mmr import parse_lambda
 
 # Initialize Vector Store
 # Use absolute paths for robustness
@@ -10,68 +17,157 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 CHROMA_DIR = os.path.join(os.path.dirname(BASE_DIR), "chroma_db")
 
-v_store = NexusVectorStore(persist_directory=CHROMA_DIR)
-python_repl_utility = PythonREPL()
+def _create_python_repl():
+    from langchain_experimental.utilities import PythonREPL
+    return PythonREPL()
+
+# Prebuilt index exported with scripts/vector_snapshot.py; served read-only instead of CHROMA_DIR
+VECTOR_SNAPSHOT = os.getenv("NEXUS_VECTOR_SNAPSHOT")
+
+def _create_vector_store():
+    if VECTOR_SNAPSHOT:
+        from gss_agent.rag.index_snapshot import open_snapshot
+        return open_snapshot(VECTOR_SNAPSHOT)
+    return NexusVectorStore(persist_directory=CHROMA_DIR)
+
+# Built on first use, so importing the tools doesn't open Chroma or load the embedding model
+v_store = LazyObject(_create_vector_store, name="NexusVectorStore")
+python_repl_utility = LazyObject(_create_python_repl, name="PythonREPL")
+
+# "hybrid" fuses BM25 and vector rankings (gss_agent/rag/hybrid.py); "vector" is embedding search only
+RETRIEVAL_MODE = os.getenv("NEXUS_RETRIEVAL_MODE", "hybrid")
+
+def _create_retriever():
+    if RETRIEVAL_MODE == "vector":
+        return v_store
+    from gss_agent.rag.hybrid import HybridRetriever
+    return HybridRetriever(v_store)
+
+retriever = LazyObject(_create_retriever, name="Retriever")
+
+# MMR trade-off for research results (1 = pure relevance, lower = more varied reports; "off" disables)
+RESEARCH_MMR_LAMBDA = parse_lambda(os.getenv("NEXUS_MMR_LAMBDA", "0.7"))
 
 class NexusDataReader:
-    def __init__(self, data_dir=DATA_DIR):
-        self.data_dir = data_dir
-        self.clients = self.load_robust("clients.json")
-        self.metrics = self.load_robust("client_metrics_timeseries.json")
-        self.associates = self.load_robust("associates.json")
-        self.performance = self.load_robust("associate_performance.json")
-        self.contracts = self.load_robust("contracts.json")
-
-    def load_robust(self, filename):
-        path = os.path.join(self.data_dir, filename)
-        if os.path.exists(path):
-            try:
-                with open(path, "r") as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading {filename}: {e}")
-                return []
-        return []
+    """
+    Query helpers over a DataSnapshot (or SqliteDataStore). By default it reads the
+    process-wide snapshot shared with the executive tools, so the data is parsed only once.
+    """
+    def __init__(self, data_dir=None, snapshot=None):
+        if snapshot is None and data_dir is not None and data_dir != DATA_DIR:
+            snapshot = load_snapshot(data_dir)
+        self._snapshot = snapshot
+
+    @property
+    def snapshot(self):
+        return self._snapshot if self._snapshot is not None else get_snapshot()
+
+    def pinned(self):
+        """
+        A reader bound to the current snapshot. Tools use one per call so a
+        hot reload mid-call cannot mix data from two snapshots.
+        """
+        return NexusDataReader(snapshot=self.snapshot)
+
+    @property
+    def clients(self):
+        return self.snapshot.clients
+
+    @property
+    def metrics(self):
+        return self.snapshot.metrics
+
+    @property
+    def associates(self):
+        return self.snapshot.associates
+
+    @property
+    def performance(self):
+        return self.snapshot.performance
+
+    @property
+    def contracts(self):
+        return self.snapshot.contracts
+
+    @property
+    def metrics_store(self):
+        return self.snapshot.metrics_store
 
     def get_client(self, name):
-        if not name: return None
-        for c in self.clients:
-            if name.lower() in c.get("name", "").lower():
-                return c
-        return None
+        return self.snapshot.get_client(name)
+
+    def resolve_client(self, name, limit=5):
+        return self.snapshot.resolve_client(name, limit=limit)
     
     def get_all_clients_summary(self):
         """Returns a list of dicts with basic info for all clients."""
-        return [
-            {"name": c.get("name"), "id": c.get("id"), "industry": c.get("industry")} 
-            for c in self.clients
-        ]
+        return self.snapshot.client_summaries()
 
     def get_metrics(self, client_id):
-        # Metrics might be a dict (by client_id) or list
-        if isinstance(self.metrics, dict):
-            return self.metrics.get(client_id, [])
-        return [m for m in self.metrics if m.get("client_id") == client_id]
+        return self.snapshot.get_metrics(client_id)
+
+    def get_metric_changes(self, client_id):
+        return self.snapshot.get_metric_changes(client_id)
 
     def get_contract(self, client_id):
-        for con in self.contracts:
-            if con.get("client_id") == client_id:
-                return con
-        return None
+        return self.snapshot.get_contract(client_id)
 
     def get_associate_info(self, client_id):
-        client = next((c for c in self.clients if c.get("id") == client_id), None)
-        if not client: return None
-        
-        assoc_name = client.get("assigned_associate")
-        assoc = next((a for a in self.associates if a.get("name") == assoc_name), None)
-        if not assoc: return None
-        
-        perf = next((p for p in self.performance if p.get("associate_id") == assoc.get("id")), None)
-        return {"profile": assoc, "performance": perf}
+        return self.snapshot.get_associate_info(client_id)
 
 data_reader = NexusDataReader()
 
+def _candidate_list(matches):
+    candidates = [{"name": m.client.get("name"), "id": m.client.get("id"), "score": m.score} for m in matches]
+    return json.dumps(candidates, indent=2)
+
+def _resolve_client(client_name, reader):
+    """(client, message, matches); see resolve_client_name."""
+    matches = reader.resolve_client(client_name)
+    if not matches:
+        return None, f"Client '{client_name}' not found.", matches
+    top = ClientNameResolver.confident_match(matches, client_name)
+    if top is not None:
+        if top.score >= 1.0:
+            return top.client, None, matches
+        note = f"Matched '{top.client.get('name')}' ({top.client.get('id')}) for '{client_name}'."
+        return top.client, note, matches
+    if ClientNameResolver.is_ambiguous(matches):
+        return None, (
+            f"Client name '{client_name}' is ambiguous. Re-run with the exact name or client id. "
+            f"Candidates:\n{_candidate_list(matches)}"
+        ), matches
+    return None, (
+        f"No client named '{client_name}'. Re-run with the exact name or client id if it is one of "
+        f"these candidates:\n{_candidate_list(matches)}"
+    ), matches
+
+def resolve_client_name(client_name, reader=data_reader):
+    """
+    Resolves a client name (or id) to a single client and returns (client, message):
+    (client, None) on an exact name or id match, (client, note) on a partial or confident
+    fuzzy match (see ClientNameResolver.confident_match), where the note names the
+    matched client and should prefix the tool output,
+    and (None, message) otherwise, the message listing the candidates (if any) so the
+    agent can retry with the exact name or id.
+    """
+    client, message, _ = _resolve_client(client_name, reader)
+    return client, message
+
+def with_match_note(note, output):
+    return f"{note}\n\n{output}" if note else output
+
+def resolve_client_scope(client_name, reader):
+    """
+    (client_id, error) for scoping a search: a name that matches no client at all
+    leaves the search unscoped, an ambiguous or weak one returns the candidates,
+    since scoping to the wrong client is worse than asking.
+    """
+    client, message, matches = _resolve_client(client_name, reader)
+    if client:
+        return client["id"], None
+    return None, (message if matches else None)
+
 @tool
 def list_all_clients() -> str:
     """
@@ -89,48 +185,107 @@ def lookup_client_file(client_name: str) -> str:
     Look up a client's profile, including their industry, revenue, subscription tier, 
     entitlements, and retention risk / churn signals.
     """
-    client = data_reader.get_client(client_name)
-    if client:
-        return json.dumps(client, indent=2)
-    return f"Client '{client_name}' not found."
+    client, message = resolve_client_name(client_name)
+    if client is None: return message
+    return with_match_note(message, json.dumps(as_dict(client), indent=2))
 
 @tool
-def search_research_library(query: str) -> str:
+def search_research_library(query: str, tags: Optional[List[str]] = None, published_year: Optional[int] = None) -> str:
     """
     Search the Nexus Advisory research library for relevant reports, 
     and Hype Cycles related to a specific topic or technology.
+    Optionally restrict to reports carrying all of `tags` (e.g. ["GenAI"]; available tags:
+    CRM, Cloud, GenAI, Sales Ops, Data, Security, Strategy) and/or published in `published_year`.
     """
-    results = v_store.search_research(query, n_results=3)
+    filters = {"tags": tags}
+    if published_year:
+        filters.update(published_after=f"{published_year}-01-01", published_before=f"{published_year}-12-31")
+    results = retriever.search_research(query, n_results=3, mmr_lambda=RESEARCH_MMR_LAMBDA, **filters)
     docs = results.get("documents", [[]])[0]
     return "\n\n---\n\n".join(docs) if docs else "No relevant research found."
 
 @tool
-def search_interaction_history(query: str, client_name: str = None) -> str:
+def search_interaction_history(query: str, client_name: str = None, sentiment: Optional[str] = None,
+                               interaction_type: Optional[str] = None, days: Optional[int] = None) -> str:
     """
     Search past meeting notes, emails, and support tickets for a specific client 
     or topic to understand context and history.
+    Optional filters: sentiment ("Positive", "Neutral", "Negative" or "Mixed"), interaction_type
+    (e.g. "Meeting Note", "Support Ticket", "Email") and days (only the last N days).
     """
     client_id = None
     if client_name:
-        client = data_reader.get_client(client_name)
-        if client:
-            client_id = client["id"]
+        client_id, error = resolve_client_scope(client_name, data_reader.pinned())
+        if error:
+            return error
     
-    results = v_store.search_interactions(query, client_id=client_id, n_results=3)
+    since = (date.today() - timedelta(days=days)).isoformat() if days else None
+    results = retriever.search_interactions(query, client_id=client_id, n_results=3, sentiment=sentiment,
+                                            interaction_type=interaction_type, since=since)
     docs = results.get("documents", [[]])[0]
     return "\n\n---\n\n".join(docs) if docs else "No relevant history found."
 
+def format_grouped_results(groups, empty_message):
+    sections = []
+    for group in groups:
+        if not group["matches"]:
+            continue
+        docs = "\n\n---\n\n".join(m["document"] for m in group["matches"])
+        sections.append(f"### Results for: {group['query']}\n\n{docs}")
+    return "\n\n".join(sections) if sections else empty_message
+
+@tool
+def batch_search_research_library(queries: List[str]) -> str:
+    """
+    Search the research library for several topics in one call, e.g. one query per
+    client pain point. Results are grouped by query and each report is listed once,
+    under the query it matches best. Prefer this over repeated search_research_library calls.
+    """
+    groups = retriever.search_research_batch(queries, n_results=3, mmr_lambda=RESEARCH_MMR_LAMBDA)
+    return format_grouped_results(groups, "No relevant research found.")
+
+@tool
+def batch_search_interaction_history(queries: List[str], client_names: Optional[List[str]] = None) -> str:
+    """
+    Search meeting notes, emails and support tickets for several topics in one call.
+    client_names optionally scopes the queries: either one name per query, or a single
+    name applied to all of them. Results are grouped by query and deduplicated.
+    """
+    names = client_names or [None]
+    if len(names) == 1:
+        names = names * len(queries)
+    if len(names) != len(queries):
+        return "client_names must contain one name per query, or a single name for all queries."
+
+    reader = data_reader.pinned()
+    client_ids = []
+    for name in names:
+        client_id = None
+        if name:
+            client_id, error = resolve_client_scope(name, reader)
+            if error:
+                return error
+        client_ids.append(client_id)
+
+    groups = retriever.search_interactions_batch(queries, client_ids=client_ids, n_results=3)
+    return format_grouped_results(groups, "No relevant history found.")
+
 @tool
 def get_client_engagement_metrics(client_name: str) -> str:
     """
     Retrieve 6 months of historical engagement metrics (login frequency, downloads, NPS, CSAT)
-    for a specific client. Use this to identify trends or regressions in software usage.
+    for a specific client, plus the latest month-over-month change for each metric.
+    Use this to identify trends or regressions in software usage.
     """
-    client = data_reader.get_client(client_name)
-    if not client: return f"Client '{client_name}' not found."
+    reader = data_reader.pinned()
+    client, message = resolve_client_name(client_name, reader)
+    if client is None: return message
     
-    metrics = data_reader.get_metrics(client['id'])
-    return json.dumps(metrics, indent=2)
+    return with_match_note(message, json.dumps({
+        "client_id": client["id"],
+        "history": reader.get_metrics(client["id"]),
+        "latest_mom_change": reader.get_metric_changes(client["id"]),
+    }, indent=2))
 
 @tool
 def lookup_contract_details(client_name: str) -> str:
@@ -138,11 +293,12 @@ def lookup_contract_details(client_name: str) -> str:
     Look up the specific contract details for a client, including total value (ARR), 
     service level (Platinum/Gold), and renewal likelihood.
     """
-    client = data_reader.get_client(client_name)
-    if not client: return f"Client '{client_name}' not found."
+    reader = data_reader.pinned()
+    client, message = resolve_client_name(client_name, reader)
+    if client is None: return message
     
-    contract = data_reader.get_contract(client['id'])
-    return json.dumps(contract, indent=2)
+    contract = reader.get_contract(client['id'])
+    return with_match_note(message, json.dumps(as_dict(contract), indent=2))
 
 @tool
 def get_associate_performance_context(client_name: str) -> str:
@@ -150,11 +306,12 @@ def get_associate_performance_context(client_name: str) -> str:
     Returns information about the Client Success Associate assigned to this account 
     and their historical performance metrics. Helpful for internal briefing.
     """
-    client = data_reader.get_client(client_name)
-    if not client: return f"Client '{client_name}' not found."
+    reader = data_reader.pinned()
+    client, message = resolve_client_name(client_name, reader)
+    if client is None: return message
     
-    info = data_reader.get_associate_info(client['id'])
-    return json.dumps(info, indent=2)
+    info = reader.get_associate_info(client['id'])
+    return with_match_note(message, json.dumps(as_dict(info), indent=2))
 
 @tool
 def analyze_data_python(code: str) -> str:
@@ -181,8 +338,14 @@ GSS_TOOLS = [
     lookup_client_file, 
     search_research_library, 
     search_interaction_history, 
+    batch_search_research_library,
+    batch_search_interaction_history,
     analyze_data_python,
     get_client_engagement_metrics,
     lookup_contract_details,
     get_associate_performance_context
 ]
+
+# Native coroutines: under agent.astream the tool bodies run on the bounded tool executor
+for _tool in GSS_TOOLS:
+    with_async(_tool)
@@ -0,0 +1,138 @@
+"""
+Materialized portfolio aggregates for the executive tools.
+
+ARR totals, churn-risk buckets and per-associate, per-region and
+per-industry rollups are computed once per snapshot and then maintained
+incrementally: add_client/remove_client adjust the counters for a single
+record, and apply_changes() diffs two client lists so a hot reload only pays
+for the clients that actually changed. Reading an aggregate never iterates
+the portfolio.
+"""
+import copy
+
+# Assuming we don't have explicit ARR in clients.json, we estimate $50k per subscription
+ESTIMATED_ARR_PER_SUBSCRIPTION = 50000
+HIGH_VALUE_THRESHOLD = 100000
+AT_RISK_LEVELS = ("High", "Medium", "Critical")
+
+
+def estimated_arr(client):
+    return len(client.get("subscriptions", [])) * ESTIMATED_ARR_PER_SUBSCRIPTION
+
+
+def _bucket():
+    return {"client_count": 0, "estimated_arr": 0, "at_risk_count": 0}
+
+
+class PortfolioAggregates:
+    def __init__(self, clients=(), resolve_associate=None):
+        # Maps a client's assigned_associate (name or id) to an associate record
+        self.resolve_associate = resolve_associate
+        self.total_arr = 0
+        self.client_count = 0
+        self.high_value_clients = 0
+        self.risk_counts = {}
+        self.by_associate = {}
+        self.by_region = {}
+        self.by_industry = {}
+        # client_id -> at-risk summary, in portfolio order
+        self.at_risk = {}
+        self._clients = {}
+        for client in clients:
+            self.add_client(client)
+
+    def copy(self):
+        clone = copy.copy(self)
+        for name in ("risk_counts", "at_risk", "_clients"):
+            setattr(clone, name, dict(getattr(self, name)))
+        for name in ("by_associate", "by_region", "by_industry"):
+            setattr(clone, name, {k: dict(v) for k, v in getattr(self, name).items()})
+        return clone
+
+    def _associate_key(self, client):
+        ref = client.get("assigned_associate")
+        assoc = self.resolve_associate(ref) if (ref and self.resolve_associate) else None
+        return assoc.get("id") if assoc else ref
+
+    def _apply(self, client, sign):
+        arr = estimated_arr(client)
+        risk = client.get("churn_risk", "Low")
+        at_risk = risk in AT_RISK_LEVELS
+
+        self.client_count += sign
+        self.total_arr += sign * arr
+        if arr > HIGH_VALUE_THRESHOLD:
+            self.high_value_clients += sign
+        self.risk_counts[risk] = self.risk_counts.get(risk, 0) + sign
+        if not self.risk_counts[risk]:
+            del self.risk_counts[risk]
+
+        for index, key in ((self.by_associate, self._associate_key(client)),
+                           (self.by_region, client.get("region")),
+                           (self.by_industry, client.get("industry"))):
+            bucket = index.setdefault(key or "Unassigned", _bucket())
+            bucket["client_count"] += sign
+            bucket["estimated_arr"] += sign * arr
+            bucket["at_risk_count"] += sign * int(at_risk)
+            if not bucket["client_count"]:
+                del index[key or "Unassigned"]
+
+    def add_client(self, client):
+        client_id = client.get("id")
+        if client_id in self._clients:
+            self.remove_client(client_id)
+        self._clients[client_id] = client
+        self._apply(client, 1)
+        if client.get("churn_risk", "Low") in AT_RISK_LEVELS:
+            self.at_risk[client_id] = {
+                "client_name": client.get("name"),
+                "industry": client.get("industry"),
+                "revenue": client.get("revenue"),
+                "risk_level": client.get("churn_risk"),
+                "assigned_associate": client.get("assigned_associate"),
+            }
+
+    def remove_client(self, client_id):
+        client = self._clients.pop(client_id, None)
+        if client is None:
+            return
+        self._apply(client, -1)
+        self.at_risk.pop(client_id, None)
+
+    def apply_changes(self, clients):
+        """
+        Brings the aggregates in line with a new client list, touching only the
+        records that were added, removed or modified. Returns the number of changes.
+        """
+        incoming = {c.get("id"): c for c in clients}
+        changes = 0
+        for client_id in [cid for cid in self._clients if cid not in incoming]:
+            self.remove_client(client_id)
+            changes += 1
+        for client_id, client in incoming.items():
+            current = self._clients.get(client_id)
+            if current is client or current == client:
+                # Unchanged records are rebound so the aggregates don't pin the old snapshot
+                self._clients[client_id] = client
+                continue
+            self.add_client(client)
+            changes += 1
+        return changes
+
+    def revenue_snapshot(self):
+        return {
+            "total_estimated_arr": f"${self.total_arr:,.0f}",
+            "total_clients": self.client_count,
+            "high_value_accounts": self.high_value_clients,
+            "average_deal_size": f"${(self.total_arr / self.client_count if self.client_count else 0):,.0f}",
+        }
+
+    def at_risk_clients(self):
+        return list(self.at_risk.values())
+
+    def breakdown(self, dimension):
+        """Rollup by 'associate', 'region' or 'industry'."""
+        index = {"associate": self.by_associate, "region": self.by_region, "industry": self.by_industry}.get(dimension)
+        if index is None:
+            raise ValueError(f"Unknown dimension '{dimension}'. Use 'associate', 'region' or 'industry'.")
+        return {key: dict(bucket) for key, bucket in index.items()}
@@ -0,0 +1,166 @@
+"""
+Columnar store for the client engagement timeseries.
+
+`client_metrics_timeseries.json` is a list of nested dicts, one per client per
+month. The store pivots it once into one float64 matrix per metric with shape
+(clients, months) so per-client slices, month-over-month deltas, rolling
+windows and portfolio-wide aggregates are single NumPy operations instead of
+list comprehensions over every record.
+
+Missing observations are NaN; duplicate (client, month) records keep the last one.
+"""
+import numpy as np
+
+# Known metrics first, in a stable order; unknown keys found in the data are appended.
+METRIC_FIELDS = (
+    "login_frequency",
+    "content_downloads",
+    "inquiry_utilization_pct",
+    "nps",
+    "csat",
+    "contract_value_arr",
+    "days_since_last_engagement",
+    "research_docs_accessed",
+    "analyst_inquiry_hours",
+)
+
+
+def _flatten(records):
+    # Metrics might be a dict (by client_id) or list
+    if isinstance(records, dict):
+        for client_id, rows in records.items():
+            for row in rows or []:
+                yield dict(row, client_id=row.get("client_id", client_id))
+    else:
+        yield from records or []
+
+
+class MetricsStore:
+    def __init__(self, records):
+        rows = [r for r in _flatten(records) if r.get("client_id") and r.get("month")]
+
+        self.client_ids = list(dict.fromkeys(r["client_id"] for r in rows))
+        self.months = sorted({r["month"] for r in rows})
+        self._client_index = {cid: i for i, cid in enumerate(self.client_ids)}
+        self._month_index = {m: j for j, m in enumerate(self.months)}
+
+        names = list(METRIC_FIELDS)
+        for r in rows:
+            for key in r.get("metrics", {}):
+                if key not in names:
+                    names.append(key)
+
+        shape = (len(self.client_ids), len(self.months))
+        columns = {name: np.full(shape, np.nan) for name in names}
+        integral = {name: True for name in names}
+        for r in rows:
+            i = self._client_index[r["client_id"]]
+            j = self._month_index[r["month"]]
+            for key, value in r.get("metrics", {}).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    columns[key][i, j] = value
+                    if integral[key] and not float(value).is_integer():
+                        integral[key] = False
+
+        # Drop metrics that never carry a numeric value
+        self.metric_names = [n for n in names if not np.isnan(columns[n]).all()]
+        self._columns = {n: columns[n] for n in self.metric_names}
+        self._integral = {n for n in self.metric_names if integral[n]}
+        self._observed = np.zeros(shape, dtype=bool)
+        for column in self._columns.values():
+            self._observed |= ~np.isnan(column)
+
+    def __len__(self):
+        return len(self.client_ids)
+
+    def has_client(self, client_id):
+        return client_id in self._client_index
+
+    def column(self, metric):
+        """The full (clients, months) matrix for a metric. Treat as read-only."""
+        if metric not in self._columns:
+            raise KeyError(f"Unknown metric '{metric}'. Available: {self.metric_names}")
+        return self._columns[metric]
+
+    def rows_for(self, client_ids):
+        return np.array([self._client_index[cid] for cid in client_ids if cid in self._client_index], dtype=np.intp)
+
+    def slice(self, metric, client_ids=None, months=None):
+        """Sub-matrix of a metric for the given clients and months (all by default)."""
+        data = self.column(metric)
+        if client_ids is not None:
+            data = data[self.rows_for(client_ids)]
+        if months is not None:
+            cols = np.array([self._month_index[m] for m in months if m in self._month_index], dtype=np.intp)
+            data = data[:, cols]
+        return data
+
+    def series(self, metric, client_id):
+        """1-D monthly series for one client (NaN where the month is missing)."""
+        if client_id not in self._client_index:
+            return np.full(len(self.months), np.nan)
+        return self.column(metric)[self._client_index[client_id]]
+
+    def mom_delta(self, metric, client_ids=None):
+        """Month-over-month change, shape (clients, months - 1)."""
+        return np.diff(self.slice(metric, client_ids), axis=1)
+
+    def rolling_mean(self, metric, window, client_ids=None):
+        """
+        Trailing mean over `window` months, shape (clients, months). Positions
+        without a full window of observations are NaN.
+        """
+        data = self.slice(metric, client_ids)
+        out = np.full(data.shape, np.nan)
+        if window < 1 or data.shape[1] < window:
+            return out
+        filled = np.nan_to_num(data)
+        counts = np.cumsum(~np.isnan(data), axis=1)
+        sums = np.cumsum(filled, axis=1)
+        window_sums = sums[:, window - 1:] - np.concatenate(
+            [np.zeros((data.shape[0], 1)), sums[:, :-window]], axis=1)
+        window_counts = counts[:, window - 1:] - np.concatenate(
+            [np.zeros((data.shape[0], 1), dtype=counts.dtype), counts[:, :-window]], axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[:, window - 1:] = np.where(window_counts == window, window_sums / window, np.nan)
+        return out
+
+    def latest(self, metric, client_ids=None):
+        """Most recent non-NaN value per client (NaN if the client has none)."""
+        data = self.slice(metric, client_ids)
+        if data.shape[1] == 0:
+            return np.full(data.shape[0], np.nan)
+        observed = ~np.isnan(data)
+        last = data.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1)
+        values = data[np.arange(data.shape[0]), last]
+        return np.where(observed.any(axis=1), values, np.nan)
+
+    def _value(self, metric, value):
+        return int(value) if metric in self._integral else float(value)
+
+    def client_history(self, client_id):
+        """The client's records in the original JSON shape, oldest month first."""
+        if client_id not in self._client_index:
+            return []
+        i = self._client_index[client_id]
+        history = []
+        for j, month in enumerate(self.months):
+            if not self._observed[i, j]:
+                continue
+            metrics = {}
+            for name in self.metric_names:
+                value = self._columns[name][i, j]
+                if not np.isnan(value):
+                    metrics[name] = self._value(name, value)
+            history.append({"client_id": client_id, "month": month, "metrics": metrics})
+        return history
+
+    def latest_changes(self, client_id):
+        """Latest month-over-month change per metric for one client."""
+        changes = {}
+        for name in self.metric_names:
+            values = self.series(name, client_id)
+            values = values[~np.isnan(values)]
+            if len(values) >= 2:
+                changes[name] = round(float(values[-1] - values[-2]), 2)
+        return changes
@@ -0,0 +1,234 @@
+"""
+Compact, read-only record types for the portfolio datasets.
+
+Parsed JSON keeps every record as a dict (with its own hash table) holding
+more dicts and lists, and every repeated value ("North America", "Low",
+subscription names, ...) as a separate string object. Snapshots instead hold:
+
+- __slots__ classes for clients, contracts, associates, associate performance
+  and metric snapshots, so a record is a fixed array of references;
+- CompactMapping for nested objects (key contacts, evaluation metadata,
+  metric values), whose key order and index are shared by every mapping with
+  the same keys;
+- tuples instead of lists, and one string object per distinct value within a
+  dataset (see StringPool).
+
+Records are read-only Mappings, so the indexes and tools keep using
+record["id"] / record.get("name") unchanged; as_dict() turns them back into
+plain dicts and lists at the tool-output boundary. Keys a record type does not
+declare are kept in a small overflow mapping, so no data is dropped.
+"""
+from collections.abc import Mapping
+
+
+class _Missing:
+    """Marks a declared field that was absent from the source record."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<missing>"
+
+    def __reduce__(self):
+        return "MISSING"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+MISSING = _Missing()
+
+
+class StringPool:
+    """
+    De-duplicates equal strings and key layouts while compacting one dataset.
+    Unlike sys.intern the pool is dropped with the snapshot, so reloads don't
+    accumulate every value ever seen.
+    """
+
+    def __init__(self):
+        self._strings = {}
+        self._layouts = {}
+
+    def string(self, value):
+        return self._strings.setdefault(value, value)
+
+    def layout(self, keys):
+        """Shared key -> position index for mappings with these keys, in this order."""
+        keys = tuple(self.string(k) for k in keys)
+        index = self._layouts.get(keys)
+        if index is None:
+            index = self._layouts[keys] = {k: i for i, k in enumerate(keys)}
+        return index
+
+    def compact(self, value):
+        if isinstance(value, str):
+            return self.string(value)
+        if isinstance(value, (list, tuple)):
+            return tuple(self.compact(v) for v in value)
+        if isinstance(value, dict):
+            return CompactMapping(self.layout(value), tuple(self.compact(v) for v in value.values()))
+        return value
+
+
+def as_dict(value):
+    """Plain dict/list copy of records, compact mappings and tuples, for JSON output."""
+    if isinstance(value, (Record, CompactMapping)):
+        return value.to_dict()
+    if isinstance(value, Mapping):
+        return {k: as_dict(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [as_dict(v) for v in value]
+    return value
+
+
+class _ReadOnlyMapping(Mapping):
+    __slots__ = ()
+
+    def to_dict(self):
+        return {k: as_dict(v) for k, v in self.items()}
+
+    def __eq__(self, other):
+        # Compare by content so records equal the dicts they were built from
+        # (and the dicts the SQLite backend returns), tuples included.
+        if isinstance(other, Mapping):
+            return self.to_dict() == as_dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        # A deep copy is for editing, so it comes back as plain dicts and lists
+        return self.to_dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class CompactMapping(_ReadOnlyMapping):
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index, values):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._index
+
+
+class Record(_ReadOnlyMapping):
+    """Base for the slotted dataset records. Subclasses list their fields in FIELDS."""
+    __slots__ = ("_extra",)
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+    @classmethod
+    def from_dict(cls, data, pool=None):
+        pool = pool or StringPool()
+        record = cls.__new__(cls)
+        for name in cls.FIELDS:
+            value = data.get(name, MISSING)
+            object.__setattr__(record, name, value if value is MISSING else pool.compact(value))
+        extra = {k: v for k, v in data.items() if k not in cls._field_set}
+        object.__setattr__(record, "_extra", pool.compact(extra) if extra else None)
+        return record
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only; use as_dict() for an editable copy.")
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            value = getattr(self, key)
+            if value is not MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        for name in self.FIELDS:
+            if getattr(self, name) is not MISSING:
+                yield name
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in self._field_set:
+            return getattr(self, key) is not MISSING
+        return self._extra is not None and key in self._extra
+
+    def __reduce__(self):
+        return (type(self).from_dict, (self.to_dict(),))
+
+
+class ClientRecord(Record):
+    FIELDS = ("id", "name", "industry", "revenue", "region", "lifecycle_stage", "churn_risk",
+              "subscriptions", "entitlements", "key_contacts", "assigned_associate", "evaluation_metadata")
+    __slots__ = FIELDS
+
+
+class ContractRecord(Record):
+    FIELDS = ("id", "client_id", "start_date", "end_date", "total_value", "currency", "status",
+              "renewal_likelihood", "service_level")
+    __slots__ = FIELDS
+
+
+class AssociateRecord(Record):
+    FIELDS = ("id", "name", "role", "region", "tenure_months")
+    __slots__ = FIELDS
+
+
+class PerformanceRecord(Record):
+    FIELDS = ("associate_id", "metrics")
+    __slots__ = FIELDS
+
+
+class MetricSnapshot(Record):
+    FIELDS = ("client_id", "month", "metrics")
+    __slots__ = FIELDS
+
+
+# snapshot dataset name -> record type
+RECORD_TYPES = {
+    "clients": ClientRecord,
+    "metrics": MetricSnapshot,
+    "associates": AssociateRecord,
+    "performance": PerformanceRecord,
+    "contracts": ContractRecord,
+}
+
+
+def compact_dataset(name, data):
+    """
+    Converts a parsed dataset into a tuple of records (or, for datasets keyed by
+    client, a dict of tuples). Entries that are not JSON objects are kept as-is.
+    """
+    record_type = RECORD_TYPES.get(name)
+    pool = StringPool()
+
+    def convert(rows):
+        return tuple(record_type.from_dict(r, pool) if record_type and isinstance(r, dict) else r
+                     for r in rows)
+
+    if isinstance(data, list):
+        return convert(data)
+    if isinstance(data, dict):
+        return {pool.string(k): convert(v) if isinstance(v, list) else v for k, v in data.items()}
+    return data
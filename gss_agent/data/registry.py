@@ -0,0 +1,103 @@
+"""
+In-memory lookup indexes over the client portfolio.
+
+The tools used to scan `clients`, `contracts`, `associates` and `performance`
+linearly on every call. The registry builds hash indexes once at load time so
+the common lookups are O(1); the old substring scan is kept as a fallback for
+partial client names.
+"""
+from gss_agent.data.resolver import ClientNameResolver, normalize_name
+
+
+class ClientRegistry:
+    def __init__(self, clients, contracts, associates, performance):
+        self.clients = clients or []
+        self.contracts = contracts or []
+        self.associates = associates or []
+        self.performance = performance or []
+
+        # id -> client and normalized name -> [clients]. Names are not unique
+        # in the portfolio, so the name index keeps every match in file order.
+        self.clients_by_id = {}
+        self.clients_by_name = {}
+        for client in self.clients:
+            client_id = client.get("id")
+            if client_id is not None:
+                self.clients_by_id.setdefault(client_id, client)
+            key = normalize_name(client.get("name"))
+            if key:
+                self.clients_by_name.setdefault(key, []).append(client)
+        self.resolver = ClientNameResolver(self.clients)
+
+        # First contract per client, matching the previous scan order.
+        self.contracts_by_client = {}
+        for contract in self.contracts:
+            client_id = contract.get("client_id")
+            if client_id is not None:
+                self.contracts_by_client.setdefault(client_id, contract)
+
+        self.associates_by_id = {}
+        self.associates_by_name = {}
+        for assoc in self.associates:
+            if assoc.get("id") is not None:
+                self.associates_by_id.setdefault(assoc["id"], assoc)
+            key = normalize_name(assoc.get("name"))
+            if key:
+                self.associates_by_name.setdefault(key, assoc)
+
+        self.performance_by_associate_id = {}
+        for perf in self.performance:
+            if perf.get("associate_id") is not None:
+                self.performance_by_associate_id.setdefault(perf["associate_id"], perf)
+
+    def get_client_by_id(self, client_id):
+        return self.clients_by_id.get(client_id)
+
+    def get_client(self, name):
+        """
+        Exact (case-insensitive) name hit, else the first client containing the
+        name, else a fuzzy match the resolver is confident about.
+        """
+        if not name:
+            return None
+        matches = self.clients_by_name.get(normalize_name(name))
+        if matches:
+            return matches[0]
+        client = self.scan_client(name)
+        if client is not None:
+            return client
+        match = ClientNameResolver.confident_match(self.resolver.resolve(name), name)
+        return match.client if match else None
+
+    def resolve_client(self, name, limit=5):
+        """Ranked ClientMatch candidates for a name or client id."""
+        return self.resolver.resolve(name, limit=limit)
+
+    def scan_client(self, name):
+        """Original linear substring match, kept for partial names."""
+        needle = name.lower()
+        for c in self.clients:
+            if needle in c.get("name", "").lower():
+                return c
+        return None
+
+    def get_contract(self, client_id):
+        return self.contracts_by_client.get(client_id)
+
+    def get_associate(self, ref):
+        """Resolves an associate by name or by id (clients store either)."""
+        if not ref:
+            return None
+        return self.associates_by_name.get(normalize_name(ref)) or self.associates_by_id.get(ref)
+
+    def get_associate_info(self, client_id):
+        client = self.clients_by_id.get(client_id)
+        if not client:
+            return None
+
+        assoc = self.get_associate(client.get("assigned_associate"))
+        if not assoc:
+            return None
+
+        perf = self.performance_by_associate_id.get(assoc.get("id"))
+        return {"profile": assoc, "performance": perf}
@@ -0,0 +1,141 @@
+"""
+Fuzzy client-name resolution over a precomputed character trigram index.
+
+`get_client` used to return the first client whose name contained the query,
+which is O(n) and silently picks the wrong account for short or ambiguous
+names. The resolver scores every candidate that shares a trigram with the
+query and returns a ranked list, so callers can tell a confident hit from an
+ambiguous one.
+"""
+from collections import Counter, namedtuple
+
+NGRAM_SIZE = 3
+# Candidates below this score are not returned at all
+MIN_SCORE = 0.3
+# Two distinct clients scoring within this margin of each other are ambiguous
+AMBIGUITY_MARGIN = 0.1
+# A fuzzy match whose name doesn't contain the query is only acted on at or above
+# this score; below it the candidates are offered instead, since a weak match may
+# well be another client
+CONFIDENT_SCORE = 0.85
+
+ClientMatch = namedtuple("ClientMatch", ["client", "score"])
+
+
+def normalize_name(name):
+    """Canonical form used as the key of the name indexes."""
+    if not name:
+        return ""
+    return " ".join(str(name).lower().split())
+
+
+def ngrams(text, n=NGRAM_SIZE):
+    padded = f" {text} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def selective_postings_limit(client_count):
+    """
+    Grams shared by more clients than this carry little signal and are skipped
+    during candidate generation (they still count when scoring).
+    """
+    return max(64, client_count // 50)
+
+
+def candidate_pool_size(limit):
+    return max(limit * 4, 20)
+
+
+def score_name(key, query_grams, name, name_gram_count):
+    """Dice overlap of trigram sets, lifted for substring containment."""
+    overlap = len(query_grams & ngrams(name))
+    score = 2.0 * overlap / (len(query_grams) + name_gram_count)
+    if key in name:
+        # Containment beats raw overlap; longer coverage ranks higher
+        score = max(score, 0.5 + 0.45 * len(key) / len(name))
+    return score
+
+
+class ClientNameResolver:
+    def __init__(self, clients):
+        self.clients = clients or []
+        self._names = [normalize_name(c.get("name")) for c in self.clients]
+        self._gram_counts = []
+        self._by_name = {}
+        self._by_id = {}
+        # trigram -> positions of the clients whose name contains it
+        self._postings = {}
+        for pos, name in enumerate(self._names):
+            grams = ngrams(name) if name else set()
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(pos)
+            if name:
+                self._by_name.setdefault(name, []).append(pos)
+            client_id = self.clients[pos].get("id")
+            if client_id is not None:
+                self._by_id.setdefault(str(client_id).lower(), pos)
+        self._max_postings = selective_postings_limit(len(self.clients))
+
+    def resolve(self, query, limit=5):
+        """
+        Returns up to `limit` ClientMatch tuples ordered by descending score.
+        A score of 1.0 means an exact name or client-id match.
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+
+        if key in self._by_id:
+            return [ClientMatch(self.clients[self._by_id[key]], 1.0)]
+        if key in self._by_name:
+            return [ClientMatch(self.clients[pos], 1.0) for pos in self._by_name[key][:limit]]
+
+        query_grams = ngrams(key)
+        postings = [self._postings[g] for g in query_grams if g in self._postings]
+        selective = [p for p in postings if len(p) <= self._max_postings]
+        shared = Counter()
+        for p in selective or postings:
+            shared.update(p)
+
+        # Only the best-overlapping candidates get the exact scoring pass
+        scored = []
+        for pos, _ in shared.most_common(candidate_pool_size(limit)):
+            score = score_name(key, query_grams, self._names[pos], self._gram_counts[pos])
+            if score >= MIN_SCORE:
+                scored.append((score, pos))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [ClientMatch(self.clients[pos], round(score, 3)) for score, pos in scored[:limit]]
+
+    @staticmethod
+    def is_ambiguous(matches):
+        """True when the top two matches are distinct clients with near-equal scores."""
+        if len(matches) < 2:
+            return False
+        top, runner_up = matches[0], matches[1]
+        if top.client.get("id") == runner_up.client.get("id"):
+            return False
+        return top.score - runner_up.score < AMBIGUITY_MARGIN
+
+    @staticmethod
+    def confident_match(matches, query):
+        """
+        The match that is safe to act on for `query`, else None. An exact or
+        partial name (one the client's name contains, e.g. "Cedar Health") is
+        accepted when it is clearly ahead of the runner-up, or when it is the
+        only candidate containing the query. Other fuzzy matches also need
+        CONFIDENT_SCORE.
+        """
+        if not matches:
+            return None
+        key = normalize_name(query)
+        top = matches[0]
+        if not ClientNameResolver.is_ambiguous(matches):
+            if top.score >= CONFIDENT_SCORE or key in normalize_name(top.client.get("name")):
+                return top
+            return None
+        containing = [m for m in matches if key in normalize_name(m.client.get("name"))]
+        return top if containing == [top] else None
@@ -0,0 +1,388 @@
+"""
+Process-wide, read-only snapshot of the portfolio datasets.
+
+The frontline tools (`core/tools.py`) and the executive tools
+(`core/executive_tools.py`) used to parse the same JSON files into separate
+copies. Both now share one DataSnapshot, created on first use, which also owns
+the derived indexes (ClientRegistry, MetricsStore, ...) so those are built once
+too.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from gss_agent.data.aggregates import PortfolioAggregates
+from gss_agent.data.metrics_store import MetricsStore
+from gss_agent.data.records import compact_dataset
+from gss_agent.data.registry import ClientRegistry
+from gss_agent.data.risk import score_portfolio
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A lazily read file that fails to parse (most likely caught mid-write) is retried this often
+LAZY_READ_ATTEMPTS = 5
+LAZY_READ_RETRY_DELAY = 0.1
+
+# attribute name -> file under DATA_DIR
+DATASET_FILES = {
+    "clients": "clients.json",
+    "metrics": "client_metrics_timeseries.json",
+    "associates": "associates.json",
+    "performance": "associate_performance.json",
+    "contracts": "contracts.json",
+}
+
+
+def file_digest(path):
+    """sha256 of a file's bytes, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def read_dataset(path, strict=False):
+    """
+    Parses a JSON dataset and returns (data, sha256). In the default lenient mode a
+    missing or unreadable file yields []; with strict=True the error is raised so a
+    half-written file is never mistaken for an empty dataset.
+    """
+    filename = os.path.basename(path)
+    if not os.path.exists(path):
+        if strict:
+            raise FileNotFoundError(path)
+        logger.warning(f"{filename} not found, using empty dataset.")
+        return [], None
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    try:
+        return json.loads(raw), digest
+    except Exception as e:
+        if strict:
+            raise
+        logger.error(f"Error loading {filename}: {e}")
+        return [], digest
+
+
+def deep_sizeof(obj, _seen=None):
+    """Approximate retained size in bytes of a JSON-like object graph."""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) + (0 if obj.base is not None else obj.nbytes)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, _seen) + deep_sizeof(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, _seen) for item in obj)
+    else:
+        if hasattr(obj, "__dict__"):
+            size += deep_sizeof(vars(obj), _seen)
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(obj, name):
+                    size += deep_sizeof(getattr(obj, name), _seen)
+    return size
+
+
+class DataSnapshot:
+    """
+    Immutable view of all datasets plus the indexes derived from them. Records are
+    held as the compact types from data/records.py, in tuples.
+
+    Datasets that are not passed in are parsed from `data_dir` on first access
+    and the indexes are built on first use, so a process that only needs the
+    client list never parses the metrics timeseries. materialize() loads
+    everything up front (used by hot reload, so a swap is never half-loaded).
+
+    If a lazy read finds that a file changed after the snapshot was created,
+    the snapshot is superseded: a fresh lazy snapshot of `data_dir` replaces it
+    as the shared one (once, even without a watcher running), and every
+    dataset or index the old one hasn't cached yet is served from its successor
+    instead, so nothing built from the new bytes is cached under the old
+    version and the file is not re-read on every access.
+    """
+
+    __slots__ = ("data_dir", "loaded_at", "file_hashes", "version", "_datasets", "_cache",
+                 "_previous", "_successor", "_lock", "_frozen")
+
+    def __init__(self, datasets=None, data_dir=None, file_hashes=None, previous=None):
+        file_hashes = dict(file_hashes or {})
+        object.__setattr__(self, "data_dir", data_dir)
+        object.__setattr__(self, "loaded_at", time.time())
+        object.__setattr__(self, "file_hashes", file_hashes)
+        # Short content version of the source files, used for logging and cache keys
+        combined = "".join(f"{k}:{file_hashes[k]}" for k in sorted(file_hashes))
+        object.__setattr__(self, "version", hashlib.sha256(combined.encode()).hexdigest()[:12])
+        object.__setattr__(self, "_datasets", {name: compact_dataset(name, data) for name, data in (datasets or {}).items()})
+        # Lazily derived values; they depend only on this snapshot's data
+        object.__setattr__(self, "_cache", {})
+        # Only kept until the aggregates have been derived from it
+        object.__setattr__(self, "_previous", previous)
+        # Set once a lazy read finds a changed file, see _supersede()
+        object.__setattr__(self, "_successor", None)
+        object.__setattr__(self, "_lock", threading.RLock())
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DataSnapshot is immutable; build a new one instead.")
+
+    def _read_dataset(self, filename):
+        """
+        Strict read for the lazy path: a file caught mid-write is retried, then
+        the parse error is raised rather than served as an empty dataset.
+        """
+        path = os.path.join(self.data_dir or DATA_DIR, filename)
+        for attempt in range(LAZY_READ_ATTEMPTS):
+            try:
+                return read_dataset(path, strict=True)
+            except FileNotFoundError:
+                return [], None
+            except ValueError as e:
+                if attempt == LAZY_READ_ATTEMPTS - 1:
+                    raise
+                logger.warning(f"{filename} is not valid JSON ({e}); retrying.")
+                time.sleep(LAZY_READ_RETRY_DELAY)
+
+    def _dataset(self, name):
+        if name not in self._datasets:
+            with self._lock:
+                if name not in self._datasets:
+                    if self._successor is not None:
+                        return self._successor._dataset(name)
+                    filename = DATASET_FILES[name]
+                    data, digest = self._read_dataset(filename)
+                    if filename in self.file_hashes and self.file_hashes[filename] != digest:
+                        logger.warning(f"{filename} changed since snapshot {self.version} was created.")
+                        return self._supersede()._dataset(name)
+                    self._datasets[name] = compact_dataset(name, data)
+        return self._datasets[name]
+
+    def _supersede(self):
+        """Creates the successor snapshot and makes it the shared one if this one was."""
+        global _snapshot
+        successor = load_snapshot(self.data_dir or DATA_DIR, lazy=True, previous=self)
+        object.__setattr__(self, "_successor", successor)
+        with _snapshot_lock:
+            if _snapshot is self:
+                _snapshot = successor
+                logger.info(f"Data snapshot {self.version} superseded by {successor.version}.")
+        return successor
+
+    def _derived(self, key, build):
+        """`build(snapshot)`, cached. Not cached if the snapshot was superseded while building."""
+        if key not in self._cache:
+            with self._lock:
+                if key not in self._cache:
+                    if self._successor is None:
+                        value = build(self)
+                        if self._successor is None:
+                            self._cache[key] = value
+                            return value
+                    return self._successor._derived(key, build)
+        return self._cache[key]
+
+    def is_loaded(self, name):
+        return name in self._datasets or name in self._cache
+
+    @property
+    def clients(self):
+        return self._dataset("clients")
+
+    @property
+    def metrics(self):
+        return self._dataset("metrics")
+
+    @property
+    def associates(self):
+        return self._dataset("associates")
+
+    @property
+    def performance(self):
+        return self._dataset("performance")
+
+    @property
+    def contracts(self):
+        return self._dataset("contracts")
+
+    @property
+    def registry(self):
+        return self._derived("registry", lambda s: ClientRegistry(
+            s.clients, s.contracts, s.associates, s.performance))
+
+    @property
+    def metrics_store(self):
+        return self._derived("metrics_store", lambda s: MetricsStore(s.metrics))
+
+    @property
+    def aggregates(self):
+        return self._derived("aggregates", DataSnapshot._build_aggregates)
+
+    def _build_aggregates(self):
+        previous = self._previous
+        object.__setattr__(self, "_previous", None)
+        # Reuse the previous snapshot's aggregates and apply only the changed
+        # clients, unless the associate data they are keyed by changed too.
+        associates_file = DATASET_FILES["associates"]
+        if (isinstance(previous, DataSnapshot) and previous.is_loaded("aggregates")
+                and previous.file_hashes.get(associates_file) == self.file_hashes.get(associates_file)):
+            aggregates = previous.aggregates.copy()
+            aggregates.resolve_associate = self.registry.get_associate
+            changed = aggregates.apply_changes(self.clients)
+            logger.info(f"Portfolio aggregates updated incrementally ({changed} client changes).")
+            return aggregates
+        return PortfolioAggregates(self.clients, resolve_associate=self.registry.get_associate)
+
+    def materialize(self):
+        """Loads every dataset and builds every index now rather than on first use."""
+        for name in DATASET_FILES:
+            self._dataset(name)
+        for index in ("registry", "metrics_store", "aggregates"):
+            getattr(self, index)
+        return self
+
+    # Query interface, shared with SqliteDataStore so the tools work with either backend
+
+    def get_client(self, name):
+        return self.registry.get_client(name)
+
+    def get_client_by_id(self, client_id):
+        return self.registry.get_client_by_id(client_id)
+
+    def resolve_client(self, name, limit=5):
+        return self.registry.resolve_client(name, limit=limit)
+
+    def client_summaries(self):
+        return [
+            {"name": c.get("name"), "id": c.get("id"), "industry": c.get("industry")}
+            for c in self.clients
+        ]
+
+    def get_contract(self, client_id):
+        return self.registry.get_contract(client_id)
+
+    def contracts_ending_between(self, start_date, end_date):
+        """Contracts whose end_date (YYYY-MM-DD) falls in [start_date, end_date]."""
+        ending = [c for c in self.contracts if start_date <= (c.get("end_date") or "") <= end_date]
+        return tuple(sorted(ending, key=lambda c: c["end_date"]))
+
+    def get_associate(self, ref):
+        return self.registry.get_associate(ref)
+
+    def get_associate_info(self, client_id):
+        return self.registry.get_associate_info(client_id)
+
+    def get_metrics(self, client_id):
+        return self.metrics_store.client_history(client_id)
+
+    def get_metric_changes(self, client_id):
+        return self.metrics_store.latest_changes(client_id)
+
+    def risk_scores(self):
+        """Churn-risk scores for every client, computed once per snapshot."""
+        return self._derived("risk_scores", lambda s: score_portfolio(s.metrics_store))
+
+    def memory_report(self):
+        """
+        Record counts and approximate retained bytes per dataset and index.
+        Datasets and indexes that have not been loaded yet are reported as such.
+        """
+        report = {}
+        seen = set()
+        for name in DATASET_FILES:
+            if name not in self._datasets:
+                report[name] = {"loaded": False, "bytes": 0}
+                continue
+            data = self._datasets[name]
+            report[name] = {"records": len(data), "bytes": deep_sizeof(data)}
+            # Indexes reference the dataset records, which are already counted here
+            seen.add(id(data))
+            for record in (data.values() if isinstance(data, dict) else data):
+                seen.add(id(record))
+        for key, label in (("registry", "registry_index"), ("metrics_store", "metrics_store"),
+                           ("aggregates", "aggregates"), ("risk_scores", "risk_scores")):
+            if key in self._cache:
+                report[label] = {"bytes": deep_sizeof(self._cache[key], set(seen))}
+            else:
+                report[label] = {"loaded": False, "bytes": 0}
+        report["total_bytes"] = sum(v["bytes"] for v in report.values())
+        return report
+
+
+def load_snapshot(data_dir=DATA_DIR, strict=False, previous=None, lazy=False):
+    """
+    Builds a snapshot of `data_dir`. With lazy=True only the file hashes are read
+    now and each dataset is parsed on first access; otherwise everything is
+    parsed and indexed before returning. strict=True raises on a file that fails
+    to parse, or that `previous` had and is now missing.
+    """
+    if lazy:
+        file_hashes = {filename: file_digest(os.path.join(data_dir, filename))
+                       for filename in DATASET_FILES.values()}
+        return DataSnapshot(data_dir=data_dir, file_hashes=file_hashes, previous=previous)
+
+    datasets, file_hashes = {}, {}
+    previous_hashes = getattr(previous, "file_hashes", None) or {}
+    for name, filename in DATASET_FILES.items():
+        path = os.path.join(data_dir, filename)
+        # strict guards against files caught mid-write or mid-replace; a file that is
+        # absent now and was absent before is just an empty dataset
+        file_strict = strict and (os.path.exists(path) or previous_hashes.get(filename) is not None)
+        datasets[name], file_hashes[filename] = read_dataset(path, strict=file_strict)
+    snapshot = DataSnapshot(datasets, data_dir=data_dir, file_hashes=file_hashes, previous=previous).materialize()
+    logger.info(f"Data snapshot {snapshot.version} loaded: {len(snapshot.clients)} clients, "
+                f"{len(snapshot.associates)} associates, {len(snapshot.metrics)} metric records.")
+    return snapshot
+
+
+# "json" (default) holds every dataset in memory; "sqlite" serves queries from the
+# embedded database built by scripts/import_to_sqlite.py
+DATA_BACKEND = os.getenv("NEXUS_DATA_BACKEND", "json")
+# Parse and index everything when the shared snapshot is first requested,
+# instead of dataset by dataset on first access
+EAGER_LOAD = os.getenv("NEXUS_EAGER_LOAD", "0") == "1"
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def load_default():
+    if DATA_BACKEND == "sqlite":
+        from gss_agent.data.sqlite_store import SqliteDataStore
+        return SqliteDataStore()
+    return load_snapshot(lazy=not EAGER_LOAD)
+
+
+def get_snapshot():
+    """
+    The shared snapshot (or SqliteDataStore when NEXUS_DATA_BACKEND=sqlite),
+    loaded on first call. Callers that need a
+    consistent view across several reads should hold on to the returned object
+    rather than calling get_snapshot() again, since it may be swapped at any time.
+    """
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = load_default()
+    return _snapshot
+
+
+def swap_snapshot(snapshot):
+    """Atomically replaces the shared snapshot and returns the previous one."""
+    global _snapshot
+    with _snapshot_lock:
+        previous, _snapshot = _snapshot, snapshot
+    return previous
@@ -0,0 +1,375 @@
+"""
+Embedded SQLite backend for the client data layer.
+
+The JSON files remain the import format: `import_json()` (or
+`scripts/import_to_sqlite.py`) loads them into an indexed database, and
+SqliteDataStore then answers the same queries as DataSnapshot while reading
+only the rows each tool needs. Select it with NEXUS_DATA_BACKEND=sqlite and
+NEXUS_SQLITE_PATH.
+
+Each record is stored verbatim as JSON next to the indexed columns, so tool
+output is identical to the in-memory backend.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from gss_agent.data.aggregates import PortfolioAggregates
+from gss_agent.data.metrics_store import MetricsStore
+from gss_agent.data.risk import score_portfolio
+from gss_agent.data.resolver import (
+    ClientMatch, ClientNameResolver, MIN_SCORE, candidate_pool_size, ngrams, normalize_name,
+    score_name, selective_postings_limit,
+)
+from gss_agent.data.snapshot import DATA_DIR, DATASET_FILES, deep_sizeof, read_dataset
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(DATA_DIR))
+DEFAULT_DB_PATH = os.getenv("NEXUS_SQLITE_PATH", os.path.join(PROJECT_ROOT, "nexus_data.db"))
+
+SCHEMA = """
+CREATE TABLE clients (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT,
+    id_norm TEXT,
+    name TEXT,
+    name_norm TEXT,
+    gram_count INTEGER,
+    assigned_associate TEXT,
+    region TEXT,
+    industry TEXT,
+    churn_risk TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX idx_clients_id ON clients(id_norm);
+CREATE INDEX idx_clients_name ON clients(name_norm);
+CREATE INDEX idx_clients_associate ON clients(assigned_associate);
+
+CREATE TABLE client_ngrams (gram TEXT NOT NULL, client_rowid INTEGER NOT NULL);
+CREATE INDEX idx_client_ngrams_gram ON client_ngrams(gram);
+CREATE TABLE ngram_df (gram TEXT PRIMARY KEY, df INTEGER NOT NULL);
+
+CREATE TABLE contracts (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT,
+    client_id TEXT,
+    end_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX idx_contracts_client ON contracts(client_id);
+CREATE INDEX idx_contracts_end_date ON contracts(end_date);
+
+CREATE TABLE associates (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT,
+    name_norm TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX idx_associates_id ON associates(id);
+CREATE INDEX idx_associates_name ON associates(name_norm);
+
+CREATE TABLE performance (
+    rowid INTEGER PRIMARY KEY,
+    associate_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX idx_performance_associate ON performance(associate_id);
+
+CREATE TABLE metrics (
+    client_id TEXT NOT NULL,
+    month TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (client_id, month)
+);
+CREATE INDEX idx_metrics_month ON metrics(month);
+
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+TABLES = ("clients", "contracts", "associates", "performance", "metrics")
+
+
+def import_json(data_dir=DATA_DIR, db_path=DEFAULT_DB_PATH):
+    """
+    Builds a fresh database from the JSON datasets. It is written to a temporary
+    file and renamed over `db_path`, so readers never see a partial import. A
+    file that fails to parse aborts the import; a missing one is an empty
+    dataset, as in load_snapshot().
+    """
+    datasets, file_hashes = {}, {}
+    for name, filename in DATASET_FILES.items():
+        path = os.path.join(data_dir, filename)
+        datasets[name], file_hashes[filename] = read_dataset(path, strict=os.path.exists(path))
+
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+
+        gram_rows, df = [], {}
+        for rowid, c in enumerate(datasets["clients"], start=1):
+            name_norm = normalize_name(c.get("name"))
+            grams = ngrams(name_norm) if name_norm else set()
+            conn.execute(
+                "INSERT INTO clients VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (rowid, c.get("id"), str(c.get("id", "")).lower(), c.get("name"), name_norm, len(grams),
+                 c.get("assigned_associate"), c.get("region"), c.get("industry"), c.get("churn_risk"),
+                 json.dumps(c)),
+            )
+            for gram in grams:
+                gram_rows.append((gram, rowid))
+                df[gram] = df.get(gram, 0) + 1
+        conn.executemany("INSERT INTO client_ngrams VALUES (?, ?)", gram_rows)
+        conn.executemany("INSERT INTO ngram_df VALUES (?, ?)", df.items())
+
+        conn.executemany(
+            "INSERT INTO contracts (id, client_id, end_date, data) VALUES (?, ?, ?, ?)",
+            [(c.get("id"), c.get("client_id"), c.get("end_date"), json.dumps(c)) for c in datasets["contracts"]],
+        )
+        conn.executemany(
+            "INSERT INTO associates (id, name_norm, data) VALUES (?, ?, ?)",
+            [(a.get("id"), normalize_name(a.get("name")), json.dumps(a)) for a in datasets["associates"]],
+        )
+        conn.executemany(
+            "INSERT INTO performance (associate_id, data) VALUES (?, ?)",
+            [(p.get("associate_id"), json.dumps(p)) for p in datasets["performance"]],
+        )
+
+        metrics = datasets["metrics"]
+        if isinstance(metrics, dict):
+            metrics = [dict(r, client_id=r.get("client_id", cid)) for cid, rows in metrics.items() for r in rows]
+        # Duplicate (client, month) records keep the last one, as in MetricsStore
+        conn.executemany(
+            "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?)",
+            [(m["client_id"], m["month"], json.dumps(m)) for m in metrics if m.get("client_id") and m.get("month")],
+        )
+
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("imported_at", str(time.time())),
+            ("source_hashes", json.dumps(file_hashes)),
+        ])
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+    logger.info(f"Imported {len(datasets['clients'])} clients into {db_path}")
+    return db_path
+
+
+class SqliteDataStore:
+    """Read-only query interface over a database built by import_json()."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(
+                f"SQLite data store not found at {db_path}. Run scripts/import_to_sqlite.py first."
+            )
+        self.db_path = db_path
+        self.data_dir = None
+        self.loaded_at = time.time()
+        self._local = threading.local()
+        self._metrics_store = None
+        self._aggregates = None
+        self._risk_scores = None
+        # Whole-table views, parsed once; the database is read-only while served
+        self._datasets = {}
+        self._lock = threading.Lock()
+        meta = dict(self._conn().execute("SELECT key, value FROM meta").fetchall())
+        self.file_hashes = json.loads(meta.get("source_hashes", "{}"))
+        self.version = f"sqlite-{meta.get('imported_at', '0').split('.')[0]}"
+        self._client_count = self._conn().execute("SELECT COUNT(*) FROM clients").fetchone()[0]
+
+    def _conn(self):
+        # sqlite3 connections are not shareable across threads; keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def _one(self, sql, params=()):
+        row = self._conn().execute(sql, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _all(self, sql, params=()):
+        return tuple(json.loads(row[0]) for row in self._conn().execute(sql, params))
+
+    def _dataset(self, table, order="rowid"):
+        if table not in self._datasets:
+            with self._lock:
+                if table not in self._datasets:
+                    self._datasets[table] = self._all(f"SELECT data FROM {table} ORDER BY {order}")
+        return self._datasets[table]
+
+    # Whole-dataset views, for portfolio-wide (executive) questions
+
+    @property
+    def clients(self):
+        return self._dataset("clients")
+
+    @property
+    def contracts(self):
+        return self._dataset("contracts")
+
+    @property
+    def associates(self):
+        return self._dataset("associates")
+
+    @property
+    def performance(self):
+        return self._dataset("performance")
+
+    @property
+    def metrics(self):
+        return self._dataset("metrics", order="client_id, month")
+
+    @property
+    def metrics_store(self):
+        """Columnar metrics for vectorized portfolio queries, built on first use."""
+        if self._metrics_store is None:
+            with self._lock:
+                if self._metrics_store is None:
+                    self._metrics_store = MetricsStore(list(self.metrics))
+        return self._metrics_store
+
+    @property
+    def aggregates(self):
+        """Portfolio rollups, computed once; the database is read-only while served."""
+        if self._aggregates is None:
+            with self._lock:
+                if self._aggregates is None:
+                    self._aggregates = PortfolioAggregates(self.clients, resolve_associate=self.get_associate)
+        return self._aggregates
+
+    def risk_scores(self):
+        """Churn-risk scores for every client, computed once."""
+        if self._risk_scores is None:
+            self._risk_scores = score_portfolio(self.metrics_store)
+        return self._risk_scores
+
+    # Query interface, mirrors DataSnapshot
+
+    def get_client_by_id(self, client_id):
+        """Exact id match, like ClientRegistry; resolve_client() also accepts ids case-insensitively."""
+        if client_id is None:
+            return None
+        return self._one("SELECT data FROM clients WHERE id_norm = ? AND id = ? ORDER BY rowid LIMIT 1",
+                         (str(client_id).lower(), str(client_id)))
+
+    def get_client(self, name):
+        if not name:
+            return None
+        # Same order as ClientRegistry.get_client: exact name, substring, confident fuzzy match
+        exact = self._one("SELECT data FROM clients WHERE name_norm = ? ORDER BY rowid LIMIT 1",
+                          (normalize_name(name),))
+        if exact:
+            return exact
+        pattern = normalize_name(name).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        client = self._one("SELECT data FROM clients WHERE name_norm LIKE ? ESCAPE '\\' ORDER BY rowid LIMIT 1",
+                           (f"%{pattern}%",))
+        if client:
+            return client
+        match = ClientNameResolver.confident_match(self.resolve_client(name), name)
+        return match.client if match else None
+
+    def resolve_client(self, name, limit=5):
+        key = normalize_name(name)
+        if not key:
+            return []
+
+        by_id = self._one("SELECT data FROM clients WHERE id_norm = ? ORDER BY rowid LIMIT 1", (key,))
+        if by_id:
+            return [ClientMatch(by_id, 1.0)]
+        exact = self._all("SELECT data FROM clients WHERE name_norm = ? ORDER BY rowid LIMIT ?", (key, limit))
+        if exact:
+            return [ClientMatch(c, 1.0) for c in exact]
+
+        query_grams = ngrams(key)
+        placeholders = ",".join("?" * len(query_grams))
+        conn = self._conn()
+        df = dict(conn.execute(f"SELECT gram, df FROM ngram_df WHERE gram IN ({placeholders})",
+                               tuple(query_grams)).fetchall())
+        max_df = selective_postings_limit(self._client_count)
+        grams = [g for g, n in df.items() if n <= max_df] or list(df)
+        if not grams:
+            return []
+
+        placeholders = ",".join("?" * len(grams))
+        rows = conn.execute(
+            f"""SELECT c.rowid, c.name_norm, c.gram_count, c.data, COUNT(*) AS overlap
+                FROM client_ngrams g JOIN clients c ON c.rowid = g.client_rowid
+                WHERE g.gram IN ({placeholders})
+                GROUP BY g.client_rowid ORDER BY overlap DESC, c.rowid LIMIT ?""",
+            (*grams, candidate_pool_size(limit)),
+        ).fetchall()
+
+        scored = []
+        for rowid, name_norm, gram_count, data, _ in rows:
+            score = score_name(key, query_grams, name_norm, gram_count)
+            if score >= MIN_SCORE:
+                scored.append((score, rowid, data))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [ClientMatch(json.loads(data), round(score, 3)) for score, _, data in scored[:limit]]
+
+    def client_summaries(self):
+        rows = self._conn().execute("SELECT name, id, industry FROM clients ORDER BY rowid")
+        return [{"name": name, "id": cid, "industry": industry} for name, cid, industry in rows]
+
+    def get_contract(self, client_id):
+        return self._one("SELECT data FROM contracts WHERE client_id = ? ORDER BY rowid LIMIT 1", (client_id,))
+
+    def contracts_ending_between(self, start_date, end_date):
+        """Contracts whose end_date (YYYY-MM-DD) falls in [start_date, end_date]."""
+        return self._all("SELECT data FROM contracts WHERE end_date BETWEEN ? AND ? ORDER BY end_date",
+                         (start_date, end_date))
+
+    def get_associate(self, ref):
+        """Resolves an associate by name or by id (clients store either)."""
+        if not ref:
+            return None
+        assoc = self._one("SELECT data FROM associates WHERE name_norm = ? ORDER BY rowid LIMIT 1",
+                          (normalize_name(ref),))
+        return assoc or self._one("SELECT data FROM associates WHERE id = ? ORDER BY rowid LIMIT 1", (ref,))
+
+    def get_associate_info(self, client_id):
+        client = self.get_client_by_id(client_id)
+        if not client:
+            return None
+
+        assoc = self.get_associate(client.get("assigned_associate"))
+        if not assoc:
+            return None
+
+        perf = self._one("SELECT data FROM performance WHERE associate_id = ? ORDER BY rowid LIMIT 1",
+                         (assoc.get("id"),))
+        return {"profile": assoc, "performance": perf}
+
+    def get_metrics(self, client_id):
+        return list(self._all("SELECT data FROM metrics WHERE client_id = ? ORDER BY month", (client_id,)))
+
+    def get_metric_changes(self, client_id):
+        series = {}
+        for record in self.get_metrics(client_id):
+            for name, value in record.get("metrics", {}).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    series.setdefault(name, []).append(value)
+        return {name: round(float(values[-1] - values[-2]), 2)
+                for name, values in series.items() if len(values) >= 2}
+
+    def memory_report(self):
+        """Row counts per table and the on-disk size; only cached views live in RAM."""
+        conn = self._conn()
+        report = {name: {"records": conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]}
+                  for name in TABLES}
+        report["db_file_bytes"] = os.path.getsize(self.db_path)
+        if self._metrics_store is not None:
+            report["metrics_store"] = {"bytes": deep_sizeof(self._metrics_store)}
+        if self._aggregates is not None:
+            report["aggregates"] = {"bytes": deep_sizeof(self._aggregates)}
+        return report
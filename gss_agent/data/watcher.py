@@ -0,0 +1,98 @@
+"""
+Background hot reload of the JSON datasets.
+
+SnapshotWatcher polls the dataset files under the snapshot's data directory.
+A changed mtime/size only triggers a content-hash comparison; a rebuild happens
+when the bytes actually differ. The new DataSnapshot (with all its indexes) is
+built on the watcher thread and swapped in with swap_snapshot(), so requests
+already holding the old snapshot finish on it and new requests see fresh data.
+No API restart, so the in-memory MemorySaver threads survive.
+"""
+import logging
+import os
+import threading
+
+from gss_agent.data.snapshot import DATASET_FILES, file_digest, get_snapshot, load_snapshot, swap_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotWatcher:
+    def __init__(self, data_dir=None, interval=5.0, on_swap=None):
+        self.data_dir = data_dir or get_snapshot().data_dir
+        self.interval = interval
+        # Optional callback(old_snapshot, new_snapshot) run after each swap
+        self.on_swap = on_swap
+        self.reloads = 0
+        self.last_error = None
+        self._stats = self._stat_files()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _stat_files(self):
+        stats = {}
+        for filename in DATASET_FILES.values():
+            try:
+                st = os.stat(os.path.join(self.data_dir, filename))
+                stats[filename] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                stats[filename] = None
+        return stats
+
+    def check_once(self):
+        """Reloads if any dataset's content changed. Returns True if a swap happened."""
+        stats = self._stat_files()
+        if stats == self._stats:
+            return False
+
+        current = get_snapshot()
+        hashes = {filename: file_digest(os.path.join(self.data_dir, filename))
+                  for filename in DATASET_FILES.values()}
+        if hashes == current.file_hashes:
+            # Touched but not modified
+            self._stats = stats
+            return False
+
+        try:
+            snapshot = load_snapshot(self.data_dir, strict=True, previous=current)
+        except Exception as e:
+            # Most likely a file caught mid-write; keep serving the current
+            # snapshot and retry on the next tick (stats are left stale on purpose).
+            self.last_error = str(e)
+            logger.warning(f"Data reload skipped, keeping snapshot {current.version}: {e}")
+            return False
+
+        previous = swap_snapshot(snapshot)
+        self._stats = stats
+        self.reloads += 1
+        self.last_error = None
+        logger.info(f"Data snapshot swapped: {previous.version if previous else None} -> {snapshot.version}")
+        if self.on_swap:
+            try:
+                self.on_swap(previous, snapshot)
+            except Exception as e:
+                logger.error(f"Snapshot swap callback failed: {e}")
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check_once()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Data watcher error: {e}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nexus-data-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {self.data_dir} for data changes every {self.interval}s")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
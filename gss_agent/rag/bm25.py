@@ -0,0 +1,142 @@
+"""
+In-process BM25 inverted index.
+
+Research titles such as "Magic Quadrant for Cloud Database Management Systems
+2024" are exact-term heavy, and embedding search often ranks them poorly.
+BM25Index scores documents by term overlap (Okapi BM25) from postings lists
+built once per corpus; the hybrid retriever (rag/hybrid.py) fuses its ranking
+with the vector ranking.
+
+Document frequencies are kept up to date by add() and remove(), so scoring a
+query term costs one lookup. Removed documents leave a tombstone in their
+postings; once tombstones make up COMPACT_FRACTION of the slots, the index is
+compacted.
+"""
+import heapq
+import math
+import re
+from collections import Counter
+
+from gss_agent.rag.filters import matches_where
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the their this to was were will with"
+    .split()
+)
+# Share of tombstoned document slots that triggers a compaction
+COMPACT_FRACTION = 0.25
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> {doc position: term frequency}
+        self.postings = {}
+        # term -> number of live documents containing it
+        self.df = {}
+        self.doc_ids = []
+        self.doc_lengths = []
+        self.doc_terms = []
+        self.metadatas = []
+        self._positions = {}
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._positions)
+
+    @classmethod
+    def build(cls, ids, documents, metadatas=None, **params):
+        index = cls(**params)
+        for i, (doc_id, text) in enumerate(zip(ids, documents)):
+            index.add(doc_id, text, metadatas[i] if metadatas else None)
+        return index
+
+    def add(self, doc_id, text, metadata=None):
+        if doc_id in self._positions:
+            self.remove(doc_id)
+        pos = len(self.doc_ids)
+        terms = Counter(tokenize(text))
+        self.doc_ids.append(doc_id)
+        self.doc_lengths.append(sum(terms.values()))
+        self.doc_terms.append(tuple(terms))
+        self.metadatas.append(metadata)
+        self._positions[doc_id] = pos
+        self._total_length += self.doc_lengths[pos]
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[pos] = tf
+            self.df[term] = self.df.get(term, 0) + 1
+
+    def remove(self, doc_id):
+        pos = self._positions.pop(doc_id, None)
+        if pos is None:
+            return
+        # Postings are left in place and skipped at query time via the tombstone
+        self._total_length -= self.doc_lengths[pos]
+        self.doc_ids[pos] = None
+        for term in self.doc_terms[pos]:
+            self.df[term] -= 1
+            if not self.df[term]:
+                del self.df[term]
+        if len(self.doc_ids) - len(self) > COMPACT_FRACTION * len(self.doc_ids):
+            self.compact()
+
+    def compact(self):
+        """Drops tombstoned documents and renumbers the live ones."""
+        live = [pos for pos, doc_id in enumerate(self.doc_ids) if doc_id is not None]
+        renumber = {old: new for new, old in enumerate(live)}
+        postings = {}
+        for term, entries in self.postings.items():
+            kept = {renumber[pos]: tf for pos, tf in entries.items() if pos in renumber}
+            if kept:
+                postings[term] = kept
+        self.postings = postings
+        self.doc_ids = [self.doc_ids[pos] for pos in live]
+        self.doc_lengths = [self.doc_lengths[pos] for pos in live]
+        self.doc_terms = [self.doc_terms[pos] for pos in live]
+        self.metadatas = [self.metadatas[pos] for pos in live]
+        self._positions = {doc_id: pos for pos, doc_id in enumerate(self.doc_ids)}
+
+    def idf(self, term):
+        df = self.df.get(term, 0)
+        n = len(self)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query, top_k=10, where=None):
+        """[(doc_id, score)] for the best `top_k` documents, highest score first."""
+        if not len(self):
+            return []
+        avg_length = self._total_length / len(self)
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for pos, tf in postings.items():
+                if self.doc_ids[pos] is None:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[pos] / avg_length)
+                scores[pos] = scores.get(pos, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        if where:
+            scores = {pos: s for pos, s in scores.items() if matches_where(self.metadatas[pos], where)}
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.doc_ids[pos], score) for pos, score in best]
+
+
+def reciprocal_rank_fusion(rankings, k=60, weights=None):
+    """
+    Fuses several ranked id lists: score(d) = sum(weight / (k + rank)). Returns
+    [(doc_id, score)] best first; ties keep the order of first appearance.
+    """
+    fused = {}
+    for i, ranking in enumerate(rankings):
+        weight = weights[i] if weights else 1.0
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda item: -item[1])
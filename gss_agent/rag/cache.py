@@ -0,0 +1,73 @@
+"""
+Bounded caches for the RAG layer.
+
+The Supervisor, ClientIntel and ContentMatch agents often repeat the same
+search within one brief, and across briefs for the same client. NexusVectorStore
+keeps two LRUCaches: query text -> query embedding (the embedding model is the
+expensive part of a search), and (collection, version, query, filters,
+n_results) -> Chroma result with a TTL. Ingestion bumps the collection version,
+so results cached before an ingest are never served after it; the TTL bounds
+staleness when another process writes to the same Chroma directory.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_query(query):
+    """Collapses whitespace so trivially different spellings share a cache entry."""
+    return " ".join((query or "").split())
+
+
+class LRUCache:
+    def __init__(self, maxsize=256, ttl=None):
+        self.maxsize = maxsize
+        # Seconds an entry stays valid; None keeps entries until evicted
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
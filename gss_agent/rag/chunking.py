@@ -0,0 +1,71 @@
+"""
+Chunk-level indexing of long interaction transcripts.
+
+LLM-generated meeting notes and transcripts run to hundreds or thousands of
+words. Embedded whole, their vectors blur, and a hit returns the entire text
+into the agent context. Ingestion instead indexes each transcript's `content`
+as overlapping word windows. Every window carries its interaction id as
+`parent_id` metadata, next to the interaction's summary document.
+aggregate_by_parent() folds a ranked chunk-level result back into one entry
+per interaction that keeps only its best-matching passages.
+"""
+
+CHUNK_WORDS = 150
+CHUNK_OVERLAP = 30
+# Candidate chunks fetched per requested interaction before aggregation
+CHUNK_FANOUT = 4
+PASSAGES_PER_PARENT = 2
+PASSAGE_SEPARATOR = "\n\n[...]\n\n"
+
+
+def chunk_text(text, chunk_words=CHUNK_WORDS, overlap=CHUNK_OVERLAP):
+    """Overlapping windows of `chunk_words` words; [] for empty text."""
+    words = (text or "").split()
+    if not words:
+        return []
+    step = max(chunk_words - overlap, 1)
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start:start + chunk_words]))
+        if start + chunk_words >= len(words):
+            break
+    return chunks
+
+
+def chunk_id(parent_id, index):
+    return f"{parent_id}#chunk-{index}"
+
+
+def aggregate_by_parent(result, n_results, passages_per_parent=PASSAGES_PER_PARENT):
+    """
+    Collapses a ranked, Chroma-shaped single-query result over chunks into at
+    most `n_results` parents, in order of their best chunk. Each parent's
+    document is its best `passages_per_parent` passages; score lists
+    (distances/scores) keep the best chunk's value.
+    """
+    ids = result["ids"][0]
+    documents = (result.get("documents") or [[None] * len(ids)])[0]
+    metadatas = (result.get("metadatas") or [[None] * len(ids)])[0]
+
+    parents = {}
+    for pos, doc_id in enumerate(ids):
+        meta = metadatas[pos] or {}
+        parent_id = meta.get("parent_id", doc_id)
+        entry = parents.get(parent_id)
+        if entry is None:
+            if len(parents) >= n_results:
+                continue
+            entry = parents[parent_id] = {"best": pos, "passages": []}
+        if len(entry["passages"]) < passages_per_parent and documents[pos] is not None:
+            entry["passages"].append(documents[pos])
+
+    aggregated = {
+        "ids": [list(parents)],
+        "documents": [[PASSAGE_SEPARATOR.join(e["passages"]) for e in parents.values()]],
+        "metadatas": [[{k: v for k, v in (metadatas[e["best"]] or {}).items() if k != "chunk_index"}
+                       for e in parents.values()]],
+    }
+    for key in ("distances", "scores"):
+        if result.get(key):
+            aggregated[key] = [[result[key][0][e["best"]] for e in parents.values()]]
+    return aggregated
@@ -0,0 +1,101 @@
+"""
+Near-duplicate detection for ingestion.
+
+content.json holds many reports with the same title and boilerplate (or
+empty) abstracts, because the generators reuse RESEARCH_TITLES. Indexed as-is,
+they bloat the collection, and a top-k search spends several slots on copies
+of one report. cluster_near_duplicates() groups documents whose word-shingle
+sets have an estimated Jaccard similarity of at least `threshold`:
+
+  - every text gets a MinHash signature (NUM_PERM universal hash functions)
+  - LSH splits the signatures into bands; documents sharing any band become
+    candidate pairs, so the cost stays near-linear rather than all-pairs
+  - candidates are confirmed by signature agreement and merged (union-find)
+
+NexusVectorStore.ingest_*(dedup=True) indexes one canonical document per
+cluster (the one with the longest text) and records the collapsed ids in its
+`aliases` metadata.
+"""
+import re
+import zlib
+
+import numpy as np
+
+NUM_PERM = 64
+LSH_BANDS = 16
+SHINGLE_WORDS = 3
+DEDUP_THRESHOLD = 0.7
+# Universal hashing modulo a Mersenne prime; 31-bit inputs keep a * x within uint64
+_PRIME = (1 << 31) - 1
+
+
+def shingles(text, size=SHINGLE_WORDS):
+    """Set of `size`-word shingles of the lowercased text (the whole text if shorter)."""
+    words = re.findall(r"\w+", (text or "").lower())
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingle_set):
+        hashes = np.fromiter((zlib.crc32(s.encode()) & _PRIME for s in shingle_set), dtype=np.uint64,
+                             count=len(shingle_set))
+        return ((self.a[:, None] * hashes[None, :] + self.b[:, None]) % _PRIME).min(axis=1)
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_near_duplicates(texts, threshold=DEDUP_THRESHOLD, keys=None, num_perm=NUM_PERM, bands=LSH_BANDS):
+    """
+    Clusters of indexes into `texts` (singletons included), in order of first
+    member. With `keys`, only texts with equal keys can cluster (e.g. the
+    interactions of one client).
+    """
+    hasher = MinHasher(num_perm)
+    signatures = [hasher.signature(shingles(text)) for text in texts]
+    keys = list(keys) if keys is not None else [None] * len(texts)
+    rows = num_perm // bands
+
+    parent = list(range(len(texts)))
+    buckets = {}
+    for i, signature in enumerate(signatures):
+        for band in range(bands):
+            bucket = (keys[i], band, signature[band * rows:(band + 1) * rows].tobytes())
+            for j in buckets.setdefault(bucket, []):
+                root_i, root_j = _find(parent, i), _find(parent, j)
+                if root_i != root_j and np.mean(signatures[i] == signatures[j]) >= threshold:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+            buckets[bucket].append(i)
+
+    clusters = {}
+    for i in range(len(texts)):
+        clusters.setdefault(_find(parent, i), []).append(i)
+    return list(clusters.values())
+
+
+def collapse_duplicates(items, text_of, threshold=DEDUP_THRESHOLD, key_of=None):
+    """
+    (canonical_items, aliases): one item per near-duplicate cluster, the one
+    with the longest text, and {canonical_id: [alias ids]} for the rest.
+    """
+    texts = [text_of(item) for item in items]
+    keys = [key_of(item) for item in items] if key_of else None
+    canonical, aliases = [], {}
+    for cluster in cluster_near_duplicates(texts, threshold, keys):
+        best = max(cluster, key=lambda i: (len(texts[i]), -i))
+        canonical.append(items[best])
+        others = [items[i]["id"] for i in cluster if i != best]
+        if others:
+            aliases[items[best]["id"]] = others
+    return canonical, aliases
@@ -0,0 +1,154 @@
+"""
+Parallel, batched embedding for bulk vector store ingestion.
+
+Handing Chroma the whole document list embeds it serially on one core inside
+collection.upsert(). EmbeddingPipeline instead cuts the documents into
+batches, embeds them across a process pool (each worker loads its own copy of
+the embedding model once) and upserts every batch with precomputed embeddings
+as soon as it comes back, so writes overlap with the embedding of later
+batches. Only a bounded number of batches is in flight at a time, so memory
+stays flat however large the corpus is.
+
+The documents must be embedded by the same model the store embeds queries
+with. By default the pipeline builds its workers' function from the store's
+embedding function class; an explicit factory that builds a different one is
+refused. The process pool is started on the first upsert and reused until
+close(), so each worker loads the model once per pipeline, not per upsert.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+DEFAULT_BATCH_SIZE = 256
+
+
+def default_embedding_function():
+    from chromadb.utils import embedding_functions
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
+# Per-process embedding function, created once by the pool initializer
+_worker_embedding_fn = None
+
+
+def _init_worker(factory):
+    global _worker_embedding_fn
+    _worker_embedding_fn = factory()
+
+
+def _embed_batch(texts):
+    return [list(map(float, vector)) for vector in _worker_embedding_fn(texts)]
+
+
+def _describe(embedding_fn):
+    """(class, config) of an embedding function, used to tell whether two embed alike."""
+    try:
+        config = embedding_fn.get_config()
+    except Exception:
+        config = None
+    return type(embedding_fn), config
+
+
+class EmbeddingPipeline:
+    def __init__(self, embedding_factory=None, workers=None, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+        # embedding_factory must be picklable (a module-level callable) to reach the workers.
+        # None rebuilds the target store's embedding function from its class with no arguments.
+        self.embedding_factory = embedding_factory
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.batch_size = batch_size
+        # Optional callback(done, total, docs_per_sec) after each written batch
+        self.progress = progress
+        self._pool = None
+        self._pool_factory = None
+        self._inline = {}
+
+    def _factory_for(self, embedding_function):
+        """The factory to embed with for a store that embeds queries with `embedding_function`."""
+        if embedding_function is None:
+            return self.embedding_factory or default_embedding_function
+        factory = self.embedding_factory or type(embedding_function)
+        try:
+            built = _describe(self._embedder(factory))
+        except TypeError:
+            built = None
+        if built != _describe(embedding_function):
+            raise ValueError(f"Embedding pipeline can't build the store's {type(embedding_function).__name__} "
+                             "as configured; pass an embedding_factory that does.")
+        return factory
+
+    def _embedder(self, factory):
+        # Built once per factory; creating one doesn't load the model yet
+        if factory not in self._inline:
+            self._inline[factory] = factory()
+        return self._inline[factory]
+
+    def _get_pool(self, factory):
+        if self._pool is not None and self._pool_factory is not factory:
+            self.close()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(factory,))
+            self._pool_factory = factory
+        return self._pool
+
+    def close(self):
+        """Shuts the worker processes down."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_factory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _batches(self, ids, documents, metadatas):
+        for i in range(0, len(ids), self.batch_size):
+            yield (ids[i:i + self.batch_size], documents[i:i + self.batch_size],
+                   metadatas[i:i + self.batch_size] if metadatas else None)
+
+    def upsert(self, collection, ids, documents, metadatas=None, embedding_function=None):
+        """
+        Embeds and upserts the documents batch by batch. `embedding_function`
+        is the one the store embeds queries with. Returns
+        {"documents", "batches", "seconds", "docs_per_sec"}.
+        """
+        started = time.perf_counter()
+        total = len(ids)
+        stats = {"documents": 0, "batches": 0}
+        factory = self._factory_for(embedding_function)
+
+        def write(batch, embeddings):
+            batch_ids, batch_docs, batch_metas = batch
+            collection.upsert(ids=batch_ids, documents=batch_docs, metadatas=batch_metas, embeddings=embeddings)
+            stats["documents"] += len(batch_ids)
+            stats["batches"] += 1
+            if self.progress:
+                elapsed = time.perf_counter() - started
+                self.progress(stats["documents"], total, stats["documents"] / elapsed if elapsed else 0.0)
+
+        if total and self.workers <= 1:
+            embed = embedding_function if embedding_function is not None else self._embedder(factory)
+            for batch in self._batches(ids, documents, metadatas):
+                write(batch, [list(map(float, v)) for v in embed(batch[1])])
+        elif total:
+            pool = self._get_pool(factory)
+            pending = {}
+            batches = self._batches(ids, documents, metadatas)
+            # Keep two batches per worker in flight: workers never idle while
+            # the main process writes, and memory stays bounded.
+            for batch in batches:
+                pending[pool.submit(_embed_batch, batch[1])] = batch
+                if len(pending) >= 2 * self.workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        write(pending.pop(future), future.result())
+            for future in list(pending):
+                write(pending.pop(future), future.result())
+
+        seconds = time.perf_counter() - started
+        stats["seconds"] = round(seconds, 3)
+        stats["docs_per_sec"] = round(stats["documents"] / seconds, 1) if seconds else 0.0
+        return stats
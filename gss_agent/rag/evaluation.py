@@ -0,0 +1,167 @@
+"""
+Offline retrieval evaluation against the golden labels in the data files.
+
+generate_clients_detailed.py marks a few clients as golden
+(`evaluation_metadata.is_golden_client` / `target_retrieval_id`), and the
+research generators mark evaluation items (`evaluation_metadata.is_target`).
+golden_queries() turns those labels into a fixed, deterministic query set:
+
+  interaction  for every interaction of a golden client, the opening words of
+               its summary (and of its transcript, if any) must retrieve that
+               interaction, both unscoped and scoped to the client. Leads are
+               verbatim text and sit near ceiling, so every identified action
+               is also asked as a keyword query: its topic words without the
+               action verbs and scheduling words ("Send 'Market Guide for
+               Managed Edge Services' by Friday" -> "market guide managed edge
+               services"). Interactions listing an action with the same
+               keywords count as hits
+  research     for every evaluation research item (every item if none is
+               flagged), its title, truncated title and abstract lead must
+               retrieve it. Reports sharing the exact title count as hits
+
+`target_retrieval_id` is not used: the generator fills it with a "GC-<n>"
+label made from the client's list position, which names no interaction or
+research item, so there is nothing for a search to retrieve.
+
+evaluate() runs a query set through a search callable and reports recall@k,
+MRR and latency percentiles. A ranked entry may be a tuple of ids sharing one
+rank: a canonical document and the near-duplicates collapsed into it
+(ranked_ids() reads them from the `aliases` metadata). scripts/benchmark_retrieval.py uses it to compare
+backends and retriever configurations.
+"""
+import statistics
+import time
+
+from gss_agent.rag.bm25 import tokenize
+
+LEAD_WORDS = 12
+TITLE_WORDS = 4
+KEYWORDS = 6
+# Action verbs, people and scheduling words that say nothing about what an action is about
+FILLER_WORDS = frozenset(
+    "send schedule review prepare provide draft retrieve locate email forward attach facilitate leverage "
+    "follow up call inquiry session eod end day today week weeks next before after within minute hour "
+    "monday tuesday wednesday thursday friday client analyst nexus advisory team".split()
+)
+
+
+def lead(text, words=LEAD_WORDS):
+    return " ".join((text or "").split()[:words])
+
+
+def keywords(text, limit=KEYWORDS):
+    """Up to `limit` distinct topic words of `text`, in order."""
+    words = []
+    for term in tokenize(text):
+        if term not in FILLER_WORDS and not term.isdigit() and term not in words:
+            words.append(term)
+    return " ".join(words[:limit])
+
+
+def golden_queries(clients, interactions, research):
+    """[{"collection", "kind", "query", "relevant": [ids], "client_id"}] in a stable order."""
+    queries = []
+    golden = {c["id"] for c in clients if (c.get("evaluation_metadata") or {}).get("is_golden_client")}
+    by_action = {}
+    for item in interactions:
+        for action in item.get("actions_identified") or ():
+            by_action.setdefault(keywords(action), []).append(item)
+    for item in interactions:
+        if item.get("client_id") not in golden:
+            continue
+        texts = [("summary lead", lead(item.get("summary"))), ("transcript lead", lead(item.get("content")))]
+        texts += [("action keywords", keywords(action)) for action in item.get("actions_identified") or ()]
+        for kind, text in texts:
+            if not text:
+                continue
+            for client_id in (None, item["client_id"]):
+                relevant = [item["id"]]
+                if kind == "action keywords":
+                    relevant += [other["id"] for other in by_action[text] if other["id"] not in relevant
+                                 and client_id in (None, other["client_id"])]
+                queries.append({
+                    "collection": "interactions",
+                    "kind": kind + (" (scoped)" if client_id else ""),
+                    "query": text,
+                    "relevant": relevant,
+                    "client_id": client_id,
+                })
+
+    targets = [r for r in research if (r.get("evaluation_metadata") or {}).get("is_target")] or research
+    by_title = {}
+    for item in research:
+        by_title.setdefault(item["title"], []).append(item["id"])
+    for item in targets:
+        relevant = by_title[item["title"]]
+        variants = [("title", item["title"]), ("truncated title", lead(item["title"], TITLE_WORDS)),
+                    ("abstract lead", lead(item.get("abstract")))]
+        for kind, text in variants:
+            if text:
+                queries.append({"collection": "research", "kind": kind, "query": text,
+                                "relevant": relevant if kind != "abstract lead" else [item["id"]],
+                                "client_id": None})
+    return queries
+
+
+def ranked_ids(result):
+    """Ranking of a single-query search result, each entry (id, *aliases)."""
+    metadatas = result.get("metadatas") or [[None] * len(result["ids"][0])]
+    return [(doc_id, *filter(None, ((meta or {}).get("aliases") or "").split(",")))
+            for doc_id, meta in zip(result["ids"][0], metadatas[0])]
+
+
+def _matches(entry, relevant):
+    return bool(relevant.intersection(entry if isinstance(entry, tuple) else (entry,)))
+
+
+def recall_at_k(ranked, relevant, k):
+    """1.0 if any relevant id is in the top k. Relevant ids are equivalent (e.g. copies of one report)."""
+    relevant = set(relevant)
+    return 1.0 if any(_matches(entry, relevant) for entry in ranked[:k]) else 0.0
+
+
+def reciprocal_rank(ranked, relevant):
+    relevant = set(relevant)
+    for rank, entry in enumerate(ranked, 1):
+        if _matches(entry, relevant):
+            return 1.0 / rank
+    return 0.0
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(int(p * len(values)), len(values) - 1)] if values else 0.0
+
+
+def summarize(recalls, rrs, latencies):
+    return {
+        "queries": len(recalls),
+        "recall": round(statistics.mean(recalls), 4) if recalls else 0.0,
+        "mrr": round(statistics.mean(rrs), 4) if rrs else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+    }
+
+
+def evaluate(search, queries, k):
+    """
+    Runs every query through search(query_dict, n_results) -> ranking and
+    returns {"overall": {...}, "by_kind": {kind: {...}}} with recall@k, MRR
+    (over the returned ranking) and latency percentiles in milliseconds.
+    """
+    overall = ([], [], [])
+    by_kind = {}
+    for query in queries:
+        started = time.perf_counter()
+        ranked = search(query, k)
+        elapsed = (time.perf_counter() - started) * 1000
+        scores = (recall_at_k(ranked, query["relevant"], k), reciprocal_rank(ranked, query["relevant"]), elapsed)
+        key = f"{query['collection']}/{query['kind']}"
+        for bucket in (overall, by_kind.setdefault(key, ([], [], []))):
+            for values, value in zip(bucket, scores):
+                values.append(value)
+    return {
+        "overall": summarize(*overall),
+        "by_kind": {kind: summarize(*values) for kind, values in sorted(by_kind.items())},
+    }
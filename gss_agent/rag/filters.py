@@ -0,0 +1,131 @@
+"""
+Structured metadata filters for research and interaction search.
+
+Ingestion stores filterable metadata next to each document: interaction
+`date_ts`, `sentiment_label` (the free-text sentiment bucketed into
+Positive/Neutral/Negative/Mixed) and `type`; research `published_ts` and one
+`tag_<name>` boolean per tag (Chroma can't filter inside the comma-joined
+`tags` string). research_filter() and interaction_filter() turn search
+arguments into a Chroma `where` clause, so filtering is pushed down into the
+collection query instead of over-fetching and post-filtering.
+
+matches_where() evaluates the same clauses in process for the retrievers that
+run next to Chroma (BM25).
+"""
+import re
+from datetime import date, datetime, timezone
+
+NEGATIVE_CUES = ("negative", "anxious", "anxiety", "tense", "concern", "stress", "critical", "pressure",
+                 "apprehensive", "high-stakes", "frustrat")
+POSITIVE_CUES = ("positive", "optimistic", "collaborative", "constructive", "reassur", "proactive",
+                 "forward-looking")
+
+_COMPARATORS = {
+    "$eq": lambda value, arg: value == arg,
+    "$ne": lambda value, arg: value != arg,
+    "$gt": lambda value, arg: value is not None and value > arg,
+    "$gte": lambda value, arg: value is not None and value >= arg,
+    "$lt": lambda value, arg: value is not None and value < arg,
+    "$lte": lambda value, arg: value is not None and value <= arg,
+    "$in": lambda value, arg: value in arg,
+    "$nin": lambda value, arg: value not in arg,
+}
+
+
+def matches_where(metadata, where):
+    """True if a metadata dict satisfies the filter (None/empty matches everything)."""
+    if not where:
+        return True
+    metadata = metadata or {}
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_where(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_where(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for op, arg in condition.items():
+                comparator = _COMPARATORS.get(op)
+                if comparator is None:
+                    raise ValueError(f"Unsupported filter operator '{op}'.")
+                try:
+                    if not comparator(value, arg):
+                        return False
+                except TypeError:
+                    # Comparing incompatible types (e.g. str vs int) never matches
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+def date_to_ts(value):
+    """Unix timestamp (UTC midnight) for a YYYY-MM-DD string or date; None if unparseable."""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, str):
+        try:
+            value = date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    if not isinstance(value, date):
+        return None
+    return int(datetime(value.year, value.month, value.day, tzinfo=timezone.utc).timestamp())
+
+
+def tag_key(tag):
+    return "tag_" + re.sub(r"[^a-z0-9]+", "_", tag.lower()).strip("_")
+
+
+def sentiment_label(sentiment):
+    """Buckets free-text sentiment ("Cautiously Optimistic", "Urgent / Stressed") into four labels."""
+    text = (sentiment or "").lower()
+    for label in ("Positive", "Negative", "Neutral", "Mixed"):
+        if text == label.lower():
+            return label
+    if text.startswith("mixed"):
+        return "Mixed"
+    negative = any(cue in text for cue in NEGATIVE_CUES)
+    positive = any(cue in text for cue in POSITIVE_CUES)
+    if negative and positive:
+        return "Mixed"
+    if negative:
+        return "Negative"
+    if positive:
+        return "Positive"
+    return "Neutral"
+
+
+def combine_where(clauses):
+    clauses = [c for c in clauses if c]
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def research_filter(tags=None, published_after=None, published_before=None):
+    """Where clause for research: every tag must be present; dates are inclusive YYYY-MM-DD."""
+    clauses = [{tag_key(tag): True} for tag in (tags or [])]
+    if published_after:
+        clauses.append({"published_ts": {"$gte": date_to_ts(published_after)}})
+    if published_before:
+        clauses.append({"published_ts": {"$lte": date_to_ts(published_before)}})
+    return combine_where(clauses)
+
+
+def interaction_filter(client_id=None, sentiment=None, interaction_type=None, since=None, until=None):
+    """Where clause for interactions; `sentiment` is one of the sentiment_label() buckets."""
+    clauses = []
+    if client_id:
+        clauses.append({"client_id": client_id})
+    if sentiment:
+        clauses.append({"sentiment_label": sentiment_label(sentiment)})
+    if interaction_type:
+        clauses.append({"type": interaction_type})
+    if since:
+        clauses.append({"date_ts": {"$gte": date_to_ts(since)}})
+    if until:
+        clauses.append({"date_ts": {"$lte": date_to_ts(until)}})
+    return combine_where(clauses)
@@ -0,0 +1,140 @@
+"""
+Hybrid lexical + semantic retrieval.
+
+HybridRetriever sits next to NexusVectorStore. For each query it takes the
+top candidates from the vector search and from a BM25 index over the same
+collection, then fuses the two rankings with reciprocal rank fusion. Exact
+title and term matches ("Magic Quadrant for Cloud Database Management
+Systems") surface even when their embedding is not the nearest. The BM25
+indexes are built from the collection contents on first use. When the
+store's collection version changes, the documents this process wrote or
+deleted since (NexusVectorStore.changes_since) are applied to the index, so a
+streaming micro-batch costs only its own documents. An ingest by another
+process, noticed through the version stamp in the persist directory, triggers
+a full rebuild.
+"""
+import threading
+
+from gss_agent.core.executor import run_blocking
+from gss_agent.rag.bm25 import BM25Index, reciprocal_rank_fusion
+from gss_agent.rag.chunking import CHUNK_FANOUT, aggregate_by_parent
+from gss_agent.rag.filters import interaction_filter, research_filter
+from gss_agent.rag.mmr import MMR_FANOUT, mmr_rerank
+from gss_agent.rag.vector_store import interaction_batch
+
+# Candidates taken from each ranking before fusion
+HYBRID_CANDIDATES = 20
+RRF_K = 60
+
+
+class HybridRetriever:
+    def __init__(self, store, candidates=HYBRID_CANDIDATES, rrf_k=RRF_K):
+        self.store = store
+        self.candidates = candidates
+        self.rrf_k = rrf_k
+        # collection name -> (collection version, BM25Index, {id: (document, metadata)})
+        self._indexes = {}
+        # Guards the indexes, which are updated in place
+        self._lock = threading.Lock()
+
+    def _index(self, collection):
+        """The up-to-date (BM25Index, documents) of `collection`; call with the lock held."""
+        version = self.store.collection_version(collection)
+        cached = self._indexes.get(collection.name)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        delta = self.store.changes_since(collection, cached[0]) if cached is not None else None
+        if delta is None:
+            data = collection.get(include=["documents", "metadatas"])
+            index = BM25Index.build(data["ids"], data["documents"], data["metadatas"])
+            documents = {doc_id: (doc, meta) for doc_id, doc, meta
+                         in zip(data["ids"], data["documents"], data["metadatas"])}
+        else:
+            _, index, documents = cached
+            changed, deleted = delta
+            for doc_id in deleted:
+                index.remove(doc_id)
+                documents.pop(doc_id, None)
+            if changed:
+                data = collection.get(ids=sorted(changed), include=["documents", "metadatas"])
+                for doc_id, doc, meta in zip(data["ids"], data["documents"], data["metadatas"]):
+                    index.add(doc_id, doc, meta)
+                    documents[doc_id] = (doc, meta)
+        self._indexes[collection.name] = (version, index, documents)
+        return index, documents
+
+    def search(self, collection, query, n_results=5, where=None, mmr_lambda=None):
+        """
+        Chroma-shaped result ({"ids": [[...]], "documents": [[...]], ...}) with fused "scores".
+        With `mmr_lambda`, a wider fused list is re-ranked for diversity, using the
+        fused scores as relevance.
+        """
+        return self.search_batch(collection, [(query, where)], n_results, mmr_lambda)[0]
+
+    def search_batch(self, collection, requests, n_results=5, mmr_lambda=None):
+        """search() for many (query, where) pairs, with one batched vector query."""
+        keep = n_results if mmr_lambda is None else n_results * MMR_FANOUT
+        depth = max(keep, self.candidates)
+        vectors = self.store.query_collection_batch(collection, requests, depth, embeddings=mmr_lambda is not None)
+        return [self._fuse(collection, query, where, vector, keep, depth, n_results, mmr_lambda)
+                for (query, where), vector in zip(requests, vectors)]
+
+    def _fuse(self, collection, query, where, vector, keep, depth, n_results, mmr_lambda):
+        with self._lock:
+            index, documents = self._index(collection)
+            lexical = index.search(query, top_k=depth, where=where)
+            fused = reciprocal_rank_fusion([vector["ids"][0], [doc_id for doc_id, _ in lexical]],
+                                           k=self.rrf_k)[:keep]
+            found = [(doc_id, score, documents[doc_id]) for doc_id, score in fused]
+        ids = [doc_id for doc_id, _, _ in found]
+        result = {
+            "ids": [ids],
+            "documents": [[doc for _, _, (doc, _) in found]],
+            "metadatas": [[meta for _, _, (_, meta) in found]],
+            "scores": [[round(score, 6) for _, score, _ in found]],
+        }
+        if mmr_lambda is None or not ids:
+            return result
+
+        # Reuse the vector candidates' embeddings; only lexical-only hits are fetched
+        embeddings = dict(zip(vector["ids"][0], vector["embeddings"][0]))
+        missing = [doc_id for doc_id in ids if doc_id not in embeddings]
+        if missing:
+            fetched = collection.get(ids=missing, include=["embeddings"])
+            embeddings.update(zip(fetched["ids"], fetched["embeddings"]))
+        result["embeddings"] = [[embeddings[doc_id] for doc_id in ids]]
+        relevance = [score for _, score in fused]
+        return mmr_rerank(result, self.store.embed_query(query), n_results, mmr_lambda, relevance)
+
+    def search_research(self, query, n_results=5, mmr_lambda=None, **filters):
+        return self.search(self.store.research_collection, query, n_results, research_filter(**filters),
+                           mmr_lambda)
+
+    def search_interactions(self, query, client_id=None, n_results=5, **filters):
+        where = interaction_filter(client_id=client_id, **filters)
+        chunks = self.search(self.store.interaction_collection, query, n_results * CHUNK_FANOUT, where)
+        return aggregate_by_parent(chunks, n_results)
+
+    def search_research_batch(self, queries, n_results=5, mmr_lambda=None):
+        """Several research searches, grouped by query and deduplicated as by the store."""
+        results = self.search_batch(self.store.research_collection, [(q, None) for q in queries], n_results,
+                                    mmr_lambda)
+        return self.store.group_results([{"query": q} for q in queries], results)
+
+    def search_interactions_batch(self, queries, client_ids=None, n_results=5):
+        requests, labels = interaction_batch(queries, client_ids)
+        results = [aggregate_by_parent(chunks, n_results) for chunks in
+                   self.search_batch(self.store.interaction_collection, requests, n_results * CHUNK_FANOUT)]
+        return self.store.group_results(labels, results)
+
+    async def asearch_research(self, query, n_results=5, **kwargs):
+        return await run_blocking(self.search_research, query, n_results, **kwargs)
+
+    async def asearch_interactions(self, query, client_id=None, n_results=5, **filters):
+        return await run_blocking(self.search_interactions, query, client_id, n_results, **filters)
+
+    async def asearch_research_batch(self, queries, n_results=5, **kwargs):
+        return await run_blocking(self.search_research_batch, queries, n_results, **kwargs)
+
+    async def asearch_interactions_batch(self, queries, client_ids=None, n_results=5):
+        return await run_blocking(self.search_interactions_batch, queries, client_ids, n_results)
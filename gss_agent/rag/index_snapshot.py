@@ -0,0 +1,188 @@
+"""
+Portable, prebuilt vector index snapshots.
+
+A new deployment used to either re-run ingestion, embedding every document
+again, or ship a chroma_db directory of unknown freshness. export_snapshot()
+writes a store's collections (ids, documents, metadata and embeddings) to a
+directory in the NumPy backend's layout:
+
+    <snapshot>/manifest.json
+    <snapshot>/numpy/<collection>/CURRENT
+    <snapshot>/numpy/<collection>/v1/embeddings.npy
+    <snapshot>/numpy/<collection>/v1/records.json
+
+The manifest records the format version, the embedding function, per
+collection counts and dimensions, a sha256 of every file, and the sha256 of
+the source data files (content.json, interactions.json) the index was built
+from.
+
+open_snapshot() verifies the checksums and the embedding function, warns if
+the source data has changed since the export, and returns a numpy-backed
+NexusVectorStore over the snapshot directory itself. The embeddings are
+memory-mapped, nothing is re-embedded or written, so the directory can be
+mounted read-only and shared by every worker. Set NEXUS_VECTOR_SNAPSHOT to
+have the tools serve from one. import_snapshot() instead copies a snapshot
+into an existing store (e.g. a Chroma one) using the stored embeddings.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+
+from gss_agent.data.snapshot import DATA_DIR, file_digest
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+MANIFEST_FILE = "manifest.json"
+SOURCE_FILES = ("content.json", "interactions.json")
+PAGE_SIZE = 1000
+
+
+class SnapshotError(Exception):
+    """A snapshot is missing, corrupt, or incompatible with the store opening it."""
+
+
+def sha256_file(path, block=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(block), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def embedding_function_name(embedding_function):
+    name = getattr(embedding_function, "name", None)
+    return name() if callable(name) else type(embedding_function).__name__
+
+
+def _pages(collection, include):
+    offset = 0
+    while True:
+        page = collection.get(include=include, limit=PAGE_SIZE, offset=offset)
+        if not page["ids"]:
+            return
+        yield page
+        offset += len(page["ids"])
+
+
+def export_snapshot(store, directory, data_dir=DATA_DIR):
+    """Writes the store's collections to a new snapshot directory and returns its manifest."""
+    from gss_agent.rag.numpy_backend import NumpyVectorClient
+
+    if os.path.exists(directory) and os.listdir(directory):
+        raise SnapshotError(f"Snapshot directory '{directory}' is not empty.")
+    # Built next to the target and moved into place, so a failed export leaves nothing behind
+    staging = f"{directory.rstrip(os.sep)}.partial-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    client = NumpyVectorClient(os.path.join(staging, "numpy"))
+
+    collections = {}
+    for collection in (store.research_collection, store.interaction_collection):
+        target = client.get_or_create_collection(collection.name)
+        dim = 0
+        for page in _pages(collection, ["documents", "metadatas", "embeddings"]):
+            target.upsert(ids=page["ids"], embeddings=page["embeddings"], documents=page["documents"],
+                          metadatas=page["metadatas"])
+            dim = len(page["embeddings"][0])
+        target.persist()
+        collections[collection.name] = {"count": target.count(), "dim": dim}
+
+    files = {}
+    for root, _, names in os.walk(staging):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            files[os.path.relpath(path, staging).replace(os.sep, "/")] = sha256_file(path)
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "embedding_function": embedding_function_name(store.embedding_fn),
+        "collections": collections,
+        "files": dict(sorted(files.items())),
+        "source": {name: file_digest(os.path.join(data_dir, name)) for name in SOURCE_FILES},
+    }
+    with open(os.path.join(staging, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+    if os.path.exists(directory):
+        os.rmdir(directory)
+    os.replace(staging, directory)
+    return manifest
+
+
+def read_manifest(directory):
+    path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.exists(path):
+        raise SnapshotError(f"No {MANIFEST_FILE} in '{directory}'.")
+    with open(path, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise SnapshotError(f"Unsupported snapshot format {manifest.get('format')} (expected {SNAPSHOT_FORMAT}).")
+    return manifest
+
+
+def verify_snapshot(directory, embedding_function=None, data_dir=DATA_DIR, checksums=True):
+    """
+    Checks the manifest format, every file checksum (checksums=False skips the
+    hashing) and, if given, that `embedding_function` matches the one the
+    snapshot was built with. Raises SnapshotError on any mismatch. Returns
+    (manifest, stale) where `stale` lists source files in `data_dir` that
+    changed since the export.
+    """
+    manifest = read_manifest(directory)
+    for relpath, expected in manifest["files"].items():
+        path = os.path.join(directory, *relpath.split("/"))
+        if not os.path.exists(path):
+            raise SnapshotError(f"Snapshot file '{relpath}' is missing.")
+        if checksums and sha256_file(path) != expected:
+            raise SnapshotError(f"Checksum mismatch for snapshot file '{relpath}'.")
+    if embedding_function is not None:
+        name = embedding_function_name(embedding_function)
+        if name != manifest["embedding_function"]:
+            raise SnapshotError(f"Snapshot was embedded with '{manifest['embedding_function']}', "
+                                f"but the store uses '{name}'.")
+    stale = []
+    if data_dir:
+        stale = [name for name, digest in manifest["source"].items()
+                 if digest is not None and file_digest(os.path.join(data_dir, name)) not in (None, digest)]
+    return manifest, stale
+
+
+def open_snapshot(directory, embedding_function=None, data_dir=DATA_DIR, checksums=True, **store_options):
+    """A verified, numpy-backed NexusVectorStore serving straight from the snapshot directory."""
+    from gss_agent.rag.vector_store import NexusVectorStore
+
+    started = time.perf_counter()
+    manifest, stale = verify_snapshot(directory, data_dir=data_dir, checksums=checksums)
+    store = NexusVectorStore(persist_directory=directory, embedding_function=embedding_function,
+                             backend="numpy", **store_options)
+    verify_snapshot(directory, store.embedding_fn, data_dir=None, checksums=False)
+    if stale:
+        logger.warning(f"Vector snapshot {directory} is older than {', '.join(stale)}; re-export to pick up changes.")
+    counts = ", ".join(f"{name}: {c['count']}" for name, c in manifest["collections"].items())
+    logger.info(f"Opened vector snapshot {directory} ({counts}) in {time.perf_counter() - started:.2f}s.")
+    return store
+
+
+def import_snapshot(store, directory, data_dir=DATA_DIR):
+    """Copies a verified snapshot into `store` with its stored embeddings. Returns documents per collection."""
+    from gss_agent.rag.numpy_backend import NumpyVectorClient
+
+    manifest, stale = verify_snapshot(directory, store.embedding_fn, data_dir=data_dir)
+    if stale:
+        logger.warning(f"Importing vector snapshot older than {', '.join(stale)}.")
+    client = NumpyVectorClient(os.path.join(directory, "numpy"))
+    targets = {c.name: c for c in (store.research_collection, store.interaction_collection)}
+    counts = {}
+    for name in manifest["collections"]:
+        target = targets.get(name)
+        if target is None:
+            raise SnapshotError(f"Store has no collection '{name}'.")
+        counts[name] = 0
+        for page in _pages(client.get_or_create_collection(name), ["documents", "metadatas", "embeddings"]):
+            target.upsert(ids=page["ids"], embeddings=page["embeddings"], documents=page["documents"],
+                          metadatas=page["metadatas"])
+            counts[name] += len(page["ids"])
+        store.collection_changed(target)
+    return counts
@@ -0,0 +1,100 @@
+"""
+Maximal marginal relevance (MMR) re-ranking.
+
+content.json has many near-duplicate reports: generator.py and the research
+scripts draw titles from the same RESEARCH_TITLES list. A plain top-k search
+then often returns three variants of one report. MMR re-ranks a wider
+candidate list and picks each next result by
+
+    lambda * relevance - (1 - lambda) * max similarity to the results already picked
+
+so lambda=1 keeps the relevance order and lower values trade relevance for
+variety. The candidate embeddings come back with the search itself, so
+diversifying needs no second round trip.
+"""
+import numpy as np
+
+MMR_LAMBDA = 0.7
+# Candidates re-ranked per requested result
+MMR_FANOUT = 4
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def mmr_select(query_embedding, embeddings, k, lambda_mult=MMR_LAMBDA, relevance=None):
+    """
+    Indexes of `k` candidates in MMR order. Relevance defaults to cosine
+    similarity to the query; pass `relevance` (higher is better) to use
+    another ranking's scores, e.g. fused hybrid scores. Those keep their
+    order but are mapped onto the candidates' cosine range, which is the
+    scale the redundancy term is on, so a lambda diversifies as much as it
+    does in a plain vector search.
+    """
+    if not len(embeddings) or k <= 0:
+        return []
+    candidates = _normalize(embeddings)
+    cosine = candidates @ _normalize(query_embedding)[0]
+    if relevance is None:
+        relevance = cosine
+    else:
+        relevance = min_max_scale(relevance) * (cosine.max() - cosine.min()) + cosine.min()
+
+    selected = [int(np.argmax(relevance))]
+    # Highest similarity of every candidate to the already selected ones
+    redundancy = candidates @ candidates[selected[0]]
+    while len(selected) < min(k, len(candidates)):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        redundancy = np.maximum(redundancy, candidates @ candidates[best])
+    return selected
+
+
+def min_max_scale(scores):
+    """
+    Scores rescaled to [0, 1] (all 1.0 if they are equal). Fused rank scores
+    only span a narrow band, so used as-is they would be swamped by the
+    redundancy term.
+    """
+    scores = np.asarray(scores, dtype=np.float32)
+    span = float(scores.max() - scores.min()) if len(scores) else 0.0
+    return (scores - scores.min()) / span if span > 0 else np.ones_like(scores)
+
+
+def parse_lambda(value):
+    """An MMR lambda from configuration: None for "off", else a float in [0, 1]."""
+    if str(value).strip().lower() == "off":
+        return None
+    try:
+        lambda_mult = float(value)
+    except ValueError:
+        raise ValueError(f"MMR lambda must be a number in [0, 1] or 'off', got {value!r}.") from None
+    if not 0.0 <= lambda_mult <= 1.0:
+        raise ValueError(f"MMR lambda must be in [0, 1], got {lambda_mult}.")
+    return lambda_mult
+
+
+def mmr_rerank(result, query_embedding, k, lambda_mult=MMR_LAMBDA, relevance=None):
+    """
+    Re-ranks a Chroma-shaped single-query result that includes "embeddings"
+    and keeps the top `k`. The embeddings are dropped from the returned result.
+    """
+    embeddings = result.get("embeddings")
+    embeddings = embeddings[0] if embeddings is not None and len(embeddings) else []
+    order = mmr_select(query_embedding, embeddings, k, lambda_mult, relevance)
+    reranked = {}
+    for key, value in result.items():
+        if key == "embeddings":
+            continue
+        if key != "included" and isinstance(value, list) and value and isinstance(value[0], list):
+            reranked[key] = [[value[0][i] for i in order]]
+        else:
+            reranked[key] = value
+    return reranked
@@ -0,0 +1,537 @@
+"""
+In-process NumPy vector index, a drop-in backend for NexusVectorStore.
+
+NumpyVectorClient / NumpyCollection implement the part of the Chroma client
+and collection API the store uses (get_or_create_collection, get, upsert,
+update, delete, query, count). Embeddings live in one contiguous float32
+matrix; on disk it is a .npy file that is memory-mapped on open, so a small
+deployment loads instantly without Chroma's SQLite, and tests skip Chroma
+entirely. Documents, ids and metadata sit next to it in records.json. Both
+(and the int8 codes below) are written to a fresh version directory per
+persist, and a CURRENT file naming the live version is swapped atomically:
+
+    <collection>/CURRENT            e.g. "v3"
+    <collection>/v3/embeddings.npy
+    <collection>/v3/records.json
+
+Search is exact (one matrix multiply against every row, distances are squared
+L2 like Chroma's default space). Collections of at least `ivf_min_rows` rows
+can also use an IVF coarse partition: k-means centroids, queries scan only
+the rows of the `nprobe` nearest lists and fall back to the exact scan when
+filters leave too few candidates.
+
+With quantize=True the collection also keeps an int8 copy of the matrix
+(symmetric scalar quantization, one scale per dimension). Queries rank all
+candidates on the int8 codes, then re-score a shortlist of
+`rescore * n_results` rows at full precision. After persist() the float32
+matrix is only memory-mapped, so just the codes (a quarter of the size) stay
+resident. Written rows are quantized with the existing scale, so a small
+upsert does not re-quantize the whole matrix; only a row outside the scale's
+range triggers a full re-quantization.
+
+Writes are kept in memory and written out by persist(), which
+NexusVectorStore calls after each ingest.
+"""
+import json
+import os
+import re
+import shutil
+import threading
+
+import numpy as np
+
+from gss_agent.rag.filters import matches_where
+
+IVF_MIN_ROWS = 5000
+IVF_ITERATIONS = 10
+# Shortlist re-scored at full precision, as a multiple of n_results
+RESCORE_FACTOR = 4
+# Each persist writes a new version directory and points CURRENT at it
+CURRENT_FILE = "CURRENT"
+VERSION_DIR = re.compile(r"v\d+")
+
+
+def _squared_l2(queries, vectors, vector_norms):
+    """(queries, rows) matrix of squared L2 distances."""
+    query_norms = np.einsum("ij,ij->i", queries, queries)[:, None]
+    return np.maximum(query_norms + vector_norms[None, :] - 2.0 * queries @ vectors.T, 0.0)
+
+
+def quantize_int8(vectors):
+    """(codes, scale): int8 codes with vectors ~= codes * scale, one scale per dimension."""
+    scale = np.abs(vectors).max(axis=0) / 127.0 if len(vectors) else np.ones(vectors.shape[1], np.float32)
+    scale = np.where(scale > 0, scale, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scale), -127, 127).astype(np.int8)
+    return codes, scale
+
+
+class IVFIndex:
+    """Coarse k-means partition of the rows; rows are assigned to their nearest centroid."""
+
+    def __init__(self, nlist, nprobe, seed=0):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.seed = seed
+        self.centroids = None
+        self.assignments = np.empty(0, dtype=np.int32)
+        self.trained_rows = 0
+
+    def train(self, vectors):
+        n = len(vectors)
+        k = min(self.nlist, n)
+        rng = np.random.default_rng(self.seed)
+        centroids = vectors[rng.choice(n, size=k, replace=False)].astype(np.float32)
+        for _ in range(IVF_ITERATIONS):
+            assignments = self.assign(vectors, centroids)
+            for c in range(k):
+                members = vectors[assignments == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+        self.centroids = centroids
+        self.assignments = self.assign(vectors, centroids)
+        self.trained_rows = n
+
+    @staticmethod
+    def assign(vectors, centroids, block=65536):
+        centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+        out = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), block):
+            chunk = np.asarray(vectors[start:start + block], dtype=np.float32)
+            out[start:start + block] = np.argmin(_squared_l2(chunk, centroids, centroid_norms), axis=1)
+        return out
+
+    def candidates(self, query):
+        """Row indexes in the `nprobe` lists nearest to `query`."""
+        centroid_norms = np.einsum("ij,ij->i", self.centroids, self.centroids)
+        distances = _squared_l2(query[None, :], self.centroids, centroid_norms)[0]
+        probe = np.argsort(distances)[:self.nprobe]
+        return np.flatnonzero(np.isin(self.assignments, probe))
+
+
+class NumpyCollection:
+    def __init__(self, name, directory, embedding_function=None, nlist=None, nprobe=8,
+                 ivf_min_rows=IVF_MIN_ROWS, quantize=False, rescore=RESCORE_FACTOR):
+        self.name = name
+        self.directory = directory
+        self.embedding_function = embedding_function
+        self.ids, self.documents, self.metadatas = [], [], []
+        self._rows = {}
+        self._matrix = None
+        self._size = 0
+        self._writable = False
+        self._dirty = False
+        self._norms = None
+        self._masks = {}
+        self._lock = threading.RLock()
+        # IVF partitioning, used once the collection has ivf_min_rows rows
+        self.ivf = IVFIndex(nlist, nprobe) if nlist else None
+        self.ivf_min_rows = ivf_min_rows
+        self.quantize = quantize
+        self.rescore = rescore
+        # int8 codes, per-dimension scale and norms of the dequantized rows
+        self._codes = self._scale = self._code_norms = None
+        self._load()
+
+    # Storage
+
+    def _paths(self, base):
+        return os.path.join(base, "embeddings.npy"), os.path.join(base, "records.json")
+
+    def _quantized_paths(self, base):
+        return os.path.join(base, "codes.npy"), os.path.join(base, "scale.npy")
+
+    def _versions(self):
+        """Version directory names (v1, v2, ...) under the collection directory, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted((name for name in os.listdir(self.directory) if VERSION_DIR.fullmatch(name)),
+                      key=lambda name: int(name[1:]))
+
+    def _current(self):
+        """Directory of the live version; the collection directory itself for the unversioned layout."""
+        try:
+            with open(os.path.join(self.directory, CURRENT_FILE), "r") as f:
+                return os.path.join(self.directory, f.read().strip())
+        except FileNotFoundError:
+            return self.directory
+
+    def _load(self):
+        for attempt in range(2):
+            base = self._current()
+            try:
+                return self._load_version(base)
+            except FileNotFoundError:
+                # A writer retired this version between reading CURRENT and opening it
+                if attempt:
+                    raise
+
+    def _load_version(self, base):
+        matrix_path, records_path = self._paths(base)
+        if base == self.directory and not os.path.exists(records_path):
+            return
+        with open(records_path, "r") as f:
+            records = json.load(f)
+        ids = records["ids"]
+        matrix = np.load(matrix_path, mmap_mode="r") if ids else None
+        codes = scale = None
+        codes_path, scale_path = self._quantized_paths(base)
+        if self.quantize and ids and os.path.exists(codes_path):
+            codes, scale = np.load(codes_path), np.load(scale_path)
+            # Codes of another row count belong to an older matrix; they are rebuilt on first search
+            if codes.shape != matrix.shape or scale.shape != (matrix.shape[1],):
+                codes = scale = None
+
+        self.ids, self.documents, self.metadatas = ids, records["documents"], records["metadatas"]
+        self._rows = {doc_id: i for i, doc_id in enumerate(self.ids)}
+        self._size = len(self.ids)
+        # Read-only view of the file; copied into memory only on the first write
+        self._matrix = matrix
+        self._codes, self._scale = codes, scale
+
+    def persist(self):
+        """
+        Writes the matrix, records and (quantized) codes to a new version
+        directory, then switches CURRENT to it with one atomic rename, so a
+        reader never pairs files of two different writes.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            versions = self._versions()
+            version = f"v{int(versions[-1][1:]) + 1 if versions else 1}"
+            base = os.path.join(self.directory, version)
+            os.makedirs(base)
+            matrix_path, records_path = self._paths(base)
+            matrix = self._matrix[:self._size] if self._matrix is not None else np.empty((0, 0), np.float32)
+            with open(matrix_path, "wb") as f:
+                np.save(f, matrix)
+            with open(records_path, "w") as f:
+                json.dump({"ids": self.ids, "documents": self.documents, "metadatas": self.metadatas}, f)
+            if self.quantize:
+                self._ensure_codes()
+                for path, array in zip(self._quantized_paths(base), (self._codes[:self._size], self._scale)):
+                    with open(path, "wb") as f:
+                        np.save(f, array)
+
+            previous = self._current()
+            current_path = os.path.join(self.directory, CURRENT_FILE)
+            with open(current_path + ".tmp", "w") as f:
+                f.write(version)
+            os.replace(current_path + ".tmp", current_path)
+            self._dirty = False
+            self._retire(keep={version, os.path.basename(previous)})
+            if self.quantize and self._size:
+                # Keep only the int8 codes resident; full-precision rows are read
+                # from the memory-mapped file for re-scoring.
+                self._matrix, self._writable = np.load(matrix_path, mmap_mode="r"), False
+
+    def _retire(self, keep):
+        """
+        Removes versions other than `keep` (the new and the previous one, which
+        a reader may still be opening) and files of the unversioned layout.
+        Memory-mapped files stay readable after removal.
+        """
+        for name in self._versions():
+            if name not in keep:
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        for path in self._paths(self.directory) + self._quantized_paths(self.directory):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _reserve(self, rows, dim):
+        if self._matrix is None:
+            self._matrix = np.empty((max(rows, 16), dim), dtype=np.float32)
+            self._writable = True
+            return
+        if self._matrix.shape[1] != dim:
+            raise ValueError(f"Embedding dimension {dim} does not match collection dimension {self._matrix.shape[1]}.")
+        if not self._writable or rows > len(self._matrix):
+            grown = np.empty((max(rows, 2 * len(self._matrix), 16), dim), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+            self._writable = True
+
+    def _changed(self, rows=None):
+        """Marks the collection dirty. `rows` whose vectors were written keep the int8 codes current."""
+        self._dirty = True
+        self._norms = None
+        self._masks.clear()
+        if rows is None or self._codes is None or not self._update_codes(rows):
+            self._codes = self._scale = self._code_norms = None
+
+    def _update_codes(self, rows):
+        """Quantizes `rows` with the current scale. False if they fall outside it (needs a full re-quantization)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        vectors = np.asarray(self._matrix[rows], dtype=np.float32)
+        if len(rows) and np.any(np.abs(vectors) > self._scale * 127.0 * (1 + 1e-6)):
+            return False
+        if len(self._codes) < self._size:
+            codes = np.zeros((self._size, self._codes.shape[1]), dtype=np.int8)
+            codes[:len(self._codes)] = self._codes
+            self._codes = codes
+            if self._code_norms is not None:
+                self._code_norms = np.concatenate(
+                    [self._code_norms, np.zeros(self._size - len(self._code_norms), np.float32)])
+        if len(rows):
+            codes = np.clip(np.rint(vectors / self._scale), -127, 127).astype(np.int8)
+            self._codes[rows] = codes
+            if self._code_norms is not None:
+                block = codes.astype(np.float32) * self._scale
+                self._code_norms[rows] = np.einsum("ij,ij->i", block, block)
+        return True
+
+    def _ensure_codes(self):
+        if self._codes is None:
+            self._codes, self._scale = quantize_int8(np.asarray(self._vectors(), dtype=np.float32))
+        if self._code_norms is None:
+            self._code_norms = np.empty(self._size, dtype=np.float32)
+            for start in range(0, self._size, 65536):
+                block = self._codes[start:start + 65536].astype(np.float32) * self._scale
+                self._code_norms[start:start + 65536] = np.einsum("ij,ij->i", block, block)
+
+    def memory_usage(self):
+        """Bytes of the float32 matrix and of the int8 codes (0 when not quantized)."""
+        matrix_bytes = self._size * (self._matrix.shape[1] if self._matrix is not None else 0) * 4
+        return {
+            "float32_bytes": matrix_bytes,
+            "float32_resident": bool(self._size) and not isinstance(self._matrix, np.memmap),
+            "int8_bytes": int(self._codes.nbytes + self._scale.nbytes) if self._codes is not None else 0,
+        }
+
+    def _embed(self, documents):
+        if self.embedding_function is None:
+            raise ValueError(f"Collection '{self.name}' has no embedding function; pass embeddings.")
+        return self.embedding_function(list(documents))
+
+    # Chroma collection API subset
+
+    def count(self):
+        return self._size
+
+    def upsert(self, ids, documents=None, metadatas=None, embeddings=None):
+        ids = [ids] if isinstance(ids, str) else list(ids)
+        if embeddings is None:
+            embeddings = self._embed(documents)
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1)
+        with self._lock:
+            new = sum(1 for doc_id in dict.fromkeys(ids) if doc_id not in self._rows)
+            self._reserve(self._size + new, vectors.shape[1])
+            rows = []
+            for i, doc_id in enumerate(ids):
+                row = self._rows.get(doc_id)
+                if row is None:
+                    row = self._rows[doc_id] = self._size
+                    self._size += 1
+                    self.ids.append(doc_id)
+                    self.documents.append(None)
+                    self.metadatas.append(None)
+                self._matrix[row] = vectors[i]
+                self.documents[row] = documents[i] if documents is not None else None
+                self.metadatas[row] = dict(metadatas[i]) if metadatas is not None else None
+                rows.append(row)
+            self._changed(rows)
+            self._update_ivf(rows)
+
+    def update(self, ids, metadatas=None, documents=None, embeddings=None):
+        ids = [ids] if isinstance(ids, str) else list(ids)
+        with self._lock:
+            missing = [doc_id for doc_id in ids if doc_id not in self._rows]
+            if missing:
+                raise ValueError(f"Cannot update unknown ids: {missing[:5]}")
+            if documents is not None and embeddings is None:
+                embeddings = self._embed(documents)
+            if embeddings is not None:
+                self._reserve(self._size, np.asarray(embeddings).shape[-1])
+            rows = []
+            for i, doc_id in enumerate(ids):
+                row = self._rows[doc_id]
+                if metadatas is not None:
+                    self.metadatas[row] = dict(metadatas[i])
+                if documents is not None:
+                    self.documents[row] = documents[i]
+                if embeddings is not None:
+                    self._matrix[row] = np.asarray(embeddings[i], dtype=np.float32)
+                    rows.append(row)
+            self._changed(rows)
+            self._update_ivf(rows)
+
+    def delete(self, ids=None, where=None):
+        with self._lock:
+            targets = set([ids] if isinstance(ids, str) else (ids or []))
+            if where:
+                targets.update(self.ids[row] for row in np.flatnonzero(self._mask(where)))
+            targets &= set(self._rows)
+            if not targets:
+                return
+            keep = np.array([doc_id not in targets for doc_id in self.ids[:self._size]], dtype=bool)
+            kept_rows = np.flatnonzero(keep)
+            # Compact into a fresh array so the rows stay contiguous and in insertion order
+            if self._matrix is not None:
+                matrix = np.empty((max(len(kept_rows), 16), self._matrix.shape[1]), dtype=np.float32)
+                matrix[:len(kept_rows)] = self._matrix[kept_rows]
+                self._matrix, self._writable = matrix, True
+            self.ids = [self.ids[r] for r in kept_rows]
+            self.documents = [self.documents[r] for r in kept_rows]
+            self.metadatas = [self.metadatas[r] for r in kept_rows]
+            self._rows = {doc_id: i for i, doc_id in enumerate(self.ids)}
+            self._size = len(self.ids)
+            if self.ivf is not None and self.ivf.centroids is not None:
+                self.ivf.assignments = self.ivf.assignments[kept_rows]
+            if self._codes is not None:
+                self._codes = self._codes[kept_rows]
+                if self._code_norms is not None:
+                    self._code_norms = self._code_norms[kept_rows]
+            self._changed([])
+
+    def get(self, ids=None, where=None, limit=None, offset=None, include=("metadatas", "documents"),
+            where_document=None):
+        if where_document:
+            raise ValueError("where_document filters are not supported by the NumPy backend.")
+        with self._lock:
+            if ids is not None:
+                ids = [ids] if isinstance(ids, str) else ids
+                rows = [self._rows[doc_id] for doc_id in ids if doc_id in self._rows]
+                if where:
+                    mask = self._mask(where)
+                    rows = [r for r in rows if mask[r]]
+            else:
+                rows = np.flatnonzero(self._mask(where)).tolist() if where else list(range(self._size))
+            start = offset or 0
+            rows = rows[start:start + limit] if limit is not None else rows[start:]
+            return self._result(rows, include)
+
+    def query(self, query_embeddings=None, query_texts=None, n_results=10, where=None,
+              include=("metadatas", "documents", "distances"), where_document=None):
+        if where_document:
+            raise ValueError("where_document filters are not supported by the NumPy backend.")
+        if query_embeddings is None:
+            query_embeddings = self._embed(query_texts)
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        out = {key: [] for key in ("ids", "documents", "metadatas", "distances", "embeddings")}
+        with self._lock:
+            mask = self._mask(where) if where else None
+            for query in queries:
+                rows, distances = self._search(query, n_results, mask)
+                result = self._result(rows, include)
+                for key in ("ids", "documents", "metadatas", "embeddings"):
+                    out[key].append(result[key])
+                out["distances"].append(distances.tolist() if "distances" in include else None)
+        for key in ("documents", "metadatas", "distances", "embeddings"):
+            if key not in include:
+                out[key] = None
+        out["included"] = list(include)
+        return out
+
+    # Search internals
+
+    def _vectors(self):
+        return self._matrix[:self._size] if self._matrix is not None else np.empty((0, 0), np.float32)
+
+    def _mask(self, where):
+        key = json.dumps(where, sort_keys=True)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = np.fromiter(
+                (matches_where(meta, where) for meta in self.metadatas[:self._size]), dtype=bool, count=self._size)
+        return mask
+
+    def _search(self, query, n_results, mask=None):
+        vectors = self._vectors()
+        if not self._size or n_results <= 0:
+            return [], np.empty(0)
+        if self._norms is None and not self.quantize:
+            self._norms = np.einsum("ij,ij->i", vectors, vectors)
+
+        candidates = None
+        if self.ivf is not None and self._size >= self.ivf_min_rows:
+            self._ensure_ivf()
+            candidates = self.ivf.candidates(query)
+            if mask is not None:
+                candidates = candidates[mask[candidates]]
+            if len(candidates) < n_results:
+                candidates = None  # too few after probing/filtering: exact scan instead
+        if candidates is None:
+            candidates = np.flatnonzero(mask) if mask is not None else np.arange(self._size)
+        if not len(candidates):
+            return [], np.empty(0)
+
+        if self.quantize:
+            self._ensure_codes()
+            # Approximate ranking on the int8 codes, then exact distances for a shortlist
+            approx = self._approximate_distances(query, candidates)
+            shortlist = min(len(candidates), max(n_results * self.rescore, n_results))
+            candidates = np.sort(candidates[np.argpartition(approx, shortlist - 1)[:shortlist]])
+            rows = np.asarray(vectors[candidates], dtype=np.float32)
+            distances = _squared_l2(query[None, :], rows, np.einsum("ij,ij->i", rows, rows))[0]
+        else:
+            distances = _squared_l2(query[None, :], vectors[candidates], self._norms[candidates])[0]
+        k = min(n_results, len(candidates))
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top], kind="stable")]
+        return candidates[top].tolist(), distances[top]
+
+    def _approximate_distances(self, query, candidates, block=65536):
+        """Squared L2 from `query` to the dequantized rows, decoded one block at a time."""
+        scaled = query * self._scale
+        out = np.empty(len(candidates), dtype=np.float32)
+        for start in range(0, len(candidates), block):
+            rows = candidates[start:start + block]
+            out[start:start + block] = self._code_norms[rows] - 2.0 * (self._codes[rows].astype(np.float32) @ scaled)
+        return out + float(query @ query)
+
+    def _ensure_ivf(self):
+        if self.ivf.centroids is None or self._size >= 2 * self.ivf.trained_rows:
+            self.ivf.train(self._vectors())
+
+    def _update_ivf(self, rows):
+        if self.ivf is None or self.ivf.centroids is None or not rows:
+            return
+        if len(self.ivf.assignments) < self._size:
+            grown = np.zeros(self._size, dtype=np.int32)
+            grown[:len(self.ivf.assignments)] = self.ivf.assignments
+            self.ivf.assignments = grown
+        rows = np.asarray(rows)
+        self.ivf.assignments[rows] = IVFIndex.assign(self._matrix[rows], self.ivf.centroids)
+
+    def _result(self, rows, include):
+        result = {
+            "ids": [self.ids[r] for r in rows],
+            "documents": [self.documents[r] for r in rows] if "documents" in include else None,
+            "metadatas": [self.metadatas[r] for r in rows] if "metadatas" in include else None,
+            "embeddings": [np.array(self._matrix[r]) for r in rows] if "embeddings" in include else None,
+        }
+        result["included"] = list(include)
+        return result
+
+
+class NumpyVectorClient:
+    """Stand-in for chromadb.PersistentClient backed by NumpyCollections under `path`."""
+
+    def __init__(self, path, nlist=None, nprobe=8, quantize=False, rescore=RESCORE_FACTOR):
+        self.path = path
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.quantize = quantize
+        self.rescore = rescore
+        self._collections = {}
+        self._lock = threading.Lock()
+
+    def get_or_create_collection(self, name, embedding_function=None):
+        with self._lock:
+            collection = self._collections.get(name)
+            if collection is None:
+                directory = os.path.join(self.path, re.sub(r"[^A-Za-z0-9._-]", "_", name))
+                collection = self._collections[name] = NumpyCollection(
+                    name, directory, embedding_function, nlist=self.nlist, nprobe=self.nprobe,
+                    quantize=self.quantize, rescore=self.rescore)
+            return collection
+
+    def list_collections(self):
+        return list(self._collections.values())
+
+    def persist(self):
+        for collection in self._collections.values():
+            collection.persist()
@@ -0,0 +1,246 @@
+"""
+Streaming ingestion of new interactions.
+
+ingest_interactions() re-reads the whole interactions.json, so a new meeting
+note or ticket only became searchable after the next batch run. New records
+can instead be appended, one JSON object per line, to an intake file next to
+it (interactions_intake.jsonl; see append_interactions()). StreamingIngestor
+tails that file:
+
+  - it reads from a byte offset and only takes complete lines, so a record
+    caught mid-write is picked up on the next poll; malformed lines are
+    counted and skipped
+  - records are buffered and indexed in micro-batches, when `batch_size` are
+    waiting or the oldest has waited `max_wait` seconds. Full batches keep
+    embedding throughput up, the wait bound keeps a lone record's latency low
+  - each batch is an append (ingest_interaction_records(prune=False)), which
+    only looks up the incoming ids and leaves the rest of the collection alone.
+    Its documents are tagged with the intake file as `source`, so a pruning
+    re-run of ingest_interactions(interactions.json) keeps them
+  - the offset of the last indexed line is saved to `<intake>.offset`, so a
+    restart resumes where it stopped. A crash between indexing and saving
+    re-indexes the batch, which is harmless since upserts are idempotent
+
+stats() reports ingest lag (from reading a line to it being searchable),
+backlog (unread bytes plus buffered records) and batch throughput.
+NEXUS_STREAM_INGEST=1 runs one in the API process on the tools' vector store
+(not when that store is a read-only NEXUS_VECTOR_SNAPSHOT).
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.evaluation import percentile
+
+logger = logging.getLogger(__name__)
+
+INTAKE_FILE = "interactions_intake.jsonl"
+STREAM_BATCH_SIZE = int(os.getenv("NEXUS_STREAM_BATCH_SIZE", "64"))
+STREAM_MAX_WAIT = float(os.getenv("NEXUS_STREAM_MAX_WAIT", "1.0"))
+STREAM_POLL_INTERVAL = 0.25
+# Upper bound on bytes read per poll, so a large backlog is worked off in steps
+READ_BLOCK = 1 << 20
+LAG_WINDOW = 1000
+REQUIRED_FIELDS = ("id", "client_id", "client_name", "type", "summary", "sentiment", "actions_identified")
+
+
+def append_interactions(records, path=None):
+    """Appends interaction dicts to the intake file as complete JSON lines."""
+    path = path or os.path.join(DATA_DIR, INTAKE_FILE)
+    lines = "".join(json.dumps(record) + "\n" for record in records)
+    with open(path, "a") as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class StreamingIngestor:
+    def __init__(self, store, path=None, batch_size=STREAM_BATCH_SIZE, max_wait=STREAM_MAX_WAIT,
+                 poll_interval=STREAM_POLL_INTERVAL, pipeline=None):
+        self.store = store
+        self.path = path or os.path.join(DATA_DIR, INTAKE_FILE)
+        self.offset_path = self.path + ".offset"
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.pipeline = pipeline
+        # committed: end of the last indexed line; read: end of the last buffered line
+        self.committed_offset = self._load_offset()
+        self.read_offset = self.committed_offset
+        # (record, read at, end offset of its line)
+        self._pending = []
+        self._lags = deque(maxlen=LAG_WINDOW)
+        self.ingested = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_batch = None
+        self.last_error = None
+        self._batch_seconds = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _load_offset(self):
+        try:
+            with open(self.offset_path, "r") as f:
+                return int(f.read().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _save_offset(self, offset):
+        tmp = f"{self.offset_path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(str(offset))
+        os.replace(tmp, self.offset_path)
+        self.committed_offset = offset
+
+    def _file_size(self):
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def read_new(self):
+        """Buffers the complete lines appended since the last read. Returns the number of records buffered."""
+        size = self._file_size()
+        if size < self.read_offset:
+            # Truncated or replaced: start over, already indexed ids are upserted as no-ops
+            logger.warning(f"Intake file {self.path} shrank below offset {self.read_offset}; re-reading it.")
+            self._pending.clear()
+            self.read_offset = 0
+            self._save_offset(0)
+        if size == self.read_offset:
+            return 0
+
+        with open(self.path, "rb") as f:
+            f.seek(self.read_offset)
+            block = f.read(READ_BLOCK)
+            # A single line longer than READ_BLOCK is read to its end
+            while b"\n" not in block and len(block) < size - self.read_offset:
+                block += f.read(READ_BLOCK)
+        end = block.rfind(b"\n") + 1
+        if end == 0:
+            # Only a partial line so far
+            return 0
+
+        now = time.time()
+        offset, buffered = self.read_offset, 0
+        for line in block[:end].splitlines(keepends=True):
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                missing = [field for field in REQUIRED_FIELDS if field not in record]
+            except (ValueError, TypeError):
+                record, missing = None, ["<invalid JSON object>"]
+            if missing:
+                self.errors += 1
+                logger.warning(f"Skipping intake line ending at byte {offset}: missing {', '.join(missing)}")
+                continue
+            self._pending.append((record, now, offset))
+            buffered += 1
+        self.read_offset = offset
+        if not self._pending:
+            # Nothing buffered, so skipped lines can be committed right away
+            self._save_offset(offset)
+        return buffered
+
+    def _ready(self):
+        return self._pending and (len(self._pending) >= self.batch_size
+                                  or time.time() - self._pending[0][1] >= self.max_wait)
+
+    def flush(self, force=False):
+        """
+        Indexes buffered records in batches of at most `batch_size`: every
+        full batch, the rest only if the oldest has waited `max_wait` (or
+        force=True). Returns the number of records indexed.
+        """
+        indexed = 0
+        while self._pending and (force or self._ready()):
+            batch = self._pending[:self.batch_size]
+            started = time.perf_counter()
+            self.store.ingest_interaction_records([record for record, _, _ in batch], prune=False,
+                                                  pipeline=self.pipeline, dedup=False,
+                                                  source=os.path.basename(self.path))
+            elapsed = time.perf_counter() - started
+            done = time.time()
+            with self._lock:
+                del self._pending[:len(batch)]
+                self._lags.extend(done - read_at for _, read_at, _ in batch)
+                self.ingested += len(batch)
+                self.batches += 1
+                self._batch_seconds += elapsed
+                self.last_batch = {"records": len(batch), "seconds": round(elapsed, 4)}
+            # Lines skipped after the batch are covered once nothing is left buffered
+            self._save_offset(batch[-1][2] if self._pending else self.read_offset)
+            indexed += len(batch)
+        return indexed
+
+    def poll(self):
+        """One tailing step: read new lines, then index whatever batches are due. Returns records indexed."""
+        indexed = 0
+        while True:
+            before = self.read_offset
+            self.read_new()
+            # A large backlog is read in READ_BLOCK steps, each flushed before the next is buffered
+            indexed += self.flush()
+            if self.read_offset == before or self.read_offset >= self._file_size():
+                return indexed
+
+    def stats(self):
+        with self._lock:
+            lags = list(self._lags)
+            pending = len(self._pending)
+            return {
+                "path": self.path,
+                "running": bool(self._thread and self._thread.is_alive()),
+                "ingested": self.ingested,
+                "batches": self.batches,
+                "errors": self.errors,
+                "last_error": self.last_error,
+                "pending_records": pending,
+                "backlog_bytes": max(self._file_size() - self.read_offset, 0),
+                "committed_offset": self.committed_offset,
+                "lag_ms": {
+                    "last": round(lags[-1] * 1000, 1) if lags else None,
+                    "p50": round(percentile(lags, 0.50) * 1000, 1),
+                    "p95": round(percentile(lags, 0.95) * 1000, 1),
+                },
+                "last_batch": self.last_batch,
+                "records_per_s": round(self.ingested / self._batch_seconds, 1) if self._batch_seconds else None,
+            }
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+                self.last_error = None
+            except Exception as e:
+                # e.g. the embedding model failing; the batch stays buffered and is retried
+                self.last_error = str(e)
+                logger.error(f"Streaming ingest error: {e}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nexus-stream-ingest", daemon=True)
+        self._thread.start()
+        logger.info(f"Tailing {self.path} for new interactions (batch {self.batch_size}, max wait {self.max_wait}s)")
+        return self
+
+    def stop(self, drain=True):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval + 5)
+            self._thread = None
+        if drain:
+            try:
+                self.flush(force=True)
+            except Exception as e:
+                logger.error(f"Streaming ingest could not drain {len(self._pending)} records: {e}")
@@ -1,12 +1,177 @@
-import chromadb
-from chromadb.utils import embedding_functions
+"""
+Chroma-backed vector store for the research library and client interactions.
+
+Ingestion is incremental: every document is stored with a sha256 of its
+rendered text (`content_hash`) and of its metadata (`metadata_hash`). A re-run
+embeds and upserts only new or re-worded documents, patches metadata in place
+when only that changed, and deletes documents that disappeared from the
+source file, so a nightly refresh costs only the deltas. Every document
+records the file it came from (`source` metadata) and pruning only deletes
+documents of the file being ingested, so supplementary sources
+(generated_interactions_llm.json, the streaming intake) survive a refresh of
+interactions.json. Appends (prune=False)
+look up only the incoming ids, which is what the streaming ingestor in
+rag/streaming.py relies on for its micro-batches.
+
+Long interaction transcripts are indexed as overlapping chunks linked to their
+interaction by `parent_id`; interaction searches aggregate chunk hits per
+interaction (see rag/chunking.py).
+
+Searches go through the query-embedding and result caches in rag/cache.py.
+Both are keyed on collection_version(), which also notices ingests by another
+process through a stamp file in the persist directory.
+
+The collections live in Chroma by default; NEXUS_VECTOR_BACKEND=numpy (or
+backend="numpy") uses the in-process index in rag/numpy_backend.py instead;
+NEXUS_VECTOR_QUANTIZE=1 makes it search int8 codes and re-score at float32.
+
+The asearch_* methods are awaitable versions of the searches that run them on
+the bounded tool executor (core/executor.py).
+"""
+import hashlib
 import json
 import os
+from collections import deque
+
+from gss_agent.core.executor import run_blocking
+from gss_agent.rag.cache import LRUCache, normalize_query
+from gss_agent.rag.chunking import CHUNK_FANOUT, aggregate_by_parent, chunk_id, chunk_text
+from gss_agent.rag.dedup import DEDUP_THRESHOLD, collapse_duplicates
+from gss_agent.rag.filters import (date_to_ts, interaction_filter, research_filter, sentiment_label,
+                                   tag_key)
+from gss_agent.rag.mmr import MMR_FANOUT, mmr_rerank
+
+# Chroma rejects larger write batches; reads of existing hashes are paged the same way
+INGEST_BATCH_SIZE = 1000
+SEARCH_CACHE_SIZE = int(os.getenv("NEXUS_SEARCH_CACHE_SIZE", "256"))
+SEARCH_CACHE_TTL = float(os.getenv("NEXUS_SEARCH_CACHE_TTL", "300"))
+# "chroma" or "numpy"; the IVF partition of the NumPy backend is off unless NLIST > 0
+VECTOR_BACKEND = os.getenv("NEXUS_VECTOR_BACKEND", "chroma")
+NUMPY_IVF_NLIST = int(os.getenv("NEXUS_VECTOR_IVF_NLIST", "0"))
+NUMPY_QUANTIZE = os.getenv("NEXUS_VECTOR_QUANTIZE", "0") == "1"
+# Writes remembered per collection, so lexical indexes can catch up incrementally
+CHANGE_LOG_SIZE = 64
+# Collapse near-duplicate items at ingestion (see rag/dedup.py)
+INGEST_DEDUP = os.getenv("NEXUS_INGEST_DEDUP", "0") == "1"
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def metadata_hash(metadata):
+    return content_hash(json.dumps(metadata, sort_keys=True, default=str))
+
+
+def render_research(item):
+    return f"{item['title']}\n\n{item['abstract']}\n\nStrategic Value: {item['strategic_value']}"
+
+
+def research_metadata(item):
+    meta = {"id": item["id"], "title": item["title"], "tags": ",".join(item["tags"])}
+    # Filterable fields (see rag/filters.py); Chroma metadata can't hold None, so absent values are omitted
+    meta.update({tag_key(tag): True for tag in item["tags"]})
+    published_ts = date_to_ts(item.get("published_date"))
+    if published_ts is not None:
+        meta.update(published_date=item["published_date"], published_ts=published_ts)
+    return meta
+
+
+def render_interaction(item):
+    return (f"Client: {item['client_name']}\nType: {item['type']}\nSummary: {item['summary']}\n"
+            f"Actions: {', '.join(item['actions_identified'])}")
+
+
+def interaction_metadata(item):
+    meta = {"id": item["id"], "client_id": item["client_id"], "client_name": item["client_name"],
+            "sentiment": item["sentiment"], "sentiment_label": sentiment_label(item["sentiment"]),
+            "type": item["type"]}
+    date_ts = date_to_ts(item.get("date"))
+    if date_ts is not None:
+        meta.update(date=item["date"], date_ts=date_ts)
+    return meta
+
+
+def research_documents(item):
+    """(id, text, metadata) documents indexed for one research item."""
+    return [(item["id"], render_research(item), research_metadata(item))]
+
+
+def interaction_documents(item):
+    """
+    The interaction's summary document plus one document per chunk of its
+    transcript `content`, all tagged with parent_id (chunk_index -1 is the summary).
+    """
+    meta = dict(interaction_metadata(item), parent_id=item["id"])
+    documents = [(item["id"], render_interaction(item), dict(meta, chunk_index=-1))]
+    header = f"Client: {item['client_name']}\nType: {item['type']}\n"
+    for n, passage in enumerate(chunk_text(item.get("content"))):
+        documents.append((chunk_id(item["id"], n), header + passage, dict(meta, chunk_index=n)))
+    return documents
+
+
+def research_dedup_text(item):
+    # The strategic value line is drawn from a short boilerplate list, so it is left out
+    return f"{item.get('title', '')}\n{item.get('abstract', '')}"
+
+
+def interaction_dedup_text(item):
+    return f"{render_interaction(item)}\n{item.get('content') or ''}"
+
+
+def _hash_entries(page):
+    """(id, (content_hash, metadata_hash, parent_id, source)) for each document of a get() page."""
+    for doc_id, meta in zip(page["ids"], page["metadatas"]):
+        meta = meta or {}
+        yield doc_id, (meta.get("content_hash"), meta.get("metadata_hash"), meta.get("parent_id"),
+                       meta.get("source"))
+
+
+def interaction_batch(queries, client_ids=None):
+    """
+    (requests, labels) for batched interaction searches: one (query, where)
+    pair and one {"query", "client_id"} label per query. `client_ids`, if
+    given, has one entry per query (None for unscoped).
+    """
+    client_ids = list(client_ids) if client_ids is not None else [None] * len(queries)
+    if len(client_ids) != len(queries):
+        raise ValueError("client_ids must have one entry per query.")
+    requests = [(q, interaction_filter(client_id=cid)) for q, cid in zip(queries, client_ids)]
+    labels = [{"query": q, "client_id": cid} for q, cid in zip(queries, client_ids)]
+    return requests, labels
+
+
+def with_aliases(documents_for, aliases):
+    """documents_for(item) with the item's collapsed duplicate ids as `aliases` metadata."""
+    def documents(item):
+        docs = documents_for(item)
+        if item["id"] in aliases:
+            joined = ",".join(aliases[item["id"]])
+            docs = [(doc_id, text, dict(meta, aliases=joined)) for doc_id, text, meta in docs]
+        return docs
+    return documents
+
 
 class NexusVectorStore:
-    def __init__(self, persist_directory="./chroma_db"):
-        self.client = chromadb.PersistentClient(path=persist_directory)
-        self.embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+    def __init__(self, persist_directory="./chroma_db", embedding_function=None,
+                 cache_size=SEARCH_CACHE_SIZE, cache_ttl=SEARCH_CACHE_TTL, backend=VECTOR_BACKEND,
+                 ivf_nlist=NUMPY_IVF_NLIST, quantize=NUMPY_QUANTIZE):
+        # Imported here so importing this module stays cheap; chromadb and the
+        # embedding model are only loaded when a store is actually created.
+        from gss_agent.rag.embedding_pipeline import default_embedding_function
+
+        if backend == "numpy":
+            from gss_agent.rag.numpy_backend import NumpyVectorClient
+            self.client = NumpyVectorClient(os.path.join(persist_directory, "numpy"), nlist=ivf_nlist or None,
+                                            quantize=quantize)
+        elif backend == "chroma":
+            import chromadb
+            self.client = chromadb.PersistentClient(path=persist_directory)
+        else:
+            raise ValueError(f"Unknown vector backend '{backend}'. Use 'chroma' or 'numpy'.")
+        self.backend = backend
+        self.persist_directory = persist_directory
+        self.embedding_fn = embedding_function or default_embedding_function()
         
         # Collections
         self.research_collection = self.client.get_or_create_collection(
@@ -18,58 +183,392 @@ class NexusVectorStore:
             embedding_function=self.embedding_fn
         )
 
-    def ingest_research(self, content_file):
+        self.embedding_cache = LRUCache(cache_size)
+        self.result_cache = LRUCache(cache_size, ttl=cache_ttl)
+        # collection name -> version, bumped whenever ingestion changes the collection
+        self._versions = {}
+        # collection name -> recent (version before, version after, changed ids, deleted ids)
+        self._changes = {}
+
+    @staticmethod
+    def _stored_hashes(collection):
+        """id -> (content_hash, metadata_hash, parent_id, source) for everything already in the collection."""
+        hashes = {}
+        offset = 0
+        while True:
+            page = collection.get(include=["metadatas"], limit=INGEST_BATCH_SIZE, offset=offset)
+            hashes.update(_hash_entries(page))
+            if len(page["ids"]) < INGEST_BATCH_SIZE:
+                return hashes
+            offset += INGEST_BATCH_SIZE
+
+    @staticmethod
+    def _stored_hashes_for(collection, ids, parents):
+        """Like _stored_hashes, limited to `ids` and to documents whose parent_id is in `parents`."""
+        ids, parents = list(ids), list(parents)
+        pages = [collection.get(ids=ids[i:i + INGEST_BATCH_SIZE], include=["metadatas"])
+                 for i in range(0, len(ids), INGEST_BATCH_SIZE)]
+        pages += [collection.get(where={"parent_id": {"$in": parents[i:i + INGEST_BATCH_SIZE]}},
+                                 include=["metadatas"])
+                  for i in range(0, len(parents), INGEST_BATCH_SIZE)]
+        hashes = {}
+        for page in pages:
+            hashes.update(_hash_entries(page))
+        return hashes
+
+    def sync_collection(self, collection, items, documents_for, prune=True, pipeline=None, rebuild=False,
+                        retired=(), source=None):
+        """
+        Brings `collection` in line with the documents produced by
+        `documents_for(item)` for each item: upserts new and changed documents,
+        updates metadata-only changes without re-embedding and, with prune=True,
+        deletes ids of the same `source` that are no longer present. Documents
+        from other sources are never pruned. Documents indexed before ingestion
+        recorded hashes carry no `source` either and are pruned with the file
+        being synced; the ones still present are re-embedded with it. Stale
+        chunks of an incoming item are always deleted. Returns document counts
+        per outcome.
+
+        With an EmbeddingPipeline the upserts are embedded in parallel batches and
+        its throughput stats are added under "embedding". rebuild=True re-embeds
+        every document regardless of its stored hash. Documents of `retired`
+        item ids (e.g. collapsed duplicates) are deleted even without prune.
+        """
+        # Last occurrence wins if the source repeats an id
+        incoming, parents = {}, set()
+        for item in items:
+            parents.add(item["id"])
+            for doc_id, text, meta in documents_for(item):
+                if source is not None:
+                    meta["source"] = source
+                meta_digest = metadata_hash(meta)
+                meta.update(content_hash=content_hash(text), metadata_hash=meta_digest)
+                incoming[doc_id] = (text, meta)
+
+        retired = set(retired)
+        if prune:
+            stored = self._stored_hashes(collection)
+        else:
+            # Appends only touch the incoming items, so only their documents are looked up
+            stored = self._stored_hashes_for(collection, set(incoming) | retired, parents | retired)
+        upserts, updates = [], []
+        for doc_id, (text, meta) in incoming.items():
+            previous = stored.get(doc_id)
+            if rebuild or previous is None or previous[0] != meta["content_hash"]:
+                upserts.append(doc_id)
+            elif previous[1] != meta["metadata_hash"]:
+                updates.append(doc_id)
+        # Legacy documents (no content hash) predate `source`, so they belong to whichever file prunes first
+        deletes = [doc_id for doc_id, (stored_hash, _, parent_id, stored_source) in stored.items()
+                   if doc_id not in incoming and ((prune and (stored_source == source or stored_hash is None))
+                                                  or parent_id in parents or doc_id in retired or parent_id in retired)]
+
+        embedding_stats = None
+        if pipeline is not None:
+            embedding_stats = pipeline.upsert(collection, upserts, [incoming[d][0] for d in upserts],
+                                              [incoming[d][1] for d in upserts], self.embedding_fn)
+        else:
+            for i in range(0, len(upserts), INGEST_BATCH_SIZE):
+                batch = upserts[i:i + INGEST_BATCH_SIZE]
+                collection.upsert(
+                    ids=batch,
+                    documents=[incoming[d][0] for d in batch],
+                    metadatas=[incoming[d][1] for d in batch],
+                )
+        for i in range(0, len(updates), INGEST_BATCH_SIZE):
+            batch = updates[i:i + INGEST_BATCH_SIZE]
+            collection.update(ids=batch, metadatas=[incoming[d][1] for d in batch])
+        for i in range(0, len(deletes), INGEST_BATCH_SIZE):
+            collection.delete(ids=deletes[i:i + INGEST_BATCH_SIZE])
+
+        if upserts or updates or deletes:
+            self.collection_changed(collection, upserts + updates, deletes)
+
+        added = sum(1 for d in upserts if d not in stored)
+        stats = {
+            "added": added,
+            "updated": len(upserts) - added + len(updates),
+            "unchanged": len(incoming) - len(upserts) - len(updates),
+            "deleted": len(deletes),
+        }
+        if embedding_stats is not None:
+            stats["embedding"] = embedding_stats
+        return stats
+
+    def _ingest(self, collection, items, documents_for, prune, pipeline, rebuild, dedup, text_of, key_of=None,
+                source=None):
+        if not dedup:
+            return self.sync_collection(collection, items, documents_for, prune, pipeline, rebuild, source=source)
+        # dedup=True uses the default similarity threshold; a float sets it
+        threshold = DEDUP_THRESHOLD if dedup is True else float(dedup)
+        canonical, aliases = collapse_duplicates(items, text_of, threshold, key_of=key_of)
+        retired = [alias for ids in aliases.values() for alias in ids]
+        stats = self.sync_collection(collection, canonical, with_aliases(documents_for, aliases),
+                                     prune, pipeline, rebuild, retired, source)
+        stats["collapsed"] = len(retired)
+        return stats
+
+    def ingest_research(self, content_file, prune=True, pipeline=None, rebuild=False, dedup=INGEST_DEDUP):
         with open(content_file, "r") as f:
             content = json.load(f)
-        
-        documents = [f"{item['title']}\n\n{item['abstract']}\n\nStrategic Value: {item['strategic_value']}" for item in content]
-        metadatas = [{"id": item["id"], "title": item["title"], "tags": ",".join(item["tags"])} for item in content]
-        ids = [item["id"] for item in content]
-        
-        self.research_collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
-        print(f"Ingested {len(ids)} research papers into ChromaDB.")
 
-    def ingest_interactions(self, interaction_file):
+        stats = self._ingest(self.research_collection, content, research_documents, prune, pipeline, rebuild,
+                             dedup, research_dedup_text, source=os.path.basename(content_file))
+        collapsed = f", {stats['collapsed']} near-duplicates collapsed" if dedup else ""
+        print(f"Ingested {len(content)} research papers into the {self.backend} vector store "
+              f"({stats['added']} added, {stats['updated']} updated, {stats['deleted']} deleted{collapsed}).")
+        return stats
+
+    def ingest_interactions(self, interaction_file, prune=True, pipeline=None, rebuild=False, dedup=INGEST_DEDUP):
         with open(interaction_file, "r") as f:
             interactions = json.load(f)
-        
-        documents = [f"Client: {item['client_name']}\nType: {item['type']}\nSummary: {item['summary']}\nActions: {', '.join(item['actions_identified'])}" for item in interactions]
-        metadatas = [{"id": item["id"], "client_id": item["client_id"], "client_name": item["client_name"], "sentiment": item["sentiment"]} for item in interactions]
-        ids = [item["id"] for item in interactions]
-        
-        self.interaction_collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
-        print(f"Ingested {len(ids)} interaction records into ChromaDB.")
 
-    def search_research(self, query, n_results=5):
-        results = self.research_collection.query(
-            query_texts=[query],
-            n_results=n_results
-        )
-        return results
+        stats = self.ingest_interaction_records(interactions, prune, pipeline, rebuild, dedup,
+                                                source=os.path.basename(interaction_file))
+        collapsed = f", {stats['collapsed']} near-duplicates collapsed" if dedup else ""
+        print(f"Ingested {len(interactions)} interaction records into the {self.backend} vector store "
+              f"({stats['added']} added, {stats['updated']} updated, {stats['deleted']} deleted{collapsed}).")
+        return stats
 
-    def search_interactions(self, query, client_id=None, n_results=5):
-        where = {"client_id": client_id} if client_id else None
-        results = self.interaction_collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where
-        )
+    def ingest_interaction_records(self, interactions, prune=False, pipeline=None, rebuild=False,
+                                   dedup=INGEST_DEDUP, source=None):
+        """Indexes interaction dicts directly; by default an append that leaves other interactions alone."""
+        # Only interactions of the same client are collapsed, so client-scoped search keeps working
+        return self._ingest(self.interaction_collection, interactions, interaction_documents, prune, pipeline,
+                            rebuild, dedup, interaction_dedup_text, key_of=lambda item: item.get("client_id"),
+                            source=source)
+
+    def _stamp_path(self, collection):
+        return os.path.join(self.persist_directory, f".{collection.name}.version")
+
+    def collection_version(self, collection):
+        """
+        Changes whenever `collection` is written: by this store (a counter) or
+        by another process sharing the persist directory (the identity of a
+        stamp file every write replaces).
+        """
+        try:
+            stat = os.stat(self._stamp_path(collection))
+            stamp = (stat.st_ino, stat.st_mtime_ns)
+        except FileNotFoundError:
+            stamp = None
+        return self._versions.get(collection.name, 0), stamp
+
+    def collection_changed(self, collection, changed=None, deleted=None):
+        """
+        Invalidates cached results and lexical indexes after a write to
+        `collection`. With the written and deleted ids, the write is logged for
+        changes_since().
+        """
+        before = self.collection_version(collection)
+        self._versions[collection.name] = self._versions.get(collection.name, 0) + 1
+        # The NumPy backend buffers writes in memory until persisted
+        if hasattr(collection, "persist"):
+            collection.persist()
+        path = self._stamp_path(collection)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(str(self._versions[collection.name]))
+        os.replace(tmp, path)
+        log = self._changes.setdefault(collection.name, deque(maxlen=CHANGE_LOG_SIZE))
+        if changed is None and deleted is None:
+            log.clear()
+        else:
+            log.append((before, self.collection_version(collection), set(changed or ()), set(deleted or ())))
+
+    def changes_since(self, collection, version):
+        """
+        (changed ids, deleted ids) from `version` to the current version, or None
+        if that isn't known: another process wrote in between, a write wasn't
+        logged, or the log no longer reaches back that far.
+        """
+        current = self.collection_version(collection)
+        changed, deleted = set(), set()
+        if version == current:
+            return changed, deleted
+        log = list(self._changes.get(collection.name, ()))
+        start = next((i for i, entry in enumerate(log) if entry[0] == version), None)
+        if start is None:
+            return None
+        expected = version
+        for before, after, written, removed in log[start:]:
+            if before != expected:
+                return None
+            changed = (changed - removed) | written
+            deleted = (deleted - written) | removed
+            expected = after
+        return (changed, deleted) if expected == current else None
+
+    def export_snapshot(self, directory, data_dir=None):
+        """Writes a checksummed, prebuilt index snapshot (see rag/index_snapshot.py)."""
+        from gss_agent.rag.index_snapshot import DATA_DIR, export_snapshot
+        return export_snapshot(self, directory, data_dir or DATA_DIR)
+
+    def import_snapshot(self, directory, data_dir=None):
+        """Loads a snapshot's documents and embeddings into this store without re-embedding."""
+        from gss_agent.rag.index_snapshot import DATA_DIR, import_snapshot
+        return import_snapshot(self, directory, data_dir or DATA_DIR)
+
+    def embed_queries(self, queries):
+        """Embeddings for several queries, computing all cache misses in one model call."""
+        keys = [normalize_query(q) for q in queries]
+        embeddings = {}
+        for key in keys:
+            if key not in embeddings:
+                embeddings[key] = self.embedding_cache.get(key)
+        missing = [key for key, embedding in embeddings.items() if embedding is None]
+        if missing:
+            for key, vector in zip(missing, self.embedding_fn(missing)):
+                embeddings[key] = [float(x) for x in vector]
+                self.embedding_cache.put(key, embeddings[key])
+        return [embeddings[key] for key in keys]
+
+    def embed_query(self, query):
+        return self.embed_queries([query])[0]
+
+    def _result_key(self, collection, query, n_results, where, embeddings=False):
+        return (collection.name, self.collection_version(collection), normalize_query(query),
+                json.dumps(where, sort_keys=True) if where else None, n_results, embeddings)
+
+    def query_collection(self, collection, query, n_results, where=None, embeddings=False):
+        return self.query_collection_batch(collection, [(query, where)], n_results, embeddings)[0]
+
+    def query_collection_batch(self, collection, requests, n_results, embeddings=False):
+        """
+        Results for many (query, where) pairs, in order. Cache misses are embedded
+        in one batch and sent as one collection query per distinct filter.
+        Cached results are shared between callers; treat them as read-only.
+        `embeddings=True` also returns the matched documents' embeddings.
+        """
+        include = ["documents", "metadatas", "distances"] + (["embeddings"] if embeddings else [])
+        results = [None] * len(requests)
+        missing = {}
+        for i, (query, where) in enumerate(requests):
+            results[i] = self.result_cache.get(self._result_key(collection, query, n_results, where, embeddings))
+            if results[i] is None:
+                missing.setdefault(json.dumps(where, sort_keys=True) if where else None, []).append(i)
+        if not missing:
+            return results
+
+        indexes = [i for group in missing.values() for i in group]
+        query_embeddings = dict(zip(indexes, self.embed_queries([requests[i][0] for i in indexes])))
+        for group in missing.values():
+            where = requests[group[0]][1]
+            raw = collection.query(
+                query_embeddings=[query_embeddings[i] for i in group],
+                n_results=n_results,
+                where=where,
+                include=include
+            )
+            # Split the batched response back into one single-query result per request
+            for pos, i in enumerate(group):
+                results[i] = {k: [v[pos]] if k != "included" and isinstance(v, list) else v
+                              for k, v in raw.items()}
+                self.result_cache.put(self._result_key(collection, requests[i][0], n_results, where, embeddings),
+                                      results[i])
         return results
 
+    @staticmethod
+    def group_results(labels, results):
+        """
+        Merges per-query results into [{**label, "matches": [...]}]. A document
+        matched by several queries is listed once, under the query it is closest
+        to: lowest "distances", or highest fused "scores" for hybrid results.
+        """
+        key = "distances" if all("distances" in result for result in results) else "scores"
+        best = {}
+        for group, result in enumerate(results):
+            for doc_id, value in zip(result["ids"][0], result[key][0]):
+                distance = value if key == "distances" else -value
+                if doc_id not in best or distance < best[doc_id][0]:
+                    best[doc_id] = (distance, group)
+
+        grouped, seen = [], set()
+        for group, (label, result) in enumerate(zip(labels, results)):
+            matches = []
+            for pos, doc_id in enumerate(result["ids"][0]):
+                if best[doc_id][1] != group or doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                matches.append({
+                    "id": doc_id,
+                    "document": result["documents"][0][pos] if result.get("documents") else None,
+                    "metadata": result["metadatas"][0][pos] if result.get("metadatas") else None,
+                    key[:-1]: result[key][0][pos],
+                })
+            grouped.append(dict(label, matches=matches))
+        return grouped
+
+    def cache_stats(self):
+        return {"query_embeddings": self.embedding_cache.stats(), "results": self.result_cache.stats()}
+
+    def search_research(self, query, n_results=5, mmr_lambda=None, **filters):
+        """
+        Filters: tags, published_after, published_before (see rag/filters.research_filter).
+        `mmr_lambda` (0-1) re-ranks a wider candidate list for diversity (see rag/mmr.py).
+        """
+        where = research_filter(**filters)
+        if mmr_lambda is None:
+            return self.query_collection(self.research_collection, query, n_results, where)
+        candidates = self.query_collection(self.research_collection, query, n_results * MMR_FANOUT, where,
+                                           embeddings=True)
+        return mmr_rerank(candidates, self.embed_query(query), n_results, mmr_lambda)
+
+    def search_interactions(self, query, client_id=None, n_results=5, **filters):
+        """
+        Best `n_results` interactions, each with only its most relevant passages.
+        Filters: sentiment, interaction_type, since, until (see rag/filters.interaction_filter).
+        """
+        where = interaction_filter(client_id=client_id, **filters)
+        chunks = self.query_collection(self.interaction_collection, query, n_results * CHUNK_FANOUT, where)
+        return aggregate_by_parent(chunks, n_results)
+
+    def search_research_batch(self, queries, n_results=5, mmr_lambda=None):
+        """
+        Several research searches in one round trip, grouped by query and
+        deduplicated. Each query is ranked as by search_research().
+        """
+        requests = [(q, None) for q in queries]
+        if mmr_lambda is None:
+            results = self.query_collection_batch(self.research_collection, requests, n_results)
+        else:
+            candidates = self.query_collection_batch(self.research_collection, requests, n_results * MMR_FANOUT,
+                                                     embeddings=True)
+            results = [mmr_rerank(result, embedding, n_results, mmr_lambda)
+                       for result, embedding in zip(candidates, self.embed_queries(queries))]
+        return self.group_results([{"query": q} for q in queries], results)
+
+    def search_interactions_batch(self, queries, client_ids=None, n_results=5):
+        """
+        Several interaction searches in one round trip. `client_ids` optionally
+        scopes each query (same length as `queries`, None for unscoped).
+        """
+        requests, labels = interaction_batch(queries, client_ids)
+        results = [aggregate_by_parent(chunks, n_results)
+                   for chunks in self.query_collection_batch(self.interaction_collection, requests,
+                                                             n_results * CHUNK_FANOUT)]
+        return self.group_results(labels, results)
+
+    # Async variants for callers on the event loop; the search runs on the bounded tool executor
+
+    async def asearch_research(self, query, n_results=5, **kwargs):
+        return await run_blocking(self.search_research, query, n_results, **kwargs)
+
+    async def asearch_interactions(self, query, client_id=None, n_results=5, **filters):
+        return await run_blocking(self.search_interactions, query, client_id, n_results, **filters)
+
+    async def asearch_research_batch(self, queries, n_results=5, **kwargs):
+        return await run_blocking(self.search_research_batch, queries, n_results, **kwargs)
+
+    async def asearch_interactions_batch(self, queries, client_ids=None, n_results=5):
+        return await run_blocking(self.search_interactions_batch, queries, client_ids, n_results)
+
 if __name__ == "__main__":
+    from gss_agent.data.snapshot import DATA_DIR
+
     v_store = NexusVectorStore()
-    
-    # Absolute paths for data files
-    base_dir = "/Users/govindmittal/datascience-setup/interview_prep/gartner/gss_agent/data"
-    
+    base_dir = DATA_DIR
+
     v_store.ingest_research(os.path.join(base_dir, "content.json"))
     v_store.ingest_interactions(os.path.join(base_dir, "interactions.json"))
     
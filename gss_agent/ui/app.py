@@ -1,7 +1,6 @@
 import gradio as gr
-import os
-import json
 from gss_agent.core.agents import get_nexus_agent
+from gss_agent.data.snapshot import get_snapshot
 import time
 from langchain_core.messages import HumanMessage, ToolMessage, AIMessage
 import plotly.graph_objects as go
@@ -33,13 +32,8 @@ class NexusTheme(gr.themes.Base):
             button_primary_text_color="#FFFFFF",
         )
 
-# Load client names
-dir_path = os.path.dirname(os.path.realpath(__file__))
-data_path = os.path.join(os.path.dirname(dir_path), "data/clients.json")
-
-with open(data_path, "r") as f:
-    clients_data = json.load(f)
-    CLIENT_NAMES = [c["name"] for c in clients_data]
+# Load client names from the shared data snapshot
+CLIENT_NAMES = [c["name"] for c in get_snapshot().clients]
 
 agent = get_nexus_agent()
 
@@ -0,0 +1,111 @@
+"""
+Concurrency benchmark for the agent tools under one asyncio event loop, the
+way /api/chat serves simultaneous SSE streams.
+
+Each simulated stream makes a sequence of tool calls. A heartbeat task
+measures event loop lag: how late its 10 ms ticks fire, which is how long
+every other stream is stalled. Two modes are compared:
+  inline    the tool function is called directly on the loop (a blocking tool)
+  executor  tool.ainvoke(), i.e. the coroutine that runs on the bounded tool
+            executor (gss_agent/core/executor.py)
+
+Usage:
+    python scripts/benchmark_async_tools.py [--streams 1 8 32] [--calls 10] [--skip-search]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.core import executor
+from gss_agent.core.executive_tools import get_revenue_snapshot, rank_clients_by_churn_risk
+from gss_agent.core.tools import (get_client_engagement_metrics, lookup_client_file,
+                                  search_research_library)
+from gss_agent.data.snapshot import get_snapshot
+
+
+def build_calls(skip_search):
+    names = [c["name"] for c in get_snapshot().clients]
+    calls = []
+    for i, name in enumerate(names):
+        calls.append((lookup_client_file, {"client_name": name}))
+        calls.append((get_client_engagement_metrics, {"client_name": name}))
+        if not skip_search:
+            calls.append((search_research_library, {"query": f"renewal risk strategy for {name}"}))
+        if i % 5 == 0:
+            calls.append((get_revenue_snapshot, {}))
+            calls.append((rank_clients_by_churn_risk, {"top_n": 5}))
+    return calls
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(int(p * len(values)), len(values) - 1)]
+
+
+async def run(mode, streams, calls_per_stream, calls):
+    latencies, lags = [], []
+    stop = asyncio.Event()
+
+    async def heartbeat():
+        interval = 0.01
+        expected = time.perf_counter() + interval
+        while not stop.is_set():
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            lags.append(max(now - expected, 0) * 1000)
+            expected = now + interval
+
+    async def stream(offset):
+        for n in range(calls_per_stream):
+            tool, args = calls[(offset * calls_per_stream + n) % len(calls)]
+            started = time.perf_counter()
+            if mode == "inline":
+                await asyncio.sleep(0)
+                tool.func(**args)
+            else:
+                await tool.ainvoke(args)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    beat = asyncio.create_task(heartbeat())
+    started = time.perf_counter()
+    await asyncio.gather(*(stream(i) for i in range(streams)))
+    wall = time.perf_counter() - started
+    stop.set()
+    await beat
+    return latencies, lags, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tool latency with concurrent streams.")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--calls", type=int, default=10, help="tool calls per stream")
+    parser.add_argument("--skip-search", action="store_true",
+                        help="data tools only (no Chroma / embedding model needed)")
+    args = parser.parse_args()
+
+    calls = build_calls(args.skip_search)
+    # Warm up the snapshot, vector store and embedding model outside the measurement
+    for tool, tool_args in calls[:6]:
+        tool.func(**tool_args)
+
+    print(f"🚀 {len(calls)} distinct tool calls, {args.calls} per stream, "
+          f"{executor.TOOL_WORKERS} executor workers")
+    print(f"\n📊 {'mode':<9} {'streams':>7} {'p50 ms':>8} {'p99 ms':>8} {'loop lag p99':>13} "
+          f"{'max lag':>8} {'calls/s':>8}")
+    for streams in args.streams:
+        for mode in ("inline", "executor"):
+            latencies, lags, wall = asyncio.run(run(mode, streams, args.calls, calls))
+            lags = lags or [0.0]
+            print(f"  {mode:<9} {streams:>7} {statistics.median(latencies):>8.2f} "
+                  f"{percentile(latencies, 0.99):>8.2f} {percentile(lags, 0.99):>11.2f} ms "
+                  f"{max(lags):>8.2f} {len(latencies) / wall:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
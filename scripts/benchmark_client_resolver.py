@@ -0,0 +1,99 @@
+"""
+Benchmarks client-name resolution latency as the portfolio grows.
+
+Compares the trigram-indexed ClientNameResolver against the original linear
+substring scan on synthetic portfolios.
+
+Usage:
+    python scripts/benchmark_client_resolver.py --sizes 1000 10000 50000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.resolver import ClientNameResolver
+
+SYLLABLES = ["ca", "dar", "nex", "us", "pin", "na", "cle", "au", "ro", "ra", "sum", "mit", "ver",
+             "tex", "har", "bor", "quan", "tum", "at", "las", "bea", "con", "crest", "ev", "er",
+             "green", "iron", "wood", "lu", "mi", "vo", "zen", "tal", "ky", "or", "bis", "del", "fi"]
+SECTORS = ["Health", "Tech", "Logistics", "Precision", "Retail", "Cloud", "Energy", "Financial",
+           "Data", "Transit", "Dynamics", "Capital", "Systems", "Bio", "Media", "Foods"]
+SUFFIXES = ["Corp", "Inc", "Group", "Partners", "Holdings", "Solutions", "Ltd", "Alliance"]
+
+
+def synthetic_clients(n, seed=7):
+    rng = random.Random(seed)
+    clients = []
+    for i in range(n):
+        brand = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        name = f"{brand} {rng.choice(SECTORS)} {rng.choice(SUFFIXES)}"
+        clients.append({"id": f"c_bench_{i}", "name": name})
+    return clients
+
+
+def make_queries(clients, count, seed=11):
+    rng = random.Random(seed)
+    queries = []
+    for client in rng.sample(clients, min(count, len(clients))):
+        name = client["name"]
+        kind = rng.choice(["exact", "partial", "typo"])
+        if kind == "partial":
+            name = name.split()[0]
+        elif kind == "typo":
+            pos = rng.randrange(1, len(name) - 1)
+            name = name[:pos] + name[pos + 1:]
+        queries.append(name)
+    return queries
+
+
+def linear_scan(clients, name):
+    needle = name.lower()
+    for c in clients:
+        if needle in c.get("name", "").lower():
+            return c
+    return None
+
+
+def time_calls(fn, queries):
+    timings = []
+    for q in queries:
+        start = time.perf_counter()
+        fn(q)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000, 100000])
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'clients':>8} | {'build (s)':>9} | {'resolver p50':>12} | {'resolver p95':>12} | {'scan p50':>9} | {'scan p95':>9}")
+    print("-" * 75)
+    for size in args.sizes:
+        clients = synthetic_clients(size)
+        queries = make_queries(clients, args.queries)
+
+        start = time.perf_counter()
+        resolver = ClientNameResolver(clients)
+        build_s = time.perf_counter() - start
+
+        fast = time_calls(resolver.resolve, queries)
+        scan = time_calls(lambda q: linear_scan(clients, q), queries)
+        print(f"{size:>8} | {build_s:>9.2f} | {fast['p50_ms']:>10.3f}ms | {fast['p95_ms']:>10.3f}ms "
+              f"| {scan['p50_ms']:>7.3f}ms | {scan['p95_ms']:>7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Measures what near-duplicate collapsing at ingestion (gss_agent/rag/dedup.py)
+does to the index and to search.
+
+Ingests the research library and interactions into two NumPy-backed stores,
+one plain and one with dedup=True. Reports documents indexed, embedding
+matrix size, ingest time, and recall@k / latency on the golden query set (a
+hit on a collapsed alias counts). --copies appends lightly edited copies of
+random research items (a few words dropped), like the research generators
+produce when re-run, to see the effect on a noisier library.
+
+Usage:
+    python scripts/benchmark_dedup.py [--k 5] [--copies 200] [--threshold 0.7]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag import dedup
+from gss_agent.rag.evaluation import evaluate, golden_queries, ranked_ids
+from gss_agent.rag.vector_store import NexusVectorStore
+
+
+def load(name):
+    with open(os.path.join(DATA_DIR, name), "r") as f:
+        return json.load(f)
+
+
+def near_copies(research, count, drop=0.05, seed=0):
+    rng = random.Random(seed)
+    copies = []
+    for n in range(count):
+        item = dict(rng.choice(research))
+        words = item.get("abstract", "").split()
+        item["abstract"] = " ".join(w for w in words if rng.random() > drop)
+        item["id"] = f"{item['id']}-copy-{n}"
+        copies.append(item)
+    return copies
+
+
+def index_bytes(directory):
+    total = 0
+    for root, _, names in os.walk(directory):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in names if name.endswith(".npy"))
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate collapsing at ingestion.")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--copies", type=int, default=0, help="Synthetic near-duplicate research items to add")
+    parser.add_argument("--threshold", type=float, default=dedup.DEDUP_THRESHOLD)
+    args = parser.parse_args()
+
+    clients, interactions, research = load("clients.json"), load("interactions.json"), load("content.json")
+    research = research + near_copies(research, args.copies)
+    queries = golden_queries(clients, interactions, research)
+    workdir = tempfile.mkdtemp(prefix="nexus_dedup_bench_")
+    content_path = os.path.join(workdir, "content.json")
+    with open(content_path, "w") as f:
+        json.dump(research, f)
+    interactions_path = os.path.join(DATA_DIR, "interactions.json")
+
+    print(f"🚀 {len(research)} research items ({args.copies} synthetic copies), {len(interactions)} interactions, "
+          f"{len(queries)} golden queries")
+    rows = []
+    for label, enabled in (("plain", False), ("dedup", args.threshold)):
+        persist_dir = os.path.join(workdir, label)
+        store = NexusVectorStore(persist_directory=persist_dir, backend="numpy", cache_size=0)
+        started = time.perf_counter()
+        store.ingest_research(content_path, dedup=enabled)
+        store.ingest_interactions(interactions_path, dedup=enabled)
+        ingest_s = time.perf_counter() - started
+
+        def search(query, k):
+            if query["collection"] == "research":
+                return ranked_ids(store.search_research(query["query"], n_results=k))
+            return ranked_ids(store.search_interactions(query["query"], client_id=query["client_id"], n_results=k))
+
+        search(queries[0], args.k)
+        report = evaluate(search, queries, args.k)["overall"]
+        documents = store.research_collection.count() + store.interaction_collection.count()
+        rows.append((label, documents, index_bytes(persist_dir), ingest_s, report))
+
+    print(f"\n📊 {'ingest':<7} {'docs':>6} {'index MB':>9} {'ingest s':>9} {f'recall@{args.k}':>9} {'mrr':>6} "
+          f"{'p50 ms':>7} {'p95 ms':>7}")
+    for label, documents, size, ingest_s, o in rows:
+        print(f"  {label:<7} {documents:>6} {size / 2**20:>9.2f} {ingest_s:>9.2f} {o['recall']:>9.1%} "
+              f"{o['mrr']:>6.3f} {o['p50_ms']:>7.2f} {o['p95_ms']:>7.2f}")
+    (_, plain_docs, plain_size, _, plain), (_, dedup_docs, dedup_size, _, deduped) = rows
+    print(f"\n✅ Index {1 - dedup_docs / plain_docs:.1%} fewer documents, {1 - dedup_size / max(plain_size, 1):.1%} "
+          f"smaller; p50 latency {deduped['p50_ms'] - plain['p50_ms']:+.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares vector-only and hybrid (BM25 + vector, RRF) retrieval over the
+research library: recall@k and per-query latency.
+
+Queries are the research titles themselves (exact-match heavy) and truncated
+titles (the first few words, as an agent would type them). A query counts as
+a hit if a report with that title is in the top k. Result caching is disabled
+so every query pays the full retrieval cost.
+
+Usage:
+    python scripts/benchmark_hybrid_retrieval.py [--k 3] [--persist-dir DIR]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.hybrid import HybridRetriever
+from gss_agent.rag.vector_store import NexusVectorStore
+
+
+def build_queries(research, words=4):
+    queries = []
+    for item in research:
+        queries.append(("exact title", item["title"], item["title"]))
+        queries.append(("truncated title", " ".join(item["title"].split()[:words]), item["title"]))
+    return queries
+
+
+def evaluate(search, queries, k):
+    """{kind: (recall, p50_ms, p95_ms)} for a search(query, n_results) callable."""
+    by_kind = {}
+    for kind, query, title in queries:
+        started = time.perf_counter()
+        results = search(query, n_results=k)
+        elapsed = (time.perf_counter() - started) * 1000
+        hit = title in [m.get("title") for m in results["metadatas"][0]]
+        hits, latencies = by_kind.setdefault(kind, ([], []))
+        hits.append(hit)
+        latencies.append(elapsed)
+    report = {}
+    for kind, (hits, latencies) in by_kind.items():
+        latencies.sort()
+        report[kind] = (sum(hits) / len(hits), statistics.median(latencies),
+                        latencies[int(0.95 * (len(latencies) - 1))])
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector-only vs hybrid retrieval.")
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--persist-dir", default=None, help="Chroma directory (a temporary one by default)")
+    args = parser.parse_args()
+
+    content_path = os.path.join(DATA_DIR, "content.json")
+    with open(content_path, "r") as f:
+        research = json.load(f)
+
+    persist_dir = args.persist_dir or tempfile.mkdtemp(prefix="nexus_bench_")
+    print(f"🚀 Ingesting {len(research)} research items into {persist_dir}")
+    store = NexusVectorStore(persist_directory=persist_dir, cache_size=0)
+    store.ingest_research(content_path)
+    hybrid = HybridRetriever(store)
+    # Build the lexical index outside the timed loop
+    hybrid.search_research("warm up", n_results=1)
+
+    queries = build_queries(research)
+    reports = {
+        "vector": evaluate(store.search_research, queries, args.k),
+        "hybrid": evaluate(hybrid.search_research, queries, args.k),
+    }
+
+    print(f"\n📊 Recall@{args.k} and latency over {len(queries)} queries")
+    print(f"  {'retriever':<8} {'queries':<16} {'recall':>7} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, report in reports.items():
+        for kind, (recall, p50, p95) in report.items():
+            print(f"  {name:<8} {kind:<16} {recall:>7.0%} {p50:>8.2f} {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
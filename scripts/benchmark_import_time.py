@@ -0,0 +1,77 @@
+"""
+Measures cold import time of the agent entry points, and how long the shared
+data snapshot takes to become usable in lazy vs eager mode.
+
+Each import runs in a fresh interpreter so module caches don't hide the cost.
+
+Usage:
+    python scripts/benchmark_import_time.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+MODULES = [
+    "gss_agent.data.snapshot",
+    "gss_agent.core.tools",
+    "gss_agent.core.executive_tools",
+    "gss_agent.api.main",
+]
+
+SNAPSHOT_PROBE = """
+import time
+t = time.perf_counter()
+from gss_agent.data.snapshot import get_snapshot
+snapshot = get_snapshot()
+snapshot.get_client_by_id(snapshot.clients[0]["id"])
+print(time.perf_counter() - t)
+"""
+
+
+def time_in_subprocess(code, env=None):
+    """Runs `code` in a fresh interpreter and returns (seconds, error)."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+        return None, last_line
+    return float(result.stdout.strip().splitlines()[-1]), None
+
+
+def bench(label, code, runs, env=None):
+    timings = []
+    for _ in range(runs):
+        seconds, error = time_in_subprocess(code, env)
+        if error:
+            print(f"  {label:<40} ⚠️  skipped ({error})")
+            return
+        timings.append(seconds * 1000)
+    print(f"  {label:<40} median {statistics.median(timings):8.1f} ms   min {min(timings):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import and data startup time.")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"🚀 Cold import time ({args.runs} runs each)")
+    for module in MODULES:
+        code = f"import time\nt = time.perf_counter()\nimport {module}\nprint(time.perf_counter() - t)"
+        bench(module, code, args.runs)
+
+    print("\n📊 First client lookup on the shared snapshot")
+    bench("lazy (default)", SNAPSHOT_PROBE, args.runs, {"NEXUS_EAGER_LOAD": "0"})
+    bench("eager (NEXUS_EAGER_LOAD=1)", SNAPSHOT_PROBE, args.runs, {"NEXUS_EAGER_LOAD": "1"})
+
+
+if __name__ == "__main__":
+    main()
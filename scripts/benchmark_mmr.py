@@ -0,0 +1,95 @@
+"""
+Measures how MMR re-ranking trades redundancy for latency in research search.
+
+Queries are the research titles and truncated titles. For each MMR lambda
+(and plain search without MMR) it reports how many of the top k results share
+a title with another result, the mean pairwise cosine similarity of the
+returned documents, the share of queries whose own report is still in the
+top k, and per-query latency. Result caching is disabled.
+
+Usage:
+    python scripts/benchmark_mmr.py [--k 3] [--lambdas 0.9 0.7 0.5] [--retriever vector|hybrid]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.hybrid import HybridRetriever
+from gss_agent.rag.vector_store import NexusVectorStore
+
+
+def build_queries(research, words=4):
+    queries = []
+    for item in research:
+        queries.append((item["title"], item["title"]))
+        queries.append((" ".join(item["title"].split()[:words]), item["title"]))
+    return queries
+
+
+def mean_pairwise_similarity(embeddings):
+    if len(embeddings) < 2:
+        return 0.0
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    similarity = vectors @ vectors.T
+    n = len(vectors)
+    return float((similarity.sum() - n) / (n * (n - 1)))
+
+
+def evaluate(retriever, store, queries, k, mmr_lambda):
+    duplicates, similarities, hits, latencies = [], [], [], []
+    for query, title in queries:
+        started = time.perf_counter()
+        results = retriever.search_research(query, n_results=k, mmr_lambda=mmr_lambda)
+        latencies.append((time.perf_counter() - started) * 1000)
+        titles = [m.get("title") for m in results["metadatas"][0]]
+        duplicates.append(len(titles) - len(set(titles)))
+        hits.append(title in titles)
+        embedded = store.research_collection.get(ids=results["ids"][0], include=["embeddings"])["embeddings"]
+        similarities.append(mean_pairwise_similarity(embedded))
+    latencies.sort()
+    return (statistics.mean(duplicates), statistics.mean(similarities), sum(hits) / len(hits),
+            statistics.median(latencies), latencies[int(0.95 * (len(latencies) - 1))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MMR diversity vs latency for research search.")
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--lambdas", type=float, nargs="+", default=[0.9, 0.7, 0.5, 0.3])
+    parser.add_argument("--retriever", choices=["vector", "hybrid"], default="hybrid")
+    parser.add_argument("--persist-dir", default=None, help="Chroma directory (a temporary one by default)")
+    args = parser.parse_args()
+
+    content_path = os.path.join(DATA_DIR, "content.json")
+    with open(content_path, "r") as f:
+        research = json.load(f)
+
+    persist_dir = args.persist_dir or tempfile.mkdtemp(prefix="nexus_bench_")
+    print(f"🚀 Ingesting {len(research)} research items into {persist_dir}")
+    store = NexusVectorStore(persist_directory=persist_dir, cache_size=0)
+    store.ingest_research(content_path)
+    retriever = HybridRetriever(store) if args.retriever == "hybrid" else store
+    # Warm up the embedding model (and BM25 index) outside the timed loop
+    retriever.search_research("warm up", n_results=1)
+
+    queries = build_queries(research)
+    print(f"\n📊 {args.retriever} retrieval, top {args.k} over {len(queries)} queries")
+    print(f"  {'lambda':<8} {'dup titles':>10} {'pair sim':>9} {'own hit':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for mmr_lambda in [None] + args.lambdas:
+        dups, sim, hit, p50, p95 = evaluate(retriever, store, queries, args.k, mmr_lambda)
+        label = "off" if mmr_lambda is None else f"{mmr_lambda:g}"
+        print(f"  {label:<8} {dups:>10.2f} {sim:>9.3f} {hit:>8.0%} {p50:>8.2f} {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmarks int8 quantized storage in the NumPy vector backend against exact
+float32 search on synthetic, clustered, normalized embeddings. Reports the
+resident index size, query latency and recall@k for several re-scoring
+shortlist sizes (rescore x k rows re-scored at full precision).
+
+Usage:
+    python scripts/benchmark_quantization.py [--rows 50000] [--dim 384] [--queries 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.rag.numpy_backend import NumpyCollection
+
+BATCH = 1000
+
+
+def build(path, vectors, **options):
+    collection = NumpyCollection("bench", path, **options)
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    for i in range(0, len(vectors), BATCH):
+        collection.upsert(ids=ids[i:i + BATCH], embeddings=vectors[i:i + BATCH],
+                          metadatas=[{}] * len(ids[i:i + BATCH]))
+    collection.persist()
+    # Reopen from disk, as a serving process would
+    return NumpyCollection("bench", path, **options)
+
+
+def measure(collection, queries, k):
+    latencies, results = [], []
+    collection.query(query_embeddings=[queries[0]], n_results=k)
+    for query in queries:
+        started = time.perf_counter()
+        result = collection.query(query_embeddings=[query], n_results=k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append(set(result["ids"][0]))
+    latencies.sort()
+    return results, statistics.median(latencies), latencies[int(0.95 * (len(latencies) - 1))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark int8 quantized vs float32 vector search.")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--rescore", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Clustered like real embeddings (topics), rather than uniformly spread
+    centers = rng.normal(size=(max(args.rows // 100, 1), args.dim))
+    vectors = centers[rng.integers(len(centers), size=args.rows)] + 0.6 * rng.normal(size=(args.rows, args.dim))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+    queries = vectors[rng.choice(args.rows, args.queries)] + 0.05 * rng.normal(size=(args.queries, args.dim))
+    queries = (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(np.float32)
+
+    print(f"🚀 {args.rows} vectors x {args.dim} dims, {args.queries} queries")
+    exact = build(tempfile.mkdtemp(prefix="nexus_f32_"), vectors)
+    truth, p50, p95 = measure(exact, queries, args.k)
+    float_bytes = exact.memory_usage()["float32_bytes"]
+
+    quantized = build(tempfile.mkdtemp(prefix="nexus_int8_"), vectors, quantize=True)
+    int8_bytes = quantized.memory_usage()["int8_bytes"]
+
+    print(f"\n📊 Resident index: float32 {float_bytes / 2**20:.1f} MB, int8 {int8_bytes / 2**20:.1f} MB "
+          f"({1 - int8_bytes / float_bytes:.0%} saved)")
+    print(f"  {'search':<14} {'p50 ms':>8} {'p95 ms':>8} {f'recall@{args.k}':>10}")
+    print(f"  {'float32 exact':<14} {p50:>8.2f} {p95:>8.2f} {1:>10.0%}")
+    for rescore in args.rescore:
+        quantized.rescore = rescore
+        results, p50, p95 = measure(quantized, queries, args.k)
+        recall = sum(len(r & t) for r, t in zip(results, truth)) / (args.k * len(queries))
+        print(f"  {f'int8 x{rescore}':<14} {p50:>8.2f} {p95:>8.2f} {recall:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compares the retained memory of the datasets as parsed JSON dicts vs the
+compact record types in gss_agent/data/records.py, on a scaled-up copy of the
+sample data (each record is replicated with a distinct id).
+
+Usage:
+    python scripts/benchmark_record_memory.py [--scale 200]
+"""
+import argparse
+import copy
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.records import compact_dataset
+from gss_agent.data.snapshot import DATA_DIR, DATASET_FILES
+
+ID_FIELDS = ("id", "client_id", "associate_id")
+
+
+def scaled_json(name, scale):
+    """The dataset replicated `scale` times, serialized, so each run parses fresh objects."""
+    with open(os.path.join(DATA_DIR, DATASET_FILES[name]), "r") as f:
+        records = json.load(f)
+    scaled = []
+    for copy_no in range(scale):
+        for record in records:
+            clone = copy.deepcopy(record)
+            for field in ID_FIELDS:
+                if isinstance(clone.get(field), str):
+                    clone[field] = f"{clone[field]}-{copy_no}"
+            scaled.append(clone)
+    return json.dumps(scaled)
+
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns, with the result kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dataset memory: dicts vs compact records.")
+    parser.add_argument("--scale", type=int, default=200, help="Copies of the sample data")
+    args = parser.parse_args()
+
+    print(f"🚀 Retained memory at {args.scale}x the sample data")
+    print(f"  {'dataset':<12} {'records':>9} {'dicts':>11} {'records':>11} {'saving':>8}")
+    totals = [0, 0]
+    for name in DATASET_FILES:
+        text = scaled_json(name, args.scale)
+        count = len(json.loads(text))
+        as_dicts = retained_bytes(lambda: json.loads(text))
+        as_records = retained_bytes(lambda: compact_dataset(name, json.loads(text)))
+        totals[0] += as_dicts
+        totals[1] += as_records
+        saving = 1 - as_records / as_dicts if as_dicts else 0
+        print(f"  {name:<12} {count:>9} {as_dicts / 2**20:>8.1f} MiB {as_records / 2**20:>8.1f} MiB {saving:>7.0%}")
+
+    print(f"✅ Total: {totals[0] / 2**20:.1f} MiB -> {totals[1] / 2**20:.1f} MiB "
+          f"({1 - totals[1] / totals[0]:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
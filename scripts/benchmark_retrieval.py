@@ -0,0 +1,165 @@
+"""
+Retrieval quality and latency benchmark on the golden query set.
+
+Builds the fixed query set from the evaluation labels in the data files (see
+gss_agent/rag/evaluation.py), ingests research and interactions into each
+vector backend, and runs every query through each retriever configuration.
+Reports recall@k, MRR and p50/p95/p99 latency overall and per query kind.
+Result caching is disabled so every query pays the full retrieval cost.
+
+--output writes the results as JSON (with the git commit), and --compare
+prints the change against an earlier results file, so a retrieval change can
+be judged on quality and speed together:
+
+    python scripts/benchmark_retrieval.py --output before.json
+    # ... change retrieval code ...
+    python scripts/benchmark_retrieval.py --output after.json --compare before.json
+
+Usage:
+    python scripts/benchmark_retrieval.py [--k 5] [--configs numpy/vector numpy/hybrid ...]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.evaluation import evaluate, golden_queries, ranked_ids
+from gss_agent.rag.hybrid import HybridRetriever
+from gss_agent.rag.vector_store import NexusVectorStore
+
+# Store options per backend label
+BACKENDS = {
+    "chroma": {"backend": "chroma"},
+    "numpy": {"backend": "numpy"},
+    "numpy-ivf": {"backend": "numpy", "ivf_nlist": 16},
+    "numpy-int8": {"backend": "numpy", "quantize": True},
+    "numpy-dedup": {"backend": "numpy", "dedup": True},
+}
+# config name -> (backend label, retriever, MMR lambda)
+CONFIGS = {
+    "chroma/vector": ("chroma", "vector", None),
+    "chroma/hybrid": ("chroma", "hybrid", None),
+    "numpy/vector": ("numpy", "vector", None),
+    "numpy/hybrid": ("numpy", "hybrid", None),
+    "numpy/hybrid+mmr": ("numpy", "hybrid", 0.7),
+    "numpy-ivf/vector": ("numpy-ivf", "vector", None),
+    "numpy-int8/vector": ("numpy-int8", "vector", None),
+    "numpy-dedup/hybrid": ("numpy-dedup", "hybrid", None),
+}
+METRICS = ("recall", "mrr", "p50_ms", "p95_ms", "p99_ms")
+
+
+def load(name):
+    with open(os.path.join(DATA_DIR, name), "r") as f:
+        return json.load(f)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_store(label, persist_dir):
+    options = dict(BACKENDS[label])
+    dedup = options.pop("dedup", False)
+    store = NexusVectorStore(persist_directory=os.path.join(persist_dir, label), cache_size=0, **options)
+    started = time.perf_counter()
+    store.ingest_research(os.path.join(DATA_DIR, "content.json"), dedup=dedup)
+    store.ingest_interactions(os.path.join(DATA_DIR, "interactions.json"), dedup=dedup)
+    return store, time.perf_counter() - started
+
+
+def searcher(retriever, mmr_lambda):
+    def search(query, k):
+        if query["collection"] == "research":
+            result = retriever.search_research(query["query"], n_results=k, mmr_lambda=mmr_lambda)
+        else:
+            result = retriever.search_interactions(query["query"], client_id=query["client_id"], n_results=k)
+        return ranked_ids(result)
+    return search
+
+
+def print_comparison(results, baseline):
+    print(f"\n📊 Change vs {baseline.get('commit') or 'baseline'}")
+    for name, current in results["configs"].items():
+        before = baseline.get("configs", {}).get(name)
+        if before is None:
+            print(f"  {name:<20} (not in baseline)")
+            continue
+        deltas = []
+        for metric in METRICS:
+            delta = current["overall"][metric] - before["overall"][metric]
+            deltas.append(f"{metric} {delta:+.3f}" if metric in ("recall", "mrr") else f"{metric} {delta:+.2f}")
+        print(f"  {name:<20} " + "  ".join(deltas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark retrieval recall, MRR and latency on golden queries.")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--configs", nargs="+", choices=list(CONFIGS), default=list(CONFIGS))
+    parser.add_argument("--persist-dir", default=None, help="Store directory (a temporary one by default)")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    queries = golden_queries(load("clients.json"), load("interactions.json"), load("content.json"))
+    print(f"🚀 {len(queries)} golden queries, k={args.k}")
+    persist_dir = args.persist_dir or tempfile.mkdtemp(prefix="nexus_retrieval_bench_")
+
+    results = {"commit": git_commit(), "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+               "python": platform.python_version(), "k": args.k, "queries": len(queries), "configs": {}}
+    stores = {}
+    for name in args.configs:
+        label, retriever_kind, mmr_lambda = CONFIGS[name]
+        if label not in stores:
+            try:
+                stores[label] = build_store(label, persist_dir)
+            except ImportError as e:
+                print(f"  {label:<20} ⚠️  skipped ({e})")
+                stores[label] = None
+        if stores[label] is None:
+            continue
+        store, ingest_s = stores[label]
+        retriever = HybridRetriever(store) if retriever_kind == "hybrid" else store
+        search = searcher(retriever, mmr_lambda)
+        # Load the embedding model and build lexical indexes outside the measurement
+        for query in queries[:2]:
+            search(query, args.k)
+        report = evaluate(search, queries, args.k)
+        report["ingest_s"] = round(ingest_s, 3)
+        results["configs"][name] = report
+
+    print(f"\n📊 Overall (recall@{args.k}, MRR, latency in ms)")
+    print(f"  {'config':<20} {'recall':>7} {'mrr':>6} {'p50':>7} {'p95':>7} {'p99':>7}")
+    for name, report in results["configs"].items():
+        o = report["overall"]
+        print(f"  {name:<20} {o['recall']:>7.1%} {o['mrr']:>6.3f} {o['p50_ms']:>7.2f} {o['p95_ms']:>7.2f} "
+              f"{o['p99_ms']:>7.2f}")
+    for name, report in results["configs"].items():
+        print(f"\n  {name}")
+        for kind, o in report["by_kind"].items():
+            print(f"    {kind:<38} n={o['queries']:<4} recall {o['recall']:>6.1%}  mrr {o['mrr']:.3f}  "
+                  f"p95 {o['p95_ms']:.2f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Results written to {args.output}")
+    if args.compare:
+        with open(args.compare, "r") as f:
+            print_comparison(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Throughput and lag of streaming interaction ingestion (gss_agent/rag/streaming.py)
+across micro-batch sizes.
+
+For each batch size, a writer appends --records new interactions (copies of
+existing ones with fresh ids) to an intake file at --rate records per second
+while a StreamingIngestor tails it into a store that already holds the
+interactions. Reports records/s while embedding, p50/p95 lag from reading a
+line to it being searchable, the largest backlog seen, and the end-to-end
+time until the last record is searchable.
+
+Usage:
+    python scripts/benchmark_streaming_ingest.py [--records 2000] [--rate 500] [--batch-sizes 1 16 64 256]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.streaming import StreamingIngestor, append_interactions
+from gss_agent.rag.vector_store import NexusVectorStore
+
+
+def load(name):
+    with open(os.path.join(DATA_DIR, name), "r") as f:
+        return json.load(f)
+
+
+def new_records(interactions, count, tag):
+    return [dict(interactions[n % len(interactions)], id=f"STREAM-{tag}-{n}") for n in range(count)]
+
+
+def writer(path, records, rate, chunk=10):
+    started = time.perf_counter()
+    for i in range(0, len(records), chunk):
+        append_interactions(records[i:i + chunk], path)
+        # Paced against the start time, so slow appends don't lower the rate
+        delay = started + (i + chunk) / rate - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def run(store, workdir, interactions, batch_size, args):
+    path = os.path.join(workdir, f"intake-{batch_size}.jsonl")
+    records = new_records(interactions, args.records, batch_size)
+    ingestor = StreamingIngestor(store, path=path, batch_size=batch_size, max_wait=args.max_wait,
+                                 poll_interval=args.poll_interval).start()
+    started = time.perf_counter()
+    thread = threading.Thread(target=writer, args=(path, records, args.rate))
+    thread.start()
+
+    max_backlog = 0
+    while True:
+        stats = ingestor.stats()
+        max_backlog = max(max_backlog, stats["pending_records"])
+        if stats["ingested"] >= len(records):
+            break
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    thread.join()
+    ingestor.stop()
+    return dict(ingestor.stats(), elapsed=elapsed, max_backlog=max_backlog)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming ingestion throughput and lag.")
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=500, help="Records appended per second")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--max-wait", type=float, default=1.0)
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--backend", choices=["chroma", "numpy"], default="numpy")
+    args = parser.parse_args()
+
+    interactions = load("interactions.json")
+    workdir = tempfile.mkdtemp(prefix="nexus_stream_bench_")
+    store = NexusVectorStore(persist_directory=os.path.join(workdir, "store"), backend=args.backend)
+    print(f"🚀 Indexing {len(interactions)} existing interactions ({args.backend} backend)...")
+    store.ingest_interactions(os.path.join(DATA_DIR, "interactions.json"))
+
+    print(f"\n📊 {args.records} records appended at {args.rate:.0f}/s, max wait {args.max_wait}s")
+    print(f"  {'batch':>5} {'batches':>8} {'rec/s':>8} {'lag p50':>9} {'lag p95':>9} {'backlog':>8} {'total':>8}")
+    for batch_size in args.batch_sizes:
+        stats = run(store, workdir, interactions, batch_size, args)
+        lag = stats["lag_ms"]
+        print(f"  {batch_size:>5} {stats['batches']:>8} {stats['records_per_s'] or 0:>8.0f} "
+              f"{lag['p50']:>7.0f}ms {lag['p95']:>7.0f}ms {stats['max_backlog']:>8} {stats['elapsed']:>7.2f}s")
+        if stats["errors"]:
+            print(f"  ⚠️  {stats['errors']} intake lines skipped")
+    print("\n✅ Done")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmarks the vector index backends on synthetic, clustered, normalized embeddings:
+Chroma, the NumPy backend with exact search, and the NumPy backend with IVF
+partitioning. Reports build time, cold open time, query latency and recall@k
+against exact search.
+
+Usage:
+    python scripts/benchmark_vector_backends.py [--rows 20000] [--dim 384] [--queries 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.rag.numpy_backend import NumpyVectorClient
+
+BATCH = 1000
+
+
+def chroma_factory(path, rows):
+    import chromadb
+    # No embedding function: every write and query passes precomputed embeddings
+    return chromadb.PersistentClient(path=path).get_or_create_collection(
+        "bench", embedding_function=None, metadata={"hnsw:space": "l2"})
+
+
+def numpy_factory(nlist=None):
+    def factory(path, rows):
+        return NumpyVectorClient(path, nlist=nlist, nprobe=max(1, (nlist or 0) // 8)).get_or_create_collection("bench")
+    return factory
+
+
+def run(name, factory, vectors, queries, k, truth=None):
+    path = tempfile.mkdtemp(prefix=f"nexus_{name}_")
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+
+    started = time.perf_counter()
+    collection = factory(path, len(vectors))
+    for i in range(0, len(vectors), BATCH):
+        collection.upsert(ids=ids[i:i + BATCH], embeddings=vectors[i:i + BATCH],
+                          metadatas=[{"n": j} for j in range(i, min(i + BATCH, len(vectors)))])
+    if hasattr(collection, "persist"):
+        collection.persist()
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    collection = factory(path, len(vectors))
+    collection.query(query_embeddings=[queries[0]], n_results=k)
+    open_s = time.perf_counter() - started
+
+    latencies, results = [], []
+    for query in queries:
+        started = time.perf_counter()
+        result = collection.query(query_embeddings=[query], n_results=k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append(set(result["ids"][0]))
+
+    recall = (sum(len(r & t) for r, t in zip(results, truth)) / (k * len(queries))) if truth else 1.0
+    latencies.sort()
+    print(f"  {name:<12} build {build_s:7.2f}s   open+first query {open_s * 1000:8.1f} ms   "
+          f"p50 {statistics.median(latencies):7.2f} ms   p95 {latencies[int(0.95 * (len(latencies) - 1))]:7.2f} ms   "
+          f"recall@{k} {recall:.0%}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chroma vs the NumPy vector backend.")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=128, help="IVF lists for the partitioned run")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Clustered like real embeddings (topics), rather than uniformly spread
+    centers = rng.normal(size=(max(args.rows // 100, 1), args.dim))
+    vectors = centers[rng.integers(len(centers), size=args.rows)] + 0.6 * rng.normal(size=(args.rows, args.dim))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+    # Queries near existing rows, like real searches that have a relevant document
+    queries = vectors[rng.choice(args.rows, args.queries)] + 0.05 * rng.normal(size=(args.queries, args.dim))
+    queries = (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(np.float32)
+
+    print(f"🚀 {args.rows} vectors x {args.dim} dims, {args.queries} queries")
+    truth = run("numpy-exact", numpy_factory(), vectors, queries, args.k)
+    run("numpy-ivf", numpy_factory(args.nlist), vectors, queries, args.k, truth)
+    try:
+        run("chroma", chroma_factory, vectors, queries, args.k, truth)
+    except ImportError as e:
+        print(f"  chroma       ⚠️  skipped ({e})")
+
+
+if __name__ == "__main__":
+    main()
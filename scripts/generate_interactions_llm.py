@@ -114,9 +114,10 @@ async def main():
     
     # Ingest
     if results:
-        print("Ingesting into ChromaDB...")
         from gss_agent.rag.vector_store import NexusVectorStore
         v_store = NexusVectorStore(persist_directory=os.path.join(base_dir, "chroma_db"))
+        print(f"Ingesting into the {v_store.backend} vector store...")
+        # Pruning is scoped to this file's documents, so interactions.json is left alone
         v_store.ingest_interactions(output_path)
         print("Ingestion Complete.")
 
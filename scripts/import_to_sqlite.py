@@ -0,0 +1,38 @@
+"""
+Imports the JSON datasets under gss_agent/data into the embedded SQLite store.
+
+Usage:
+    python scripts/import_to_sqlite.py [--data-dir DIR] [--db PATH]
+
+Then run the API with NEXUS_DATA_BACKEND=sqlite (and NEXUS_SQLITE_PATH=PATH if
+you used a non-default location).
+"""
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.data.sqlite_store import DEFAULT_DB_PATH, SqliteDataStore, import_json
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import JSON datasets into the SQLite data store.")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    args = parser.parse_args()
+
+    print(f"🚀 Importing {args.data_dir} -> {args.db}")
+    import_json(args.data_dir, args.db)
+
+    report = SqliteDataStore(args.db).memory_report()
+    for table, stats in report.items():
+        if isinstance(stats, dict):
+            print(f"  {table:<12} {stats['records']:>8} rows")
+    print(f"✅ Import complete ({report['db_file_bytes'] / 1024:.0f} KiB on disk).")
+
+
+if __name__ == "__main__":
+    main()
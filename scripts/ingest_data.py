@@ -1,35 +1,83 @@
+"""
+Ingests the research library and client interactions into the vector store.
+
+Only new, changed and removed documents are touched (see NexusVectorStore);
+embeddings are computed in parallel batches by EmbeddingPipeline. Removals are
+limited to documents that came from content.json / interactions.json, so other
+sources in the collection (generated_interactions_llm.json, the streaming
+intake) are kept.
+
+Usage:
+    python scripts/ingest_data.py [--data-dir DIR] [--persist-dir DIR]
+                                  [--workers N] [--batch-size N] [--rebuild] [--dedup]
+"""
+import argparse
 import os
 import sys
-from gss_agent.rag.vector_store import NexusVectorStore
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.embedding_pipeline import DEFAULT_BATCH_SIZE, EmbeddingPipeline
+from gss_agent.rag.vector_store import INGEST_DEDUP, NexusVectorStore
+
+
+def print_progress(done, total, docs_per_sec):
+    end = "\n" if done == total else ""
+    print(f"\r   {done}/{total} documents embedded ({docs_per_sec:.0f} docs/sec)", end=end, flush=True)
+
+
+def print_stats(stats):
+    print(f"   {stats['added']} added, {stats['updated']} updated, "
+          f"{stats['unchanged']} unchanged, {stats['deleted']} deleted")
+    if "collapsed" in stats:
+        print(f"   {stats['collapsed']} near-duplicates collapsed into canonical documents")
+    embedding = stats.get("embedding")
+    if embedding and embedding["documents"]:
+        print(f"   Embedded {embedding['documents']} documents in {embedding['batches']} batches, "
+              f"{embedding['seconds']}s ({embedding['docs_per_sec']} docs/sec)")
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Ingest research and interactions into the vector store.")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--persist-dir", default="./chroma_db")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Embedding processes (1 embeds in this process)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--rebuild", action="store_true", help="Re-embed every document, not just changes")
+    parser.add_argument("--dedup", action="store_true", default=INGEST_DEDUP,
+                        help="Index one document per cluster of near-duplicates (see gss_agent/rag/dedup.py)")
+    args = parser.parse_args()
+
     print("🚀 Starting Data Ingestion into Nexus Advisory Vector Store...")
-    
+    print(f"   {args.workers} embedding workers, batches of {args.batch_size}")
+
     # Initialize vector store
-    v_store = NexusVectorStore(persist_directory="./chroma_db")
-    
-    base_dir = "/Users/govindmittal/datascience-setup/interview_prep/gartner/gss_agent/data"
-    
-    # Ingest Research Content (Phase 1.3)
-    content_path = os.path.join(base_dir, "content.json")
-    if os.path.exists(content_path):
-        print(f"Ingesting research from {content_path}...")
-        v_store.ingest_research(content_path)
-    else:
-        print(f"⚠️ Research file not found: {content_path}")
-
-    # Ingest Interactions (Phase 1.4)
-    # Note: This will ingest what's currently generated. We can re-run later for full dataset.
-    interactions_path = os.path.join(base_dir, "interactions.json")
-    if os.path.exists(interactions_path):
-        print(f"Ingesting interactions from {interactions_path}...")
-        v_store.ingest_interactions(interactions_path)
-    else:
-        print(f"⚠️ Interactions file not found: {interactions_path}")
+    v_store = NexusVectorStore(persist_directory=args.persist_dir)
+    with EmbeddingPipeline(workers=args.workers, batch_size=args.batch_size, progress=print_progress) as pipeline:
+        # Ingest Research Content (Phase 1.3)
+        content_path = os.path.join(args.data_dir, "content.json")
+        if os.path.exists(content_path):
+            print(f"Ingesting research from {content_path}...")
+            print_stats(v_store.ingest_research(content_path, pipeline=pipeline, rebuild=args.rebuild,
+                                                   dedup=args.dedup))
+        else:
+            print(f"⚠️ Research file not found: {content_path}")
+
+        # Ingest Interactions (Phase 1.4)
+        interactions_path = os.path.join(args.data_dir, "interactions.json")
+        if os.path.exists(interactions_path):
+            print(f"Ingesting interactions from {interactions_path}...")
+            print_stats(v_store.ingest_interactions(interactions_path, pipeline=pipeline, rebuild=args.rebuild,
+                                                    dedup=args.dedup))
+        else:
+            print(f"⚠️ Interactions file not found: {interactions_path}")
 
     # Note: Other data (clients, metrics, associates, contracts) are typically stored in relational/JSON
     # but some metadata could be indexed if needed. For now, the core RAG targets research and interactions.
-    
+
     print("\n✅ Ingestion Complete. Vector store is ready for queries.")
 
 if __name__ == "__main__":
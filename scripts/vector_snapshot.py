@@ -0,0 +1,71 @@
+"""
+Exports, verifies and imports prebuilt vector index snapshots
+(see gss_agent/rag/index_snapshot.py).
+
+    # On the build machine, after scripts/ingest_data.py
+    python scripts/vector_snapshot.py export ./index-snapshot [--persist-dir ./chroma_db] [--backend chroma]
+
+    # On a worker: check the snapshot, then serve it read-only
+    python scripts/vector_snapshot.py verify ./index-snapshot
+    NEXUS_VECTOR_SNAPSHOT=./index-snapshot python -m gss_agent.api.main
+
+    # Or load it into a local store without re-embedding
+    python scripts/vector_snapshot.py import ./index-snapshot [--persist-dir ./chroma_db]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.index_snapshot import SnapshotError, open_snapshot, verify_snapshot
+from gss_agent.rag.vector_store import NexusVectorStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export, verify or import a vector index snapshot.")
+    parser.add_argument("command", choices=["export", "verify", "import"])
+    parser.add_argument("snapshot", help="Snapshot directory")
+    parser.add_argument("--persist-dir", default="./chroma_db", help="Store to export from / import into")
+    parser.add_argument("--backend", choices=["chroma", "numpy"], default=None,
+                        help="Backend of that store (NEXUS_VECTOR_BACKEND by default)")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Source data the snapshot is checked against")
+    args = parser.parse_args()
+
+    store_options = {"backend": args.backend} if args.backend else {}
+    started = time.perf_counter()
+    try:
+        if args.command == "export":
+            store = NexusVectorStore(persist_directory=args.persist_dir, **store_options)
+            manifest = store.export_snapshot(args.snapshot, data_dir=args.data_dir)
+            for name, info in manifest["collections"].items():
+                print(f"   {name}: {info['count']} documents, {info['dim']} dims")
+            print(f"✅ Exported {args.persist_dir} to {args.snapshot} in {time.perf_counter() - started:.1f}s")
+        elif args.command == "verify":
+            manifest, stale = verify_snapshot(args.snapshot, data_dir=args.data_dir)
+            # Opening checks the embedding function and that every collection loads
+            store = open_snapshot(args.snapshot, data_dir=None, checksums=False)
+            store.search_research("warm up", n_results=1)
+            print(f"📊 Format {manifest['format']}, created {manifest['created_at']}, "
+                  f"embedded with {manifest['embedding_function']}")
+            for name, info in manifest["collections"].items():
+                print(f"   {name}: {info['count']} documents, {info['dim']} dims")
+            if stale:
+                print(f"⚠️ Source data changed since export: {', '.join(stale)}")
+            print(f"✅ Snapshot verified and serving in {time.perf_counter() - started:.1f}s")
+        else:
+            store = NexusVectorStore(persist_directory=args.persist_dir, **store_options)
+            counts = store.import_snapshot(args.snapshot, data_dir=args.data_dir)
+            for name, count in counts.items():
+                print(f"   {name}: {count} documents")
+            print(f"✅ Imported {args.snapshot} into {args.persist_dir} in {time.perf_counter() - started:.1f}s")
+    except SnapshotError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import asyncio
+import contextvars
+import threading
+import time
+from gss_agent.core import executor
+from gss_agent.core.executor import run_blocking, with_async
+from gss_agent.core.executive_tools import EXECUTIVE_TOOLS
+from gss_agent.core.tools import GSS_TOOLS, lookup_client_file
+from gss_agent.data.snapshot import get_snapshot
+
+def test_every_tool_has_a_coroutine():
+    assert all(t.coroutine is not None for t in GSS_TOOLS + EXECUTIVE_TOOLS)
+
+def test_tool_ainvoke_runs_off_the_event_loop():
+    name = get_snapshot().clients[0]["name"]
+
+    result = asyncio.run(lookup_client_file.ainvoke({"client_name": name}))
+    assert result == lookup_client_file.invoke({"client_name": name})
+
+    from langchain_core.tools import tool
+
+    @tool
+    def which_thread() -> str:
+        """Name of the thread running the tool."""
+        return threading.current_thread().name
+
+    with_async(which_thread)
+    assert asyncio.run(which_thread.ainvoke({})).startswith("nexus-tool")
+
+def test_blocking_work_does_not_stall_the_loop():
+    async def main():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        beat = asyncio.create_task(heartbeat())
+        await asyncio.gather(*(run_blocking(time.sleep, 0.1) for _ in range(executor.TOOL_WORKERS)))
+        beat.cancel()
+        return ticks
+
+    # ~20 heartbeats fit in 100 ms; a stalled loop would get at most one or two
+    assert asyncio.run(main()) >= 5
+
+def test_run_blocking_carries_context_variables():
+    request_id = contextvars.ContextVar("request_id", default=None)
+
+    async def main():
+        request_id.set("req-1")
+        return await run_blocking(request_id.get)
+
+    assert asyncio.run(main()) == "req-1"
@@ -0,0 +1,48 @@
+from gss_agent.rag.bm25 import BM25Index, reciprocal_rank_fusion, tokenize
+from gss_agent.rag.filters import matches_where
+
+DOCS = {
+    "r1": "Magic Quadrant for Cloud Database Management Systems 2024",
+    "r2": "Hype Cycle for Artificial Intelligence 2024",
+    "r3": "Cloud cost optimization for finance leaders",
+    "r4": "Market Guide for Data Management Platforms",
+}
+
+def build():
+    ids = list(DOCS)
+    return BM25Index.build(ids, [DOCS[i] for i in ids], [{"kind": "mq" if i == "r1" else "other"} for i in ids])
+
+def test_exact_title_terms_rank_first():
+    index = build()
+    ranked = index.search("magic quadrant cloud database management", top_k=3)
+    assert ranked[0][0] == "r1"
+    assert {doc_id for doc_id, _ in ranked[1:]} == {"r3", "r4"}
+    assert index.search("unrelated words entirely") == []
+    assert tokenize("The Hype Cycle, for AI!") == ["hype", "cycle", "ai"]
+
+def test_remove_and_filters():
+    index = build()
+    index.remove("r1")
+    assert "r1" not in [doc_id for doc_id, _ in index.search("cloud database")]
+    assert len(index) == 3
+    assert [d for d, _ in index.search("management", where={"kind": "other"})] == ["r4"]
+    assert matches_where({"a": 3, "b": "x"}, {"$and": [{"a": {"$gte": 2}}, {"b": {"$in": ["x", "y"]}}]})
+    assert not matches_where({"a": 3}, {"$or": [{"a": {"$lt": 2}}, {"b": "x"}]})
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]], k=60)
+    assert fused[0][0] == "b"
+    assert {doc_id for doc_id, _ in fused} == {"a", "b", "c", "d"}
+
+def test_removals_keep_document_frequencies_and_compact():
+    index = build()
+    index.add("r1", "Hype Cycle for Cloud Security")
+    assert index.df["cloud"] == 2 and index.df["hype"] == 2
+    index.remove("r3")
+    assert index.df["cloud"] == 1 and "finance" not in index.df
+    index.remove("r2")
+    # Tombstones past a quarter of the slots are compacted away
+    assert None not in index.doc_ids and len(index.doc_ids) == len(index) == 2
+    assert [d for d, _ in index.search("cloud security")] == ["r1"]
+    fresh = BM25Index.build(["r4", "r1"], [DOCS["r4"], "Hype Cycle for Cloud Security"])
+    assert index.search("management cloud") == fresh.search("management cloud")
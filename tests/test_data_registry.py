@@ -0,0 +1,110 @@
+import json
+import os
+from gss_agent.data.registry import ClientRegistry
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "gss_agent", "data")
+
+def load(filename):
+    with open(os.path.join(DATA_DIR, filename), "r") as f:
+        return json.load(f)
+
+def build_registry():
+    return ClientRegistry(
+        load("clients.json"),
+        load("contracts.json"),
+        load("associates.json"),
+        load("associate_performance.json"),
+    )
+
+def test_registry_matches_linear_scans():
+    registry = build_registry()
+    clients = registry.clients
+    contracts = registry.contracts
+
+    for client in clients:
+        assert registry.get_client_by_id(client["id"]) is next(c for c in clients if c["id"] == client["id"])
+        expected = next((con for con in contracts if con["client_id"] == client["id"]), None)
+        assert registry.get_contract(client["id"]) == expected
+
+def test_registry_name_lookup():
+    registry = build_registry()
+
+    assert registry.get_client("cedar health systems")["name"] == "Cedar Health Systems"
+    # Partial names still resolve through the substring fallback
+    assert registry.get_client("Cedar")["name"] == "Cedar Health Systems"
+    assert registry.get_client("Unknown Corp") is None
+    # Substring hits come first, in file order; other fuzzy matches only when confident
+    assert registry.get_client("Health") is registry.scan_client("Health")
+    assert registry.get_client("Acme Bank") is None
+    assert registry.get_client("Industrial Dynamcs Corp")["name"] == "Industrial Dynamics Corp"
+    assert registry.get_client("") is None
+
+def test_registry_associate_info():
+    registry = build_registry()
+    client = load("clients.json")[0]
+
+    info = registry.get_associate_info(client["id"])
+    assert info["profile"]["id"] == client["assigned_associate"]
+    assert info["performance"]["associate_id"] == client["assigned_associate"]
+
+def test_resolver_flags_ambiguous_names():
+    registry = build_registry()
+
+    matches = registry.resolve_client("GlobalFin")
+    assert {m.client["name"] for m in matches[:2]} == {"GlobalFin Bank", "GlobalFin Capital"}
+    assert registry.resolver.is_ambiguous(matches)
+
+    exact = registry.resolve_client("GlobalFin Bank")
+    assert exact[0].score == 1.0 and not registry.resolver.is_ambiguous(exact)
+
+    # Duplicate names stay ambiguous; the client id disambiguates
+    duplicates = registry.resolve_client("TechNova Solutions")
+    assert registry.resolver.is_ambiguous(duplicates)
+    by_id = registry.resolve_client(duplicates[1].client["id"])
+    assert by_id[0].client is duplicates[1].client
+
+def test_resolver_tolerates_typos():
+    registry = build_registry()
+    matches = registry.resolve_client("Industrial Dynamcs Corp")
+    assert matches[0].client["name"] == "Industrial Dynamics Corp"
+
+def test_tools_only_act_on_exact_partial_or_confident_client_matches():
+    from gss_agent.core.tools import NexusDataReader, resolve_client_name, resolve_client_scope
+
+    reader = NexusDataReader()
+    client, message = resolve_client_name("GlobalFin Bank", reader)
+    assert client["name"] == "GlobalFin Bank" and message is None
+
+    # A typo is acted on, but the output says which client was matched
+    client, message = resolve_client_name("Industrial Dynamcs Corp", reader)
+    assert client["name"] == "Industrial Dynamics Corp" and message.startswith("Matched 'Industrial Dynamics Corp'")
+
+    # A unique partial name is acted on with a note; one shared by several clients is not
+    for partial, name in [("Cedar Health", "Cedar Health Systems"), ("Apex", "Apex Precision Manufacturing")]:
+        client, message = resolve_client_name(partial, reader)
+        assert client["name"] == name and message.startswith(f"Matched '{name}'")
+    client, message = resolve_client_name("GlobalFin", reader)
+    assert client is None and "ambiguous" in message
+
+    # A client that doesn't exist must not return another client's file
+    client, message = resolve_client_name("Acme Bank", reader)
+    assert client is None and "GlobalFin Bank" in message and "candidates" in message
+    assert resolve_client_scope("Acme Bank", reader) == (None, message)
+    assert resolve_client_scope("Zzyzx Holdings", reader) == (None, None)
+
+def test_snapshot_is_shared_and_immutable():
+    from gss_agent.data.snapshot import get_snapshot
+
+    snapshot = get_snapshot()
+    assert get_snapshot() is snapshot
+    assert snapshot.registry.get_client_by_id(snapshot.clients[0]["id"]) is snapshot.clients[0]
+
+    try:
+        snapshot.clients = []
+        assert False, "snapshot attributes must be read-only"
+    except AttributeError:
+        pass
+
+    report = snapshot.memory_report()
+    assert report["clients"]["records"] == len(snapshot.clients)
+    assert report["total_bytes"] > 0
@@ -0,0 +1,58 @@
+import json
+import os
+import shutil
+from gss_agent.data.snapshot import DATA_DIR, DATASET_FILES, get_snapshot, load_snapshot, swap_snapshot
+from gss_agent.data.watcher import SnapshotWatcher
+
+def test_watcher_swaps_snapshot_on_content_change(tmp_path):
+    for filename in DATASET_FILES.values():
+        shutil.copy(os.path.join(DATA_DIR, filename), tmp_path / filename)
+
+    original = swap_snapshot(load_snapshot(str(tmp_path)))
+    try:
+        before = get_snapshot()
+        watcher = SnapshotWatcher(data_dir=str(tmp_path))
+        assert watcher.check_once() is False
+
+        # Touching without changing content does not rebuild
+        os.utime(tmp_path / "clients.json", None)
+        assert watcher.check_once() is False
+        assert get_snapshot() is before
+
+        # A half-written file keeps the current snapshot in place
+        (tmp_path / "clients.json").write_text('[{"id": "c_new"')
+        assert watcher.check_once() is False
+        assert get_snapshot() is before and watcher.last_error
+
+        clients = [c.to_dict() for c in before.clients] + [{"id": "c_new", "name": "Brand New Client"}]
+        (tmp_path / "clients.json").write_text(json.dumps(clients))
+        assert watcher.check_once() is True
+
+        after = get_snapshot()
+        assert after is not before and after.version != before.version
+        assert after.registry.get_client("Brand New Client")["id"] == "c_new"
+        # Holders of the old snapshot still see a consistent, complete view
+        assert before.registry.get_client_by_id("c_new") is None
+    finally:
+        swap_snapshot(original)
+
+def test_watcher_reloads_without_optional_dataset_files(tmp_path):
+    for filename in DATASET_FILES.values():
+        if filename != "associate_performance.json":
+            shutil.copy(os.path.join(DATA_DIR, filename), tmp_path / filename)
+
+    original = swap_snapshot(load_snapshot(str(tmp_path)))
+    try:
+        before = get_snapshot()
+        assert before.performance == ()
+        watcher = SnapshotWatcher(data_dir=str(tmp_path))
+        (tmp_path / "contracts.json").write_text("[]")
+        assert watcher.check_once() is True and watcher.last_error is None
+        assert get_snapshot().contracts == ()
+
+        # A file that existed and vanished (e.g. mid-replace) keeps the current snapshot
+        current = get_snapshot()
+        os.remove(tmp_path / "clients.json")
+        assert watcher.check_once() is False and get_snapshot() is current
+    finally:
+        swap_snapshot(original)
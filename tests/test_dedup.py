@@ -0,0 +1,21 @@
+from gss_agent.rag.dedup import cluster_near_duplicates, collapse_duplicates, shingles
+
+BASE = ("The 2025 Magic Quadrant for Enterprise Networking marks a definitive shift from hardware-centric "
+        "infrastructure to AI-driven autonomous networking platforms as organizations accelerate digital "
+        "business initiatives and the network becomes a strategic asset")
+
+def test_near_duplicates_cluster_and_distinct_texts_do_not():
+    edited = BASE.replace("definitive ", "") + " today"
+    other = "Emotion AI in B2B sales examines sentiment analysis of buyer calls and coaching for sellers"
+    texts = [BASE, other, edited, BASE, ""]
+    clusters = cluster_near_duplicates(texts)
+    assert sorted(map(sorted, clusters)) == [[0, 2, 3], [1], [4]]
+    # Keys keep otherwise identical texts apart
+    assert len(cluster_near_duplicates([BASE, BASE], keys=["c1", "c2"])) == 2
+    assert shingles("One two") == {"one two"}
+
+def test_collapse_keeps_the_longest_item_and_records_aliases():
+    items = [{"id": "a", "text": BASE[:120]}, {"id": "b", "text": BASE}, {"id": "c", "text": "unrelated report"}]
+    canonical, aliases = collapse_duplicates(items, lambda item: item["text"], threshold=0.5)
+    assert [item["id"] for item in canonical] == ["b", "c"]
+    assert aliases == {"b": ["a"]}
@@ -0,0 +1,83 @@
+import json
+import shutil
+import pytest
+from gss_agent.core.lazy import LazyObject
+from gss_agent.data import snapshot as snapshot_module
+from gss_agent.data.snapshot import DATA_DIR, DATASET_FILES, load_snapshot
+
+def test_lazy_snapshot_loads_only_what_is_used():
+    lazy = load_snapshot(DATA_DIR, lazy=True)
+    assert not any(lazy.is_loaded(name) for name in ("clients", "metrics", "registry", "metrics_store"))
+
+    client = lazy.clients[0]
+    assert lazy.get_client_by_id(client["id"]) == client
+    assert lazy.is_loaded("clients") and lazy.is_loaded("registry")
+    assert not lazy.is_loaded("metrics") and not lazy.is_loaded("metrics_store")
+    assert lazy.memory_report()["metrics"] == {"loaded": False, "bytes": 0}
+
+    eager = load_snapshot(DATA_DIR)
+    assert eager.version == lazy.version
+    assert lazy.get_metrics(client["id"]) == eager.get_metrics(client["id"])
+    assert lazy.aggregates.revenue_snapshot() == eager.aggregates.revenue_snapshot()
+
+def test_lazy_read_of_a_half_written_file_is_never_cached(tmp_path, monkeypatch):
+    for filename in DATASET_FILES.values():
+        shutil.copy(f"{DATA_DIR}/{filename}", tmp_path / filename)
+    monkeypatch.setattr(snapshot_module, "LAZY_READ_RETRY_DELAY", 0)
+    lazy = load_snapshot(str(tmp_path), lazy=True)
+    clients_file = tmp_path / "clients.json"
+    complete = clients_file.read_text()
+
+    clients_file.write_text(complete[:len(complete) // 2])
+    with pytest.raises(ValueError):
+        lazy.clients
+    assert not lazy.is_loaded("clients")
+
+    # Same bytes once the write finishes: the snapshot's own version, cached
+    clients_file.write_text(complete)
+    assert len(lazy.clients) == len(json.loads(complete)) and lazy.is_loaded("clients")
+
+    # Different bytes are served but not cached under the old version
+    (tmp_path / "contracts.json").write_text("[]")
+    assert lazy.contracts == () and not lazy.is_loaded("contracts")
+
+def test_changed_file_supersedes_the_lazy_snapshot_once(tmp_path, monkeypatch):
+    for filename in DATASET_FILES.values():
+        shutil.copy(f"{DATA_DIR}/{filename}", tmp_path / filename)
+    lazy = load_snapshot(str(tmp_path), lazy=True)
+    original = snapshot_module.swap_snapshot(lazy)
+    try:
+        clients = json.loads((tmp_path / "clients.json").read_text())
+        clients.append(dict(clients[0], id="c_new", name="Brand New Client"))
+        (tmp_path / "clients.json").write_text(json.dumps(clients))
+
+        reads = []
+        read_dataset = snapshot_module.read_dataset
+        monkeypatch.setattr(snapshot_module, "read_dataset", lambda *a, **k: reads.append(a) or read_dataset(*a, **k))
+        # The registry is built from the new file, but not cached under the old version
+        assert lazy.registry.get_client("Brand New Client")["id"] == "c_new"
+        assert not lazy.is_loaded("registry") and not lazy.is_loaded("clients")
+
+        successor = snapshot_module.get_snapshot()
+        assert successor is not lazy and successor.version != lazy.version
+        assert successor.is_loaded("clients") and successor.is_loaded("registry")
+        # Later accesses are served by the successor without re-reading the file
+        count = len(reads)
+        for _ in range(10):
+            assert len(lazy.clients) == len(clients) and lazy.registry is successor.registry
+        assert len(reads) == count
+    finally:
+        snapshot_module.swap_snapshot(original)
+
+def test_lazy_object_builds_once_on_first_access():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {"ready": True}
+
+    proxy = LazyObject(factory, name="settings")
+    assert not proxy.is_loaded and not calls
+    assert proxy.get("ready") is True
+    assert proxy.copy() == {"ready": True}
+    assert calls == [1]
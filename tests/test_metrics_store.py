@@ -0,0 +1,50 @@
+import numpy as np
+from gss_agent.data.metrics_store import MetricsStore
+
+RECORDS = [
+    {"client_id": "c1", "month": "2025-01", "metrics": {"login_frequency": 30, "csat": 4.5}},
+    {"client_id": "c1", "month": "2025-02", "metrics": {"login_frequency": 20, "csat": 4.0}},
+    {"client_id": "c1", "month": "2025-03", "metrics": {"login_frequency": 10, "csat": 3.5}},
+    {"client_id": "c2", "month": "2025-01", "metrics": {"login_frequency": 5}},
+    {"client_id": "c2", "month": "2025-03", "metrics": {"login_frequency": 15}},
+]
+
+def test_metrics_store_round_trips_history():
+    store = MetricsStore(RECORDS)
+    assert store.client_history("c1") == RECORDS[:3]
+    assert store.client_history("c2") == RECORDS[3:]
+    assert store.client_history("missing") == []
+
+def test_metrics_store_vectorized_views():
+    store = MetricsStore(RECORDS)
+
+    np.testing.assert_array_equal(store.mom_delta("login_frequency", ["c1"]), [[-10, -10]])
+    np.testing.assert_array_equal(store.latest("login_frequency"), [10, 15])
+    np.testing.assert_allclose(store.rolling_mean("login_frequency", 2)[0], [np.nan, 25, 15])
+    # c2 has no February observation, so no full 2-month window exists
+    assert np.isnan(store.rolling_mean("login_frequency", 2)[1]).all()
+    assert store.latest_changes("c1") == {"login_frequency": -10.0, "csat": -0.5}
+
+def test_metrics_store_accepts_dict_by_client():
+    store = MetricsStore({"c1": [{"month": "2025-01", "metrics": {"nps": 7}}]})
+    assert store.client_history("c1") == [{"client_id": "c1", "month": "2025-01", "metrics": {"nps": 7}}]
+
+def test_churn_risk_scores_rank_declining_clients_first():
+    from gss_agent.data.risk import score_portfolio
+
+    def month(i, logins, nps, util, days):
+        return {"month": f"2025-0{i}", "metrics": {"login_frequency": logins, "nps": nps,
+                                                   "inquiry_utilization_pct": util,
+                                                   "days_since_last_engagement": days}}
+    store = MetricsStore({
+        "healthy": [month(i, 30, 9, 80, 3) for i in range(1, 5)],
+        "declining": [month(1, 30, 9, 60, 5), month(2, 30, 9, 50, 10),
+                      month(3, 30, 9, 40, 15), month(4, 6, 5, 10, 40)],
+    })
+
+    scores = score_portfolio(store)
+    ranked = scores.ranked()
+    assert [entry["client_id"] for entry in ranked] == ["declining", "healthy"]
+    assert ranked[0]["risk_level"] == "High"
+    assert ranked[0]["signals"]["login_decline"] == 0.8
+    assert scores.for_client("healthy")["signals"]["login_decline"] == 0.0
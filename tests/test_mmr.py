@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from gss_agent.rag.mmr import min_max_scale, mmr_rerank, mmr_select, parse_lambda
+
+
+def test_mmr_skips_near_duplicates():
+    query = np.array([1.0, 0.0, 0.0])
+    candidates = np.array([
+        [0.95, 0.30, 0.0],   # best match
+        [0.95, 0.31, 0.0],   # near-duplicate of the best match
+        [0.80, 0.0, 0.60],   # a bit less relevant, different direction
+    ])
+    assert mmr_select(query, candidates, 2, lambda_mult=1.0) == [0, 1]
+    assert mmr_select(query, candidates, 2, lambda_mult=0.5) == [0, 2]
+    assert mmr_select(query, candidates, 5, lambda_mult=0.5) == [0, 2, 1]
+    assert mmr_select(query, [], 3) == []
+
+def test_mmr_rerank_reorders_result_and_drops_embeddings():
+    result = {
+        "ids": [["a", "b", "c"]],
+        "documents": [["A", "B", "C"]],
+        "metadatas": [[{}, {}, {}]],
+        "distances": [[0.1, 0.1, 0.4]],
+        "embeddings": [np.array([[1.0, 0.0], [1.0, 0.01], [0.6, 0.8]])],
+        "included": ["documents", "metadatas", "distances", "embeddings"],
+    }
+    reranked = mmr_rerank(result, [1.0, 0.0], 2, lambda_mult=0.3)
+    assert reranked["ids"] == [["a", "c"]]
+    assert reranked["documents"] == [["A", "C"]] and reranked["distances"] == [[0.1, 0.4]]
+    assert "embeddings" not in reranked
+
+
+def test_min_max_scale_spans_unit_interval():
+    np.testing.assert_allclose(min_max_scale([0.033, 0.030, 0.025]), [1.0, 0.625, 0.0], atol=1e-6)
+    assert min_max_scale([0.5, 0.5]).tolist() == [1.0, 1.0]
+
+
+def test_parse_lambda():
+    assert parse_lambda("off") is None
+    assert parse_lambda("0.5") == 0.5
+    for bad in ("abc", "1.5", "-0.1"):
+        with pytest.raises(ValueError):
+            parse_lambda(bad)
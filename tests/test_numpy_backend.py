@@ -0,0 +1,122 @@
+import os
+import numpy as np
+from gss_agent.rag.numpy_backend import NumpyCollection, NumpyVectorClient
+
+def random_vectors(n, dim=16, seed=0):
+    vectors = np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def test_exact_search_matches_brute_force_and_persists(tmp_path):
+    vectors = random_vectors(300)
+    ids = [f"doc-{i}" for i in range(300)]
+    metas = [{"group": i % 3} for i in range(300)]
+    client = NumpyVectorClient(str(tmp_path))
+    collection = client.get_or_create_collection("docs")
+    collection.upsert(ids=ids, documents=ids, metadatas=metas, embeddings=vectors)
+    collection.delete(ids=["doc-0"])
+    collection.persist()
+
+    reopened = NumpyCollection("docs", str(tmp_path / "docs"))
+    assert reopened.count() == 299
+    assert isinstance(reopened._matrix, np.memmap)
+
+    query = random_vectors(1, seed=1)[0]
+    result = reopened.query(query_embeddings=[query], n_results=5, where={"group": 1})
+    distances = ((vectors - query) ** 2).sum(axis=1)
+    expected = [ids[i] for i in np.argsort(distances) if i % 3 == 1 and i != 0][:5]
+    assert result["ids"][0] == expected
+    assert np.allclose(result["distances"][0], np.sort(distances[[ids.index(d) for d in expected]]), atol=1e-4)
+
+    # Writes after a memory-mapped open copy the matrix instead of touching the file
+    reopened.upsert(ids=["doc-1"], documents=["moved"], metadatas=[{"group": 1}], embeddings=[query])
+    assert reopened.query(query_embeddings=[query], n_results=1)["ids"][0] == ["doc-1"]
+    assert reopened.get(ids=["doc-1"])["documents"] == ["moved"]
+
+def test_ivf_partitioning_keeps_recall():
+    vectors = random_vectors(4000, dim=32)
+    ids = [str(i) for i in range(4000)]
+    exact = NumpyCollection("exact", "/nonexistent-exact")
+    ivf = NumpyCollection("ivf", "/nonexistent-ivf", nlist=32, nprobe=8, ivf_min_rows=1000)
+    for collection in (exact, ivf):
+        collection.upsert(ids=ids, metadatas=[{}] * 4000, embeddings=vectors)
+
+    queries = random_vectors(50, dim=32, seed=7)
+    hits = 0
+    for query in queries:
+        truth = set(exact.query(query_embeddings=[query], n_results=10)["ids"][0])
+        hits += len(truth & set(ivf.query(query_embeddings=[query], n_results=10)["ids"][0]))
+    assert ivf.ivf.centroids is not None
+    assert hits / (10 * len(queries)) > 0.6
+
+def test_int8_quantized_search_rescores_at_full_precision(tmp_path):
+    vectors = random_vectors(2000, dim=64)
+    ids = [str(i) for i in range(2000)]
+    exact = NumpyCollection("exact", str(tmp_path / "exact"))
+    quantized = NumpyCollection("int8", str(tmp_path / "int8"), quantize=True)
+    for collection in (exact, quantized):
+        collection.upsert(ids=ids, metadatas=[{"group": i % 2} for i in range(2000)], embeddings=vectors)
+    quantized.persist()
+
+    reopened = NumpyCollection("int8", str(tmp_path / "int8"), quantize=True)
+    assert reopened._codes is not None and reopened._codes.dtype == np.int8
+    usage = reopened.memory_usage()
+    assert usage["int8_bytes"] < usage["float32_bytes"] / 3
+    assert not usage["float32_resident"]
+
+    hits = 0
+    for query in random_vectors(50, dim=64, seed=3):
+        truth = exact.query(query_embeddings=[query], n_results=10, where={"group": 0})
+        result = reopened.query(query_embeddings=[query], n_results=10, where={"group": 0})
+        hits += len(set(truth["ids"][0]) & set(result["ids"][0]))
+        # Returned distances are the full-precision ones
+        common = {d: dist for d, dist in zip(truth["ids"][0], truth["distances"][0])}
+        for doc_id, dist in zip(result["ids"][0], result["distances"][0]):
+            if doc_id in common:
+                assert abs(common[doc_id] - dist) < 1e-4
+    assert hits / 500 > 0.9
+
+def test_int8_codes_follow_writes_and_never_go_stale(tmp_path):
+    vectors = random_vectors(300, dim=32)
+    ids = [str(i) for i in range(300)]
+    quantized = NumpyCollection("docs", str(tmp_path / "docs"), quantize=True)
+    quantized.upsert(ids=ids[:100], metadatas=[{}] * 100, embeddings=vectors[:100])
+    quantized.persist()
+
+    # Rows inside the current scale are quantized in place rather than from scratch
+    scale = quantized._scale
+    inside = np.clip(vectors[100:110], -scale * 127, scale * 127)
+    quantized.upsert(ids=ids[100:110], metadatas=[{}] * 10, embeddings=inside)
+    assert quantized._scale is scale and len(quantized._codes) == 110
+    assert np.array_equal(quantized._codes[100:], np.clip(np.rint(inside / scale), -127, 127).astype(np.int8))
+    quantized.delete(ids=ids[:5])
+    assert len(quantized._codes) == 105
+    quantized.upsert(ids=["wide"], metadatas=[{}], embeddings=[np.full(32, 10.0, dtype=np.float32)])
+    assert quantized._codes is None
+
+    # An unquantized persist must not leave the earlier codes behind
+    plain = NumpyCollection("docs", str(tmp_path / "docs"))
+    plain.upsert(ids=ids[100:], metadatas=[{}] * 200, embeddings=vectors[100:])
+    plain.persist()
+    reopened = NumpyCollection("docs", str(tmp_path / "docs"), quantize=True)
+    result = reopened.query(query_embeddings=[vectors[250]], n_results=1)
+    assert result["ids"][0] == ["250"]
+
+def test_persist_switches_versions_atomically(tmp_path):
+    vectors = random_vectors(40)
+    collection = NumpyCollection("docs", str(tmp_path / "docs"))
+    for n in range(3):
+        collection.upsert(ids=[f"doc-{n}"], metadatas=[{}], embeddings=vectors[n:n + 1])
+        collection.persist()
+    # The live version and the one before it, which a reader may still be opening
+    assert sorted(os.listdir(tmp_path / "docs")) == ["CURRENT", "v2", "v3"]
+    assert (tmp_path / "docs" / "CURRENT").read_text() == "v3"
+
+    # A writer that dies before switching CURRENT leaves the live version intact
+    reader = NumpyCollection("docs", str(tmp_path / "docs"))
+    os.makedirs(tmp_path / "docs" / "v4")
+    (tmp_path / "docs" / "v4" / "records.json").write_text("{")
+    assert NumpyCollection("docs", str(tmp_path / "docs")).count() == 3
+    collection.upsert(ids=["doc-3"], metadatas=[{}], embeddings=vectors[3:4])
+    collection.persist()
+    assert (tmp_path / "docs" / "CURRENT").read_text() == "v5"
+    assert reader.count() == 3 and NumpyCollection("docs", str(tmp_path / "docs")).count() == 4
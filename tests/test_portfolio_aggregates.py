@@ -0,0 +1,38 @@
+import copy
+from gss_agent.data.aggregates import PortfolioAggregates
+from gss_agent.data.snapshot import get_snapshot
+
+def state(aggregates):
+    return (
+        aggregates.revenue_snapshot(),
+        aggregates.risk_counts,
+        sorted(aggregates.at_risk_clients(), key=lambda c: c["client_name"]),
+        aggregates.breakdown("associate"),
+        aggregates.breakdown("region"),
+        aggregates.breakdown("industry"),
+    )
+
+def test_incremental_updates_match_full_rebuild():
+    snapshot = get_snapshot()
+    clients = [copy.deepcopy(c) for c in snapshot.clients]
+    aggregates = PortfolioAggregates(clients, resolve_associate=snapshot.get_associate)
+
+    # Modify one client, drop another and add a new one
+    clients[0] = dict(clients[0], churn_risk="High",
+                      subscriptions=clients[0]["subscriptions"] + ["Nexus Advisory for CIOs"])
+    removed = clients.pop(1)
+    clients.append(dict(removed, id="c_new_client", name="New Client", region="LATAM"))
+
+    incremental = aggregates.copy()
+    assert incremental.apply_changes(clients) == 3
+
+    rebuilt = PortfolioAggregates(clients, resolve_associate=snapshot.get_associate)
+    assert state(incremental) == state(rebuilt)
+    # The source aggregates are untouched by updates applied to the copy
+    assert state(aggregates) == state(PortfolioAggregates(snapshot.clients, resolve_associate=snapshot.get_associate))
+
+def test_associate_rollups_resolve_ids():
+    snapshot = get_snapshot()
+    rollups = snapshot.aggregates.breakdown("associate")
+    assert sum(b["client_count"] for b in rollups.values()) == len(snapshot.clients)
+    assert set(rollups) <= {a["id"] for a in snapshot.associates}
@@ -0,0 +1,46 @@
+import copy
+import json
+import os
+import pickle
+from gss_agent.data.records import ClientRecord, as_dict, compact_dataset
+from gss_agent.data.snapshot import DATA_DIR, DATASET_FILES
+
+def load(name):
+    with open(os.path.join(DATA_DIR, DATASET_FILES[name]), "r") as f:
+        return json.load(f)
+
+def test_compact_records_round_trip_to_the_source_json():
+    for name in DATASET_FILES:
+        raw = load(name)
+        records = compact_dataset(name, raw)
+        assert [as_dict(r) for r in records] == raw
+        assert all(r == source for r, source in zip(records, raw))
+
+def test_client_record_behaves_like_a_read_only_dict():
+    raw = dict(load("clients")[0], custom_flag=True)
+    del raw["revenue"]
+    client = ClientRecord.from_dict(raw)
+
+    assert client["name"] == client.name == raw["name"]
+    assert client.get("revenue") is None and "revenue" not in client
+    assert client["custom_flag"] is True
+    assert list(client) == list(raw)
+    assert client["key_contacts"][0]["role"] == raw["key_contacts"][0]["role"]
+    assert json.dumps(as_dict(client)) == json.dumps(raw)
+    assert pickle.loads(pickle.dumps(client)) == client
+    # Deep copies are editable plain dicts
+    assert isinstance(copy.deepcopy(client), dict)
+    try:
+        client.name = "Renamed"
+        assert False, "records must be read-only"
+    except AttributeError:
+        pass
+
+def test_repeated_values_are_shared():
+    records = compact_dataset("clients", load("clients"))
+    regions = {}
+    for r in records:
+        regions.setdefault(r["region"], set()).add(id(r["region"]))
+    assert all(len(ids) == 1 for ids in regions.values())
+    contacts = [c for r in records for c in r["key_contacts"]]
+    assert len({id(c._index) for c in contacts}) == 1
@@ -0,0 +1,55 @@
+import json
+import os
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.evaluation import (evaluate, golden_queries, keywords, ranked_ids, reciprocal_rank,
+                                      recall_at_k)
+
+def load(name):
+    with open(os.path.join(DATA_DIR, name), "r") as f:
+        return json.load(f)
+
+def test_golden_queries_follow_the_labels():
+    clients, interactions, research = load("clients.json"), load("interactions.json"), load("content.json")
+    queries = golden_queries(clients, interactions, research)
+    assert queries == golden_queries(clients, interactions, research)
+
+    golden = {c["id"] for c in clients if c["evaluation_metadata"]["is_golden_client"]}
+    interaction_ids = {i["id"] for i in interactions if i["client_id"] in golden}
+    interaction_queries = [q for q in queries if q["collection"] == "interactions"]
+    assert interaction_queries and {q["relevant"][0] for q in interaction_queries} == interaction_ids
+    assert {q["client_id"] for q in interaction_queries} - {None} <= golden
+
+    # Actions are asked as topic keywords, not verbatim text
+    action_queries = [q for q in interaction_queries if q["kind"].startswith("action keywords")]
+    assert action_queries and {q["query"] for q in action_queries} == {
+        keywords(a) for i in interactions if i["client_id"] in golden for a in i["actions_identified"]}
+    assert keywords("Send 'Market Guide for Managed Edge Services' by Friday.") == "market guide managed edge services"
+    shared = golden_queries([{"id": "c1", "evaluation_metadata": {"is_golden_client": True}}], [
+        {"id": "i1", "client_id": "c1", "summary": "", "actions_identified": ["Schedule a Renewal Prep review"]},
+        {"id": "i2", "client_id": "c2", "summary": "", "actions_identified": ["Renewal prep"]},
+    ], [])
+    assert [(q["kind"], q["relevant"]) for q in shared] == [("action keywords", ["i1", "i2"]),
+                                                            ("action keywords (scoped)", ["i1"])]
+
+    # Items flagged as evaluation targets replace the full library; copies with the same title count
+    flagged = [dict(research[0], evaluation_metadata={"is_target": True})] + research[1:]
+    research_queries = [q for q in golden_queries([], [], flagged) if q["kind"] == "title"]
+    assert len(research_queries) == 1
+    assert set(research_queries[0]["relevant"]) == {r["id"] for r in research if r["title"] == research[0]["title"]}
+
+def test_metrics_and_evaluate():
+    assert recall_at_k(["a", "b", "c"], ["c"], 2) == 0.0 and recall_at_k(["a", "b", "c"], ["c"], 3) == 1.0
+    assert reciprocal_rank(["a", "b"], ["b", "x"]) == 0.5 and reciprocal_rank(["a"], ["b"]) == 0.0
+    # Collapsed duplicates share the rank of their canonical document
+    ranked = ranked_ids({"ids": [["a", "b"]], "metadatas": [[{"aliases": "x,y"}, {}]]})
+    assert ranked == [("a", "x", "y"), ("b",)]
+    assert recall_at_k(ranked, ["y"], 1) == 1.0 and reciprocal_rank(ranked, ["b"]) == 0.5
+
+    queries = [{"collection": "research", "kind": "title", "query": q, "relevant": [q], "client_id": None}
+               for q in ("a", "b", "c", "d")]
+    ranking = ["a", "b", "c"]
+    report = evaluate(lambda query, k: ranking[:k], queries, k=2)
+    assert report["overall"]["queries"] == 4 and report["overall"]["recall"] == 0.5
+    assert report["overall"]["mrr"] == 0.375
+    assert set(report["by_kind"]) == {"research/title"}
+    assert 0 <= report["overall"]["p50_ms"] <= report["overall"]["p95_ms"] <= report["overall"]["p99_ms"]
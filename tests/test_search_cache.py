@@ -0,0 +1,22 @@
+from gss_agent.rag.cache import LRUCache, normalize_query
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 3, "misses": 1, "evictions": 1, "hit_rate": 0.75}
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache(maxsize=4, ttl=0.01)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    import time
+    time.sleep(0.02)
+    assert cache.get("a") is None and len(cache) == 0
+
+def test_normalize_query_collapses_whitespace():
+    assert normalize_query("  agentic   AI\ntrends ") == "agentic AI trends"
@@ -0,0 +1,83 @@
+import json
+from datetime import date
+from gss_agent.data.snapshot import load_snapshot
+from gss_agent.data.sqlite_store import SqliteDataStore, import_json
+
+def test_sqlite_store_matches_in_memory_snapshot(tmp_path):
+    db_path = str(tmp_path / "nexus.db")
+    import_json(db_path=db_path)
+    store = SqliteDataStore(db_path)
+    snapshot = load_snapshot()
+
+    assert store.client_summaries() == snapshot.client_summaries()
+    for client in snapshot.clients:
+        client_id = client["id"]
+        assert store.get_client_by_id(client_id) == snapshot.get_client_by_id(client_id)
+        assert store.get_contract(client_id) == snapshot.get_contract(client_id)
+        assert store.get_associate_info(client_id) == snapshot.get_associate_info(client_id)
+        assert store.get_metrics(client_id) == snapshot.get_metrics(client_id)
+        assert store.get_metric_changes(client_id) == snapshot.get_metric_changes(client_id)
+
+    for query in ["GlobalFin", "cedar helth", "TechNova Solutions", "Metro"]:
+        expected = [(m.client["id"], m.score) for m in snapshot.resolve_client(query)]
+        assert [(m.client["id"], m.score) for m in store.resolve_client(query)] == expected
+
+    for query in ["Cedar Health", "Health", "Acme Bank", "cedar helth", "Industrial Dynamcs Corp"]:
+        assert store.get_client(query) == snapshot.get_client(query)
+
+    window = ("2026-01-01", "2026-12-31")
+    assert store.contracts_ending_between(*window) == snapshot.contracts_ending_between(*window)
+
+def test_sqlite_store_caches_tables_and_matches_registry_rules(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "nexus.db")
+    import_json(db_path=db_path)
+    store = SqliteDataStore(db_path)
+    snapshot = load_snapshot()
+
+    # Whole-table views are parsed once per store
+    assert store.metrics is store.metrics and store.clients is store.clients
+
+    # Ids match exactly, as in ClientRegistry; resolve_client stays case-insensitive
+    client_id = snapshot.clients[0]["id"]
+    assert store.get_client_by_id(client_id.upper()) is None
+    assert snapshot.get_client_by_id(client_id.upper()) is None
+    assert store.resolve_client(client_id.upper())[0].client["id"] == client_id
+
+    # LIKE wildcards in a name are literal
+    assert store.get_client("%") is None and store.get_client("_") is None
+
+    from gss_agent.core import executive_tools
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return cls(2026, 1, 1)
+
+    monkeypatch.setattr(executive_tools, "get_snapshot", lambda: store)
+    monkeypatch.setattr(executive_tools, "date", FixedDate)
+    renewals = json.loads(executive_tools.get_upcoming_renewals.invoke({"days": 365}))["renewals"]
+    assert [r["client_id"] for r in renewals] == [
+        c["client_id"] for c in snapshot.contracts_ending_between("2026-01-01", "2027-01-01")]
+    assert renewals and all(r["client_name"] for r in renewals)
+
+def test_import_json_treats_missing_files_as_empty(tmp_path):
+    import shutil
+    import pytest
+    from gss_agent.data.snapshot import DATASET_FILES
+    from gss_agent.data.sqlite_store import DATA_DIR
+
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for filename in DATASET_FILES.values():
+        if filename != "associate_performance.json":
+            shutil.copy(f"{DATA_DIR}/{filename}", data_dir / filename)
+
+    db_path = str(tmp_path / "nexus.db")
+    import_json(data_dir=str(data_dir), db_path=db_path)
+    store = SqliteDataStore(db_path)
+    client_id = load_snapshot().clients[0]["id"]
+    assert store.get_client_by_id(client_id)["id"] == client_id
+
+    # A file that is present but malformed still aborts the import
+    (data_dir / "contracts.json").write_text("{not json")
+    with pytest.raises(ValueError):
+        import_json(data_dir=str(data_dir), db_path=db_path)
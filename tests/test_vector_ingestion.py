@@ -0,0 +1,528 @@
+import json
+import os
+import zlib
+import numpy as np
+import pytest
+from chromadb import EmbeddingFunction
+from gss_agent.data.snapshot import DATA_DIR
+from gss_agent.rag.bm25 import BM25Index
+from gss_agent.rag.embedding_pipeline import EmbeddingPipeline
+from gss_agent.rag.streaming import StreamingIngestor, append_interactions
+from gss_agent.rag.vector_store import NexusVectorStore, interaction_documents
+
+class CountingEmbedding(EmbeddingFunction):
+    """Deterministic offline embedding that records how many texts it embedded."""
+    def __init__(self):
+        self.embedded = 0
+
+    def __call__(self, input):
+        self.embedded += len(input)
+        return [[float(len(text)), float(sum(map(ord, text[:32]))), 1.0] for text in input]
+
+    @staticmethod
+    def name():
+        return "counting-test-embedding"
+
+    def get_config(self):
+        return {}
+
+    @staticmethod
+    def build_from_config(config):
+        return CountingEmbedding()
+
+class HashingEmbedding(CountingEmbedding):
+    """Bag-of-words embedding: similar texts get similar (unit) vectors."""
+    def __call__(self, input):
+        self.embedded += len(input)
+        vectors = []
+        for text in input:
+            vector = [0.0] * 64
+            for word in text.lower().split():
+                vector[zlib.crc32(word.encode()) % 64] += 1.0
+            norm = sum(v * v for v in vector) ** 0.5 or 1.0
+            vectors.append([v / norm for v in vector])
+        return vectors
+
+    @staticmethod
+    def name():
+        return "hashing-test-embedding"
+
+    @staticmethod
+    def build_from_config(config):
+        return HashingEmbedding()
+
+@pytest.fixture(params=["chroma", "numpy"])
+def backend(request):
+    return request.param
+
+def load_interactions(limit):
+    with open(os.path.join(DATA_DIR, "interactions.json"), "r") as f:
+        return json.load(f)[:limit]
+
+def test_reingestion_only_embeds_deltas(tmp_path, backend):
+    interactions = load_interactions(50)
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions))
+
+    embedding = CountingEmbedding()
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=embedding,
+                             backend=backend)
+    assert store.ingest_interactions(str(source))["added"] == 50
+    assert embedding.embedded == 50
+
+    # Unchanged re-run embeds nothing
+    assert store.ingest_interactions(str(source)) == {"added": 0, "updated": 0, "unchanged": 50, "deleted": 0}
+    assert embedding.embedded == 50
+
+    interactions[0]["summary"] = "Rewritten summary."
+    interactions[1]["sentiment"] = "Positive" if interactions[1]["sentiment"] != "Positive" else "Negative"
+    removed = interactions.pop(2)
+    interactions.append(dict(interactions[3], id="INT-NEW"))
+    source.write_text(json.dumps(interactions))
+
+    stats = store.ingest_interactions(str(source))
+    assert stats == {"added": 1, "updated": 2, "unchanged": 47, "deleted": 1}
+    # Only the re-worded and the new document were embedded; the sentiment change is metadata-only
+    assert embedding.embedded == 52
+
+    stored = store.interaction_collection.get(ids=[interactions[0]["id"], interactions[1]["id"], removed["id"]])
+    assert removed["id"] not in stored["ids"]
+    by_id = dict(zip(stored["ids"], stored["metadatas"]))
+    assert by_id[interactions[1]["id"]]["sentiment"] == interactions[1]["sentiment"]
+    assert "Rewritten summary." in store.interaction_collection.get(ids=[interactions[0]["id"]])["documents"][0]
+    assert store.interaction_collection.count() == 50
+
+def test_pruning_only_removes_documents_of_the_ingested_source(tmp_path, backend):
+    interactions = load_interactions(12)
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions[:10]))
+    supplement = tmp_path / "generated_interactions_llm.json"
+    supplement.write_text(json.dumps(interactions[10:]))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+    store.ingest_interactions(str(source))
+    store.ingest_interactions(str(supplement))
+    store.ingest_interaction_records([dict(interactions[0], id="STREAM-1")])
+
+    source.write_text(json.dumps(interactions[1:10]))
+    assert store.ingest_interactions(str(source))["deleted"] == 1
+    kept = store.interaction_collection.get(ids=[i["id"] for i in interactions[10:]] + ["STREAM-1"])
+    assert len(kept["ids"]) == 3
+    assert {m["source"] for m in kept["metadatas"] if "source" in m} == {"generated_interactions_llm.json"}
+
+def test_parallel_pipeline_matches_inline_embedding(tmp_path, backend):
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(load_interactions(60)))
+
+    progress = []
+    pipeline = EmbeddingPipeline(CountingEmbedding, workers=2, batch_size=16,
+                                 progress=lambda done, total, rate: progress.append((done, total)))
+    parallel = NexusVectorStore(persist_directory=str(tmp_path / "parallel"), embedding_function=CountingEmbedding(),
+                                backend=backend)
+    stats = parallel.ingest_interactions(str(source), pipeline=pipeline)
+    assert stats["added"] == 60
+    assert stats["embedding"]["documents"] == 60 and stats["embedding"]["batches"] == 4
+    assert progress[-1] == (60, 60) and len(progress) == 4
+
+    inline = NexusVectorStore(persist_directory=str(tmp_path / "inline"), embedding_function=CountingEmbedding(),
+                              backend=backend)
+    inline.ingest_interactions(str(source))
+    ids = sorted(i["id"] for i in load_interactions(60))
+    got = parallel.interaction_collection.get(ids=ids, include=["embeddings"])
+    expected = inline.interaction_collection.get(ids=ids, include=["embeddings"])
+    assert dict(zip(got["ids"], map(list, got["embeddings"]))) == dict(zip(expected["ids"], map(list, expected["embeddings"])))
+
+    # A rebuild re-embeds everything even when nothing changed
+    assert parallel.ingest_interactions(str(source), pipeline=pipeline, rebuild=True)["updated"] == 60
+
+def test_search_cache_hits_and_ingest_invalidation(tmp_path, backend):
+    interactions = load_interactions(20)
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions))
+
+    embedding = CountingEmbedding()
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=embedding,
+                             backend=backend)
+    store.ingest_interactions(str(source))
+    client_id = interactions[0]["client_id"]
+
+    first = store.search_interactions("renewal risk", client_id=client_id, n_results=3)
+    embedded = embedding.embedded
+    assert store.search_interactions("renewal  risk ", client_id=client_id, n_results=3) == first
+    # Same query with other filters reuses the embedding but not the result
+    store.search_interactions("renewal risk", n_results=3)
+    assert embedding.embedded == embedded
+    assert store.cache_stats()["results"]["hits"] == 1
+    assert store.cache_stats()["query_embeddings"]["hits"] == 1
+
+    interactions[0]["summary"] = "Escalation about renewal risk."
+    source.write_text(json.dumps(interactions))
+    store.ingest_interactions(str(source))
+    refreshed = store.search_interactions("renewal risk", client_id=client_id, n_results=3)
+    assert refreshed != first
+
+def test_batch_search_matches_single_queries(tmp_path, backend):
+    interactions = load_interactions(40)
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+    store.ingest_interactions(str(source))
+
+    queries = ["renewal risk", "budget cuts", "renewal risk"]
+    client_ids = [None, interactions[0]["client_id"], interactions[1]["client_id"]]
+    groups = store.search_interactions_batch(queries, client_ids=client_ids, n_results=5)
+    assert [(g["query"], g["client_id"]) for g in groups] == list(zip(queries, client_ids))
+
+    listed = [m["id"] for g in groups for m in g["matches"]]
+    assert len(listed) == len(set(listed))
+    store.result_cache.clear()
+    expected = set()
+    for query, client_id in zip(queries, client_ids):
+        expected.update(store.search_interactions(query, client_id=client_id, n_results=5)["ids"][0])
+    assert set(listed) == expected
+
+def test_hybrid_retriever_surfaces_exact_titles(tmp_path, backend):
+    from gss_agent.rag.hybrid import HybridRetriever
+
+    with open(os.path.join(DATA_DIR, "content.json"), "r") as f:
+        research = json.load(f)
+    source = tmp_path / "content.json"
+    source.write_text(json.dumps(research))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+    store.ingest_research(str(source))
+    hybrid = HybridRetriever(store)
+
+    target = research[10]
+    results = hybrid.search_research(target["title"], n_results=3)
+    top_titles = [meta["title"] for meta in results["metadatas"][0]]
+    assert top_titles[0] == target["title"]
+    assert len(results["documents"][0]) == 3 and results["scores"][0] == sorted(results["scores"][0], reverse=True)
+
+    # The lexical index follows ingests
+    research = [r for r in research if r["title"] != target["title"]]
+    source.write_text(json.dumps(research))
+    store.ingest_research(str(source))
+    assert target["title"] not in [m["title"] for m in hybrid.search_research(target["title"])["metadatas"][0]]
+
+def test_transcripts_are_chunked_and_aggregated_per_interaction(tmp_path, backend):
+    from gss_agent.rag.chunking import CHUNK_WORDS, chunk_text
+
+    with open(os.path.join(DATA_DIR, "interactions.json"), "r") as f:
+        transcripts = [i for i in json.load(f) if len(i.get("content", "").split()) > 2 * CHUNK_WORDS][:5]
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(transcripts))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+    stats = store.ingest_interactions(str(source))
+    expected_docs = sum(1 + len(chunk_text(t["content"])) for t in transcripts)
+    assert stats["added"] == expected_docs == store.interaction_collection.count()
+
+    target = transcripts[0]
+    results = store.search_interactions("renewal", client_id=target["client_id"], n_results=2)
+    client_transcripts = {t["id"]: t for t in transcripts if t["client_id"] == target["client_id"]}
+    ids = results["ids"][0]
+    assert ids and len(ids) == len(set(ids)) <= 2 and set(ids) <= set(client_transcripts)
+    assert "chunk_index" not in results["metadatas"][0][0]
+    # Only the best passages come back, not the whole transcript
+    for doc_id, document in zip(ids, results["documents"][0]):
+        assert len(document.split()) < len(client_transcripts[doc_id]["content"].split())
+
+    # Shortening a transcript drops its stale chunks even without pruning
+    original_chunks = len(chunk_text(target["content"]))
+    target["content"] = " ".join(target["content"].split()[:CHUNK_WORDS])
+    source.write_text(json.dumps([target]))
+    stats = store.ingest_interactions(str(source), prune=False)
+    assert stats["deleted"] == original_chunks - 1
+    assert store.interaction_collection.count() == expected_docs - stats["deleted"]
+    assert len(store.interaction_collection.get(where={"parent_id": target["id"]})["ids"]) == 2
+
+def test_metadata_filters_are_pushed_down(tmp_path, backend):
+    from gss_agent.rag.filters import date_to_ts, sentiment_label
+
+    with open(os.path.join(DATA_DIR, "content.json"), "r") as f:
+        research = json.load(f)
+    interactions = load_interactions(100)
+    (tmp_path / "content.json").write_text(json.dumps(research))
+    (tmp_path / "interactions.json").write_text(json.dumps(interactions))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+    store.ingest_research(str(tmp_path / "content.json"))
+    store.ingest_interactions(str(tmp_path / "interactions.json"))
+
+    results = store.search_research("AI strategy", n_results=50, tags=["GenAI"],
+                                    published_after="2025-01-01", published_before="2025-12-31")
+    expected = {r["id"] for r in research if "GenAI" in r["tags"] and r["published_date"].startswith("2025")}
+    assert set(results["ids"][0]) == expected
+
+    since = "2025-12-01"
+    results = store.search_interactions("renewal", n_results=100, sentiment="negative", since=since)
+    expected = {i["id"] for i in interactions
+                if sentiment_label(i["sentiment"]) == "Negative" and date_to_ts(i["date"]) >= date_to_ts(since)}
+    assert expected and set(results["ids"][0]) == expected
+
+def test_sentiment_labels():
+    from gss_agent.rag.filters import sentiment_label
+    assert sentiment_label("Negative") == "Negative"
+    assert sentiment_label("Cautiously Optimistic") == "Positive"
+    assert sentiment_label("Urgent / Stressed") == "Negative"
+    assert sentiment_label("Collaborative but Concerned") == "Mixed"
+    assert sentiment_label("Strategic, Inquisitive, Urgent") == "Neutral"
+
+def test_mmr_diversifies_research_results(tmp_path, backend):
+    from gss_agent.rag.hybrid import HybridRetriever
+
+    with open(os.path.join(DATA_DIR, "content.json"), "r") as f:
+        research = json.load(f)
+    target = research[1]
+    # Three near-identical copies of one report next to the library
+    research += [dict(target, id=f"{target['id']}-copy-{i}") for i in range(3)]
+    source = tmp_path / "content.json"
+    source.write_text(json.dumps(research))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=HashingEmbedding(),
+                             backend=backend)
+    store.ingest_research(str(source))
+
+    for retriever in (store, HybridRetriever(store)):
+        plain = retriever.search_research(target["title"], n_results=4)
+        assert [m["title"] for m in plain["metadatas"][0]].count(target["title"]) >= 3
+        diverse = retriever.search_research(target["title"], n_results=4, mmr_lambda=0.5)
+        titles = [m["title"] for m in diverse["metadatas"][0]]
+        assert len(titles) == 4 and titles[0] == target["title"]
+        assert titles.count(target["title"]) < 3
+        assert "embeddings" not in diverse
+
+def test_index_snapshot_round_trip(tmp_path, backend):
+    from gss_agent.rag.index_snapshot import SnapshotError, open_snapshot, verify_snapshot
+
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    with open(os.path.join(DATA_DIR, "content.json"), "r") as f:
+        research = json.load(f)[:20]
+    (data_dir / "content.json").write_text(json.dumps(research))
+    (data_dir / "interactions.json").write_text(json.dumps(load_interactions(10)))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "store"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+    store.ingest_research(str(data_dir / "content.json"))
+    store.ingest_interactions(str(data_dir / "interactions.json"))
+
+    snapshot = str(tmp_path / "snapshot")
+    manifest = store.export_snapshot(snapshot, data_dir=str(data_dir))
+    assert manifest["collections"]["nexus_research"] == {"count": 20, "dim": 3}
+    assert verify_snapshot(snapshot, data_dir=str(data_dir))[1] == []
+
+    # Served from the snapshot without embedding any document
+    embedding = CountingEmbedding()
+    served = open_snapshot(snapshot, embedding_function=embedding, data_dir=str(data_dir))
+    query = research[3]["title"]
+    assert served.search_research(query)["ids"] == store.search_research(query)["ids"]
+    assert embedding.embedded == 1
+    with pytest.raises(SnapshotError):
+        open_snapshot(snapshot, embedding_function=HashingEmbedding(), data_dir=str(data_dir))
+
+    # Imported into an empty store, also without re-embedding
+    embedding = CountingEmbedding()
+    target = NexusVectorStore(persist_directory=str(tmp_path / "target"), embedding_function=embedding,
+                              backend=backend)
+    assert target.import_snapshot(snapshot, data_dir=str(data_dir))["nexus_research"] == 20
+    assert target.ingest_research(str(data_dir / "content.json"))["unchanged"] == 20
+    assert embedding.embedded == 0
+
+    (data_dir / "content.json").write_text(json.dumps(research[:-1]))
+    assert verify_snapshot(snapshot, data_dir=str(data_dir))[1] == ["content.json"]
+    with open(os.path.join(snapshot, "numpy", "nexus_research", "v1", "records.json"), "a") as f:
+        f.write(" ")
+    with pytest.raises(SnapshotError):
+        verify_snapshot(snapshot)
+
+def test_dedup_indexes_one_document_per_near_duplicate_cluster(tmp_path, backend):
+    with open(os.path.join(DATA_DIR, "content.json"), "r") as f:
+        research = json.load(f)[50:60]
+    target = research[0]
+    copy = dict(target, id=f"{target['id']}-copy", abstract=target["abstract"].replace("The ", "", 1))
+    source = tmp_path / "content.json"
+    source.write_text(json.dumps(research + [copy]))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+
+    plain = store.ingest_research(str(source))
+    assert plain["added"] == 11 and "collapsed" not in plain
+    deduped = store.ingest_research(str(source), prune=False, dedup=True)
+    assert deduped["collapsed"] == 1 and deduped["deleted"] == 1
+    assert store.research_collection.count() == 10
+    kept = store.research_collection.get(ids=[target["id"], copy["id"]])
+    canonical, alias = ((target, copy) if kept["ids"] == [target["id"]] else (copy, target))
+    assert kept["ids"] == [canonical["id"]] and kept["metadatas"][0]["aliases"] == alias["id"]
+
+    interactions = load_interactions(4)
+    twin = dict(interactions[0], id="twin-same-client")
+    other_client = dict(interactions[0], id="twin-other-client", client_id="c_someone_else")
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions + [twin, other_client]))
+    stats = store.ingest_interactions(str(source), dedup=True)
+    assert stats["collapsed"] == 1
+    parents = {m["parent_id"] for m in store.interaction_collection.get(include=["metadatas"])["metadatas"]}
+    assert "twin-other-client" in parents and len(parents) == 5
+
+def test_streaming_ingestor_indexes_appended_interactions(tmp_path, backend):
+    interactions = load_interactions(30)
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions[:20]))
+    embedding = HashingEmbedding()
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=embedding,
+                             backend=backend)
+    store.ingest_interactions(str(source))
+    intake = str(tmp_path / "interactions_intake.jsonl")
+    ingestor = StreamingIngestor(store, path=intake, batch_size=4, max_wait=60)
+
+    append_interactions(interactions[20:29], intake)
+    with open(intake, "a") as f:
+        f.write("not json\n" + json.dumps(interactions[29])[:40])
+    embedded = embedding.embedded
+    # Two full batches go in, the ninth record waits for max_wait and the partial line for its newline
+    assert ingestor.poll() == 8
+    stats = ingestor.stats()
+    assert stats["batches"] == 2 and stats["pending_records"] == 1 and stats["errors"] == 1
+    assert stats["backlog_bytes"] == 40 and stats["lag_ms"]["p95"] >= 0
+    assert store.interaction_collection.get(ids=[interactions[27]["id"]])["ids"] == [interactions[27]["id"]]
+    # Appends are not pruning runs: the batch-ingested interactions are untouched and not re-embedded
+    assert store.interaction_collection.get(ids=[interactions[0]["id"]])["ids"] == [interactions[0]["id"]]
+    assert embedding.embedded - embedded == sum(len(d) for d in map(interaction_documents, interactions[20:28]))
+
+    target = interactions[28]
+    result = store.search_interactions(target["summary"], client_id=target["client_id"], n_results=1)
+    assert target["id"] not in result["ids"][0]
+    ingestor.flush(force=True)
+    result = store.search_interactions(target["summary"], client_id=target["client_id"], n_results=1)
+    assert result["ids"][0] == [target["id"]]
+
+    # The rest of the partial line arrives; a restarted ingestor resumes from the saved offset
+    with open(intake, "a") as f:
+        f.write(json.dumps(interactions[29])[40:] + "\n")
+    resumed = StreamingIngestor(store, path=intake, batch_size=4, max_wait=0)
+    assert resumed.poll() == 1 and resumed.stats()["backlog_bytes"] == 0
+    assert store.interaction_collection.get(ids=[interactions[29]["id"]])["ids"] == [interactions[29]["id"]]
+
+    # Streamed interactions only live in the index, so a batch refresh of interactions.json must keep them
+    streamed = [i["id"] for i in interactions[20:30]]
+    assert store.ingest_interactions(str(source))["deleted"] == 0
+    assert len(store.interaction_collection.get(ids=streamed)["ids"]) == 10
+
+def test_pipeline_follows_the_store_embedding_and_reuses_its_pool(tmp_path, backend):
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(load_interactions(30)))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=HashingEmbedding(),
+                             backend=backend)
+
+    with EmbeddingPipeline(CountingEmbedding, workers=2, batch_size=16) as mismatched:
+        with pytest.raises(ValueError):
+            store.ingest_interactions(str(source), pipeline=mismatched)
+
+    with EmbeddingPipeline(workers=2, batch_size=16) as pipeline:
+        store.ingest_interactions(str(source), pipeline=pipeline)
+        pool = pipeline._pool
+        store.ingest_interactions(str(source), pipeline=pipeline, rebuild=True)
+        assert pipeline._pool is pool
+    assert pipeline._pool is None
+
+    ids = [i["id"] for i in load_interactions(30)]
+    stored = store.interaction_collection.get(ids=ids, include=["documents", "embeddings"])
+    expected = HashingEmbedding()(stored["documents"])
+    assert np.allclose(np.asarray(stored["embeddings"]), np.asarray(expected))
+
+def test_hybrid_index_sees_ingests_by_another_store(tmp_path):
+    from gss_agent.rag.hybrid import HybridRetriever
+
+    with open(os.path.join(DATA_DIR, "content.json"), "r") as f:
+        research = json.load(f)[:20]
+    source = tmp_path / "content.json"
+    source.write_text(json.dumps(research))
+    persist = str(tmp_path / "chroma")
+    reader = NexusVectorStore(persist_directory=persist, embedding_function=HashingEmbedding())
+    reader.ingest_research(str(source))
+    hybrid = HybridRetriever(reader)
+    assert hybrid.search_research("Zanzibar telemetry", n_results=1)["metadatas"][0][0]["title"] != "Zanzibar Telemetry"
+
+    # Same persist directory, as an ingest run in another process would use
+    writer = NexusVectorStore(persist_directory=persist, embedding_function=HashingEmbedding())
+    research[0] = dict(research[0], title="Zanzibar Telemetry")
+    source.write_text(json.dumps(research))
+    writer.ingest_research(str(source))
+    assert hybrid.search_research("Zanzibar telemetry", n_results=1)["metadatas"][0][0]["title"] == "Zanzibar Telemetry"
+
+def test_hybrid_index_applies_own_writes_incrementally(tmp_path, backend):
+    from gss_agent.rag.hybrid import HybridRetriever
+
+    interactions = load_interactions(30)
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions[:20]))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=HashingEmbedding(),
+                             backend=backend)
+    store.ingest_interactions(str(source))
+    hybrid = HybridRetriever(store)
+    hybrid.search_interactions("renewal risk")
+    index = hybrid._indexes[store.interaction_collection.name][1]
+
+    # A streamed batch and a pruning refresh are applied to the same BM25 index
+    store.ingest_interaction_records(interactions[20:], source="interactions_intake.jsonl")
+    source.write_text(json.dumps(interactions[1:20]))
+    store.ingest_interactions(str(source))
+    hybrid.search_interactions("renewal risk")
+    version, updated, documents = hybrid._indexes[store.interaction_collection.name]
+    assert updated is index and version == store.collection_version(store.interaction_collection)
+
+    stored = store.interaction_collection.get(include=["documents"])
+    assert set(documents) == set(stored["ids"]) and len(updated) == len(stored["ids"])
+    fresh = BM25Index.build(stored["ids"], stored["documents"])
+    for query in ("renewal risk", interactions[25]["summary"], interactions[0]["summary"]):
+        assert dict(updated.search(query, top_k=50)) == pytest.approx(dict(fresh.search(query, top_k=50)))
+
+def test_batch_searches_rank_like_single_queries(tmp_path, backend):
+    from gss_agent.rag.hybrid import HybridRetriever
+
+    interactions = load_interactions(40)
+    (tmp_path / "interactions.json").write_text(json.dumps(interactions))
+    with open(os.path.join(DATA_DIR, "content.json"), "r") as f:
+        (tmp_path / "content.json").write_text(json.dumps(json.load(f)[:60]))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=HashingEmbedding(),
+                             backend=backend)
+    store.ingest_interactions(str(tmp_path / "interactions.json"))
+    store.ingest_research(str(tmp_path / "content.json"))
+
+    queries = ["cloud security strategy", "generative AI hype cycle"]
+    client_ids = [None, interactions[0]["client_id"]]
+    for retriever in (store, HybridRetriever(store)):
+        for mmr_lambda in (None, 0.5):
+            groups = retriever.search_research_batch(queries, n_results=3, mmr_lambda=mmr_lambda)
+            singles = [retriever.search_research(q, n_results=3, mmr_lambda=mmr_lambda)["ids"][0] for q in queries]
+            for group, ids in zip(groups, singles):
+                # Deduplication only drops ids; the rest keep the single-query order
+                assert [m["id"] for m in group["matches"]] == [i for i in ids if i in {m["id"] for m in group["matches"]}]
+            assert {m["id"] for g in groups for m in g["matches"]} == set(singles[0]) | set(singles[1])
+
+        groups = retriever.search_interactions_batch(queries, client_ids=client_ids, n_results=3)
+        singles = [retriever.search_interactions(q, client_id=c, n_results=3)["ids"][0]
+                   for q, c in zip(queries, client_ids)]
+        assert {m["id"] for g in groups for m in g["matches"]} == set(singles[0]) | set(singles[1])
+
+def test_pruning_removes_legacy_documents_without_source(tmp_path, backend):
+    interactions = load_interactions(5)
+    source = tmp_path / "interactions.json"
+    source.write_text(json.dumps(interactions[1:]))
+    store = NexusVectorStore(persist_directory=str(tmp_path / "chroma"), embedding_function=CountingEmbedding(),
+                             backend=backend)
+    # Documents as the original ingest_interactions wrote them: no hashes, parent_id or source
+    store.interaction_collection.upsert(
+        ids=[i["id"] for i in interactions],
+        documents=[i["summary"] for i in interactions],
+        metadatas=[{"id": i["id"], "client_id": i["client_id"], "client_name": i["client_name"],
+                    "sentiment": i["sentiment"]} for i in interactions])
+    store.ingest_interaction_records([dict(interactions[0], id="STREAM-1")])
+
+    stats = store.ingest_interactions(str(source))
+    assert stats["deleted"] == 1 and stats["updated"] == 4
+    stored = store.interaction_collection.get(ids=[i["id"] for i in interactions] + ["STREAM-1"])
+    assert sorted(stored["ids"]) == sorted([i["id"] for i in interactions[1:]] + ["STREAM-1"])
+    by_id = dict(zip(stored["ids"], stored["metadatas"]))
+    assert all(by_id[i["id"]]["source"] == "interactions.json" for i in interactions[1:])